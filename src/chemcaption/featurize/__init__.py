@@ -1,19 +1,37 @@
 # -*- coding: utf-8 -*-
 
-"""Implementations for`featurize` submodule."""
-
-from .adaptor import *
-from .base import *
-from .bonds import *
-from .comparator import *
-from .composition import *
-from .electronicity import *
-from .miscellaneous import *
-from .reaction import *
-from .rules import *
-from .spatial import *
-from .stereochemistry import *
-from .substructure import *
-from .symmetry import *
-from .text import *
-from .text_utils import *
+"""Implementations for`featurize` submodule.
+
+Submodules and their public names are imported lazily (PEP 562), on first attribute access, so
+importing a single featurizer does not pull in the dependencies of all others.
+"""
+
+import importlib
+from typing import Any, List
+
+# Public names of each submodule, generated from the submodule's `__all__` (see `_exports`).
+from ._export_table import SUBMODULE_EXPORTS as _SUBMODULE_EXPORTS
+
+_EXPORTS = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules and public names of submodules on first access."""
+    if name not in _EXPORTS:
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+
+    value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Return public names, including those not imported yet."""
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULE_EXPORTS))
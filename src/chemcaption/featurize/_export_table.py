@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+"""Public names of each `chemcaption.featurize` submodule, as listed in the submodule's `__all__`.
+
+Generated by `python -m chemcaption.featurize._exports`. Do not edit.
+"""
+
+SUBMODULE_EXPORTS = {
+    "adaptor": (
+        "RDKitAdaptor",
+        "ValenceElectronCountAdaptor",
+    ),
+    "base": (
+        "AbstractFeaturizer",
+        "MorfeusFeaturizer",
+        "AbstractComparator",
+        "MultipleFeaturizer",
+        "Comparator",
+        "MultipleComparator",
+        "PERIODIC_TABLE",
+    ),
+    "bonds": (
+        "_MAP_BOND_TYPE_TO_CLEAN_NAME",
+        "RotableBondCountFeaturizer",
+        "RotableBondProportionFeaturizer",
+        "BondTypeCountFeaturizer",
+        "BondTypeProportionFeaturizer",
+        "DipoleMomentsFeaturizer",
+        "BondOrderFeaturizer",
+    ),
+    "cache": (
+        "DiskCache",
+        "cache_key",
+        "geometry_key",
+        "get_conformer_cache",
+        "set_conformer_cache",
+        "get_xtb_cache",
+        "set_xtb_cache",
+        "XTBSession",
+        "get_xtb_session",
+        "get_sasa",
+        "ResultCache",
+        "get_result_cache",
+        "set_result_cache",
+    ),
+    "comparator": (
+        "ValenceElectronCountComparator",
+        "LipinskiFilterComparator",
+        "GhoseFilterComparator",
+        "LeadLikenessFilterComparator",
+        "AtomCountComparator",
+        "IsomerismComparator",
+        "IsomorphismComparator",
+        "IsoelectronicComparator",
+        "DrugLikenessComparator",
+    ),
+    "composition": (
+        "MolecularFormulaFeaturizer",
+        "MolecularMassFeaturizer",
+        "MonoisotopicMolecularMassFeaturizer",
+        "ElementMassFeaturizer",
+        "ElementMassProportionFeaturizer",
+        "ElementCountFeaturizer",
+        "ElementCountProportionFeaturizer",
+        "AtomCountFeaturizer",
+        "DegreeOfUnsaturationFeaturizer",
+    ),
+    "conformers": (
+        "FALLBACK_KWARGS",
+        "ConformerFailure",
+        "ConformerBatch",
+        "ConformerService",
+        "get_conformer_service",
+        "set_conformer_service",
+    ),
+    "electronicity": (
+        "HydrogenAcceptorCountFeaturizer",
+        "HydrogenDonorCountFeaturizer",
+        "ValenceElectronCountFeaturizer",
+        "ElectronAffinityFeaturizer",
+        "HOMOEnergyFeaturizer",
+        "LUMOEnergyFeaturizer",
+        "AtomChargeFeaturizer",
+        "AtomNucleophilicityFeaturizer",
+        "AtomElectrophilicityFeaturizer",
+        "MoleculeNucleophilicityFeaturizer",
+        "MoleculeElectrophilicityFeaturizer",
+        "MoleculeNucleofugalityFeaturizer",
+        "MoleculeElectrofugalityFeaturizer",
+    ),
+    "execution": (
+        "ExecutionBackend",
+        "get_default_backend",
+        "set_default_backend",
+    ),
+    "miscellaneous": (
+        "SVGFeaturizer",
+    ),
+    "ragged": (
+        "RaggedFeatures",
+    ),
+    "reaction": (
+        "SolventAccessibleSurfaceAreaFeaturizer",
+        "SolventAccessibleVolumeFeaturizer",
+        "SolventAccessibleAtomAreaFeaturizer",
+    ),
+    "rules": (
+        "LipinskiFilterFeaturizer",
+        "GhoseFilterFeaturizer",
+        "LeadLikenessFilterFeaturizer",
+    ),
+    "schema": (
+        "FeatureSchema",
+    ),
+    "shape": (
+        "CONFORMER_AGGREGATIONS",
+        "conformer_coordinates",
+        "conformer_energies",
+        "boltzmann_weights",
+        "segment_principal_moments",
+        "principal_moments",
+        "shape_descriptors",
+        "aggregate_segments",
+        "aggregate_conformers",
+    ),
+    "spatial": (
+        "SpatialFeaturizer",
+        "EccentricityFeaturizer",
+        "AsphericityFeaturizer",
+        "InertialShapeFactorFeaturizer",
+        "NPRFeaturizer",
+        "PMIFeaturizer",
+        "AtomVolumeFeaturizer",
+        "SpherocityIndexFeaturizer",
+        "RadiusOfGyrationFeaturizer",
+    ),
+    "stereochemistry": (
+        "ChiralCenterCountFeaturizer",
+    ),
+    "streaming": (
+        "iter_data",
+        "write_data",
+        "read_data",
+        "update_data",
+    ),
+    "substructure": (
+        "FragmentSearchFeaturizer",
+        "IsomorphismFeaturizer",
+        "TopologyCountFeaturizer",
+    ),
+    "symmetry": (
+        "RotationalSymmetryNumberFeaturizer",
+        "PointGroupFeaturizer",
+    ),
+    "text": (
+        "Prompt",
+        "PromptCollection",
+    ),
+    "text_utils": (
+        "TEXT_TEMPLATES",
+        "QA_TEMPLATES",
+        "generate_template",
+        "inspect_template",
+        "inspect_info",
+        "generate_info",
+    ),
+}
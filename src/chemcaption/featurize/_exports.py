@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""Generate the lazy export table of `chemcaption.featurize` from the `__all__` of each submodule.
+
+The table is checked in as `_export_table.py`, so that importing `chemcaption.featurize` does not
+import any submodule. Regenerate it after changing the `__all__` of a submodule with
+
+    python -m chemcaption.featurize._exports
+
+`tests/test_import_time.py` fails while the checked-in table is out of date.
+"""
+
+import importlib
+import os
+from typing import Dict, Tuple
+
+__all__ = [
+    "EXPORTED_SUBMODULES",  # Submodules whose public names are exported by the package.
+    "generate_exports",  # Helper function
+    "render_exports",  # Helper function
+    "write_exports",  # Helper function
+]
+
+"""Submodules whose public names are exported by `chemcaption.featurize`."""
+
+EXPORTED_SUBMODULES = (
+    "adaptor",
+    "base",
+    "bonds",
+    "cache",
+    "comparator",
+    "composition",
+    "conformers",
+    "electronicity",
+    "execution",
+    "miscellaneous",
+    "ragged",
+    "reaction",
+    "rules",
+    "schema",
+    "shape",
+    "spatial",
+    "stereochemistry",
+    "streaming",
+    "substructure",
+    "symmetry",
+    "text",
+    "text_utils",
+)
+
+_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_export_table.py")
+
+_HEADER = '''# -*- coding: utf-8 -*-
+
+"""Public names of each `chemcaption.featurize` submodule, as listed in the submodule's `__all__`.
+
+Generated by `python -m chemcaption.featurize._exports`. Do not edit.
+"""
+
+'''
+
+
+def generate_exports() -> Dict[str, Tuple[str, ...]]:
+    """Collect the `__all__` of every exported submodule.
+
+    Args:
+        None.
+
+    Returns:
+        Dict[str, Tuple[str, ...]]: Mapping of submodule name to public names.
+    """
+    return {
+        name: tuple(importlib.import_module(f"chemcaption.featurize.{name}").__all__)
+        for name in EXPORTED_SUBMODULES
+    }
+
+
+def render_exports(exports: Dict[str, Tuple[str, ...]]) -> str:
+    """Render the source of the export table.
+
+    Args:
+        exports (Dict[str, Tuple[str, ...]]): Mapping of submodule name to public names.
+
+    Returns:
+        str: Source of `_export_table.py`.
+    """
+    lines = ["SUBMODULE_EXPORTS = {"]
+    for module, names in exports.items():
+        lines.append(f'    "{module}": (')
+        lines.extend(f'        "{name}",' for name in names)
+        lines.append("    ),")
+    lines.append("}")
+
+    return _HEADER + "\n".join(lines) + "\n"
+
+
+def write_exports() -> str:
+    """Regenerate the checked-in export table.
+
+    Args:
+        None.
+
+    Returns:
+        str: Path to export table.
+    """
+    with open(_TABLE_PATH, "w") as file:
+        file.write(render_exports(generate_exports()))
+
+    return _TABLE_PATH
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_exports()}")  # noqa:T201
@@ -24,6 +24,8 @@ __all__ = [
 class RDKitAdaptor(AbstractFeaturizer):
     """Higher-level featurizer. Returns specific, lower-level featurizers."""
 
+    cost = "cheap"
+
     def __init__(
         self, rdkit_function: Callable, labels: List[str], **rdkit_function_kwargs: Dict[str, Any]
     ):
@@ -40,6 +42,17 @@ class RDKitAdaptor(AbstractFeaturizer):
         self._label = labels
         self.rdkit_function_kwargs = rdkit_function_kwargs
 
+    def _featurize_values(self, molecule: Molecule) -> Any:
+        """Return the raw output of `rdkit_function` for a molecule instance.
+
+        Args:
+            molecule (Molecule): Molecule representation.
+
+        Returns:
+            Any: Feature value(s) extracted from `molecule`.
+        """
+        return self.rdkit_function(molecule.rdkit_mol, **self.rdkit_function_kwargs)
+
     def featurize(
         self,
         molecule: Molecule,
@@ -57,7 +70,7 @@ class RDKitAdaptor(AbstractFeaturizer):
         Returns:
             np.array: Array containing extracted features.
         """
-        feature = self.rdkit_function(molecule.rdkit_mol, **self.rdkit_function_kwargs)
+        feature = self._featurize_values(molecule)
         feature = (
             [
                 feature,
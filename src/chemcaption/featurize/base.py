@@ -2,20 +2,45 @@
 
 """Abstract base class and wrappers for featurizers."""
 
+import copy
 from abc import ABC, abstractmethod
-from concurrent.futures import ProcessPoolExecutor
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from functools import reduce
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import numpy as np
-import pandas as pd
 import rdkit
 from frozendict import frozendict
 from rdkit import Chem
-from scipy.spatial import distance_matrix
 
+from chemcaption.featurize.cache import (
+    XTBSession,
+    cache_key,
+    get_result_cache,
+    get_sasa,
+    get_xtb_session,
+)
+from chemcaption.featurize.execution import ExecutionBackend, get_default_backend
+from chemcaption.featurize.ragged import RaggedFeatures
+from chemcaption.featurize.schema import FeatureSchema
 from chemcaption.featurize.text import Prompt, PromptCollection
 from chemcaption.featurize.utils import cached_conformer
-from chemcaption.molecules import Molecule
+from chemcaption.molecules import Molecule, SMILESMolecule
+from chemcaption.version import VERSION
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Implemented abstract and high-level classes
 
@@ -31,10 +56,35 @@ __all__ = [
 
 PERIODIC_TABLE = rdkit.Chem.GetPeriodicTable()  # Periodic table
 
+COST_CLASSES = ("cheap", "moderate", "expensive")  # Featurization cost classes, in increasing order
+
+_METADATA_COLUMNS = ["representation_system", "representation_string"]  # Molecule identity columns
+
+# Instance attributes which only affect text generation, left out of featurizer fingerprints.
+_TEXT_ATTRIBUTES = (
+    "prompt_template",
+    "completion_template",
+    "_names",
+    "constraint",
+    "execution_backend",
+    "label",
+)
+
 
 class AbstractFeaturizer(ABC):
     """Abstract base class for lower level Featurizers."""
 
+    # Registry metadata: relative cost of featurization and backends needed beyond RDKit.
+    # Only trivially cheap featurizers opt into `cheap`, i.e., in-process batch featurization.
+    cost: str = "moderate"
+    backends: Tuple[str, ...] = ()
+
+    # Output metadata: numeric features can be written into preallocated float buffers.
+    numeric: bool = True
+
+    # Instance attributes derived from others (e.g., compiled patterns), left out of `fingerprint`.
+    _derived_attributes: Tuple[str, ...] = ()
+
     def __init__(self):
         """Initialize class. Initialize periodic table."""
         self.prompt_template = (
@@ -44,6 +94,7 @@ class AbstractFeaturizer(ABC):
         self.completion_template = "Answer: {COMPLETION}"
         self._names = []
         self.constraint = None
+        self.execution_backend: Optional[ExecutionBackend] = None
 
     @property
     def get_names(self) -> List[Dict[str, str]]:
@@ -62,21 +113,174 @@ class AbstractFeaturizer(ABC):
         """Featurize single Molecule instance."""
         raise NotImplementedError
 
-    def featurize_many(self, molecules: List[Molecule]) -> np.array:
+    def featurize_many(self, molecules: List[Molecule], deduplicate: bool = False) -> np.array:
         """
         Featurize a sequence of Molecule objects.
 
         Args:
             molecules (Sequence[Molecule]):
                 A sequence of molecule representations.
+            deduplicate (bool): Featurize each unique structure (by canonical SMILES) once and scatter
+                the results back to the input order. Defaults to `False`.
 
         Returns:
             np.array: An array of features for each molecule instance.
         """
-        with ProcessPoolExecutor() as executor:
-            results = list(executor.map(self.featurize, molecules))
+        molecules = list(molecules)
+
+        if deduplicate:
+            unique, inverse = _deduplicate(molecules)
+            return self.featurize_many(molecules=unique)[inverse]
+
+        self.prepare(molecules)
+
+        def compute(featurizers: List[AbstractFeaturizer], missing: List[Molecule]):
+            return [self.get_backend().featurize_many(self, missing)]
+
+        return _featurize_cached([self], molecules, compute)[0]
+
+    def _featurize_values(self, molecule: Molecule) -> Union[float, Sequence[float], np.array]:
+        """Return the raw feature value(s) for a molecule instance.
+
+        Used to fill batch outputs without a per-molecule array. Defaults to the output of `featurize`.
+
+        Args:
+            molecule (Molecule): Molecule representation.
+
+        Returns:
+            Union[float, Sequence[float], np.array]: Feature value(s) extracted from `molecule`.
+        """
+        return self.featurize(molecule)
+
+    def featurize_into(self, molecule: Molecule, out: np.array) -> np.dtype:
+        """Featurize single Molecule instance, writing the features into a caller-provided row.
+
+        Args:
+            molecule (Molecule): Molecule representation.
+            out (np.array): Output row of shape `(N,)` or `(1, N)`, where `N` is the number of
+                features, i.e., `len(self.feature_labels)`.
+
+        Returns:
+            np.dtype: Data type of the features, e.g., to restore integer outputs from a float buffer.
+        """
+        values = np.asarray(self._featurize_values(molecule))
+        out[...] = values.reshape(out.shape)
+        return values.dtype
+
+    def featurize_blocks(self, molecules: List[Molecule]) -> List[np.array]:
+        """Featurize a sequence of Molecule objects in-process.
+
+        Returns one feature block per lower-level featurizer. Used by execution backends.
+        Numeric features are written row by row into one preallocated array.
+
+        Args:
+            molecules (List[Molecule]): A sequence of molecule representations.
+
+        Returns:
+            List[np.array]: List containing a single array of features for each molecule instance.
+        """
+        molecules = list(molecules)
+        if not self.numeric:
+            return [np.concatenate([self.featurize(molecule) for molecule in molecules])]
+
+        self.prepare(molecules)
+
+        features = np.empty((len(molecules), len(self.feature_labels)))
+        dtypes = {self.featurize_into(molecule, row) for molecule, row in zip(molecules, features)}
+
+        return [_restore_dtype(features, dtypes)]
+
+    def prepare(self, molecules: List[Molecule]):
+        """Fit data-dependent state (e.g., output widths) ahead of batch featurization.
+
+        Fits a feature schema in a single pass over `molecules` if the featurizer requires one.
+
+        Args:
+            molecules (List[Molecule]): A sequence of molecule representations.
+
+        Returns:
+            self: Instance of self.
+        """
+        if self.requires_schema:
+            self.apply_schema(FeatureSchema.fit(molecules))
+
+        return self
+
+    @property
+    def requires_schema(self) -> bool:
+        """Return whether output widths still have to be fixed by a feature schema.
+
+        Args:
+            None.
+
+        Returns:
+            bool: Whether the featurizer requires a feature schema.
+        """
+        return False
+
+    def apply_schema(self, schema: FeatureSchema):
+        """Fix data-dependent output widths from a feature schema. Widths already set are kept.
+
+        Args:
+            schema (FeatureSchema): Dataset-level feature schema.
+
+        Returns:
+            self: Instance of self.
+        """
+        return self
+
+    def _fitted_on(self, molecule: Molecule):
+        """Return featurizer whose output widths are set, fitting missing widths on one molecule.
+
+        Single-molecule calls featurize with the returned featurizer, so that only `prepare` and
+        `apply_schema` fix output widths on the instance.
+
+        Args:
+            molecule (Molecule): Molecule representation.
+
+        Returns:
+            AbstractFeaturizer: `self` if no output width is missing, else a fitted shallow copy.
+        """
+        if not self.requires_schema:
+            return self
+        return copy.copy(self).prepare([molecule])
+
+    def get_backend(self) -> ExecutionBackend:
+        """Return execution backend used for batch featurization.
+
+        Args:
+            None.
+
+        Returns:
+            ExecutionBackend: Backend set on this instance, else the shared default backend for the
+                cost class of this featurizer.
+        """
+        return self.execution_backend or get_default_backend(cost=self.cost)
+
+    def fingerprint(self) -> Optional[str]:
+        """Return stable identifier of featurizer class, configuration and package version.
+
+        Used to key cached results. Call after `prepare`, since fitted output widths are part of
+        the configuration.
+
+        Args:
+            None.
 
-        return np.concatenate(results)
+        Returns:
+            Optional[str]: Hexadecimal SHA-1 digest, or `None` if some attribute has no stable
+                representation (e.g., a lambda), in which case results are not cached.
+        """
+        excluded = set(_TEXT_ATTRIBUTES + self._derived_attributes)
+        try:
+            parameters = {
+                name: _stable_value(value)
+                for name, value in vars(self).items()
+                if name not in excluded
+            }
+        except TypeError:
+            return None
+
+        return cache_key(type(self).__module__, type(self).__qualname__, VERSION, parameters)
 
     def text_featurize(
         self,
@@ -93,6 +297,9 @@ class AbstractFeaturizer(ABC):
         Returns:
             Prompt: Instance of Prompt containing relevant information extracted from `molecule`.
         """
+        if self.requires_schema:
+            return self._fitted_on(molecule).text_featurize(molecule=molecule, pos_key=pos_key)
+
         completion = self.featurize(molecule=molecule)
         dtype = completion.dtype
 
@@ -163,6 +370,8 @@ class AbstractFeaturizer(ABC):
         Returns:
             Dict[str, float]: Dict containing the featurizer labels and corresponding values.
         """
+        if self.requires_schema:
+            return self._fitted_on(molecule).labeled_featurize(molecule)
 
         results = self.featurize(molecule)
 
@@ -212,6 +421,12 @@ class AbstractFeaturizer(ABC):
 class MorfeusFeaturizer(AbstractFeaturizer):
     """Abstract featurizer for morfeus-generated features."""
 
+    cost = "expensive"
+    backends = ("givemeconformer", "morfeus", "xtb")
+
+    # Feature schema field fixing `max_index` for per-atom or per-bond features, if any.
+    schema_field: Optional[str] = None
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -331,6 +546,32 @@ class MorfeusFeaturizer(AbstractFeaturizer):
 
         return atom_indices, as_range
 
+    @property
+    def requires_schema(self) -> bool:
+        """Return whether `max_index` still has to be fixed by a feature schema.
+
+        Args:
+            None.
+
+        Returns:
+            bool: Whether the featurizer requires a feature schema.
+        """
+        return self.schema_field is not None and getattr(self, "max_index", None) is None
+
+    def apply_schema(self, schema: FeatureSchema):
+        """Fix `max_index` from a feature schema, unless already set.
+
+        Args:
+            schema (FeatureSchema): Dataset-level feature schema.
+
+        Returns:
+            self: Instance of self.
+        """
+        if self.requires_schema:
+            self.max_index = getattr(schema, self.schema_field)
+
+        return self
+
     def fit_on_bond_counts(self, molecules: Union[List[Molecule], Molecule]) -> int:
         """Fit instance on molecule collection.
 
@@ -340,10 +581,8 @@ class MorfeusFeaturizer(AbstractFeaturizer):
         Returns:
             int: Maximum number of bonds in any molecule passed in to featurizer.
         """
-
         mols = [molecules] if not isinstance(molecules, list) else molecules
-        bond_counts = [self._count_bonds(molecule=molecule) for molecule in mols]
-        return max(bond_counts)
+        return FeatureSchema.fit(mols).max_bonds
 
     @staticmethod
     def fit_on_atom_counts(molecules: Union[List[Molecule], Molecule]) -> int:
@@ -356,8 +595,7 @@ class MorfeusFeaturizer(AbstractFeaturizer):
             int: Maximum number of atoms in any molecule passed in to featurizer.
         """
         mols = [molecules] if not isinstance(molecules, list) else molecules
-        atom_counts = [molecule.reveal_hydrogens().GetNumAtoms() for molecule in mols]
-        return max(atom_counts)
+        return FeatureSchema.fit(mols).max_atoms
 
     @staticmethod
     def _count_bonds(molecule: Molecule) -> int:
@@ -398,7 +636,7 @@ class MorfeusFeaturizer(AbstractFeaturizer):
             morpheus_instance (str): Type of morfeus instance. Can take on either `xtb` or `sasa`. Defaults to `xtb`.
 
         Returns:
-            Union[SASA, XTB]: Appropriate morfeus instance.
+            Union[SASA, XTBSession]: Appropriate morfeus instance.
         """
         if morpheus_instance.lower() not in ["xtb", "sasa"]:
             raise Exception(
@@ -411,20 +649,21 @@ class MorfeusFeaturizer(AbstractFeaturizer):
             else self._get_xtb_instance(molecule)
         )
 
-    def _get_xtb_instance(self, molecule: Molecule):
+    def _get_xtb_instance(self, molecule: Molecule) -> XTBSession:
         """Return appropriate morfeus instance for feature generation.
 
+        The instance is shared by all featurizers working on the same geometry, so each xTB
+        calculation runs once per molecule.
+
         Args:
             molecule (Molecule): Molecular instance.
 
         Returns:
-            XTB: Appropriate morfeus XTB instance.
+            XTBSession: Memoized morfeus XTB instance.
         """
         elements, coordinates = self._get_element_coordinates(molecule)
 
-        from morfeus import XTB
-
-        return XTB(elements, coordinates, "1")
+        return get_xtb_session(elements, coordinates, method="1")
 
     def _get_sasa_instance(self, molecule: Molecule):
         """Return appropriate morfeus instance for feature generation.
@@ -433,13 +672,12 @@ class MorfeusFeaturizer(AbstractFeaturizer):
             molecule (Molecule): Molecular instance.
 
         Returns:
-            SASA: Appropriate morfeus SASA instance.
+            SASA: Appropriate morfeus SASA instance. Shared by all featurizers working on the
+                same geometry with the same `morfeus_kwargs`.
         """
-        from morfeus import SASA
-
         elements, coordinates = self._get_element_coordinates(molecule)
 
-        return SASA(elements, coordinates, **self.morfeus_kwargs)
+        return get_sasa(elements, coordinates, **self.morfeus_kwargs)
 
     @staticmethod
     def _optimize_molecule_geometry(
@@ -539,7 +777,7 @@ class MorfeusFeaturizer(AbstractFeaturizer):
             molecule.rdkit_mol = conformer_ensemble.mol
         except Exception:
             print("Wholescale conformer embedding failed. Embedding conformers individually...\n")
-            molecule.rdkit_mol = molecule.reveal_hydrogens()
+            molecule.rdkit_mol = Chem.Mol(molecule.reveal_hydrogens())
 
             num_embedded = 0
             conformers = list(conformer_ensemble.mol.GetConformers())
@@ -556,6 +794,83 @@ class MorfeusFeaturizer(AbstractFeaturizer):
 
         return molecule
 
+    def featurize_atoms(self, molecule: Molecule) -> Tuple[np.array, np.array]:
+        """Featurize single molecule instance atom by atom, without padding or aggregation.
+
+        Implemented by per-atom featurizers.
+
+        Args:
+            molecule (Molecule): Molecule representation.
+
+        Returns:
+            Tuple[np.array, np.array]: Per-atom feature values and atomic numbers, ordered by atom
+                index.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not extract per-atom features.")
+
+    def featurize_ragged(self, molecules: List[Molecule]) -> RaggedFeatures:
+        """Featurize a sequence of Molecule objects atom by atom into a compact (CSR) layout.
+
+        Unlike `featurize_many`, molecules are not padded to `max_index` atoms.
+
+        Args:
+            molecules (List[Molecule]): A sequence of molecule representations.
+
+        Returns:
+            RaggedFeatures: Atom-level features. Convert to the padded layout with `to_padded`.
+        """
+        return RaggedFeatures.from_rows(self.get_backend().map(self.featurize_atoms, molecules))
+
+    def _pad_atom_features(self, molecule: Molecule) -> np.array:
+        """Featurize single molecule instance from per-atom features.
+
+        Per-atom features are padded (or truncated) to `max_index` atoms. They are followed by atom
+        identities if no aggregation is set, else aggregated. If `max_index` is not set, features
+        are padded to the atoms of `molecule`, leaving `max_index` unset.
+
+        Args:
+            molecule (Molecule): Molecule representation.
+
+        Returns:
+            np.array: Array of shape `(1, N)` containing features for `molecule`.
+        """
+        if self.requires_schema:
+            return self._fitted_on(molecule)._pad_atom_features(molecule)
+
+        values, atomic_numbers = self.featurize_atoms(molecule)
+
+        padded = np.zeros(self.max_index)
+        num_values = min(len(values), self.max_index)
+        padded[:num_values] = values[:num_values]
+
+        if self.aggregation is None:
+            # Combine descriptors with atom identities
+            identities = np.zeros(self.max_index, dtype=int)
+            num_atoms = min(len(atomic_numbers), self.max_index)
+            identities[:num_atoms] = atomic_numbers[:num_atoms]
+            output = np.concatenate([padded, identities])
+        elif isinstance(self.aggregation, (list, set, tuple)):
+            output = [self.aggregation_func[agg](padded) for agg in self.aggregation]
+        else:
+            output = self.aggregation_func[self.aggregation](padded)
+
+        return np.array(output).reshape(1, -1)
+
+    @staticmethod
+    def _atom_values(descriptors: Union[Dict[int, float], Sequence[float]]) -> np.array:
+        """Order per-atom descriptors by atom index.
+
+        Args:
+            descriptors (Union[Dict[int, float], Sequence[float]]): Per-atom descriptors. Mappings are
+                keyed by 1-based atom index, as returned by morfeus.
+
+        Returns:
+            np.array: Per-atom descriptors ordered by atom index.
+        """
+        if isinstance(descriptors, dict):
+            return np.array([descriptors[i] for i in sorted(descriptors)], dtype=float)
+        return np.asarray(descriptors, dtype=float).reshape(-1)
+
     def _track_atom_identity(
         self, molecule: Molecule, max_index: int = 1
     ) -> List[Union[int, float]]:
@@ -568,9 +883,7 @@ class MorfeusFeaturizer(AbstractFeaturizer):
         Returns:
             List[Union[int, float]]: Atomic numbers of atoms in `molecule` arranged by index.
         """
-        elements, coordinates = self._get_element_coordinates(molecule=molecule)
-        atoms = molecule.get_atoms(hydrogen=True)
-        atomic_numbers = [atom.GetAtomicNum() for atom in atoms]
+        atomic_numbers = molecule.get_atomic_numbers(hydrogen=True).tolist()
         if (max_index - len(atomic_numbers)) > 0:
             atomic_numbers += [0 for _ in range(max_index - len(atomic_numbers))]
         elif (max_index - len(atomic_numbers)) < 0:
@@ -644,17 +957,20 @@ class AbstractComparator(ABC):
 class MultipleFeaturizer(AbstractFeaturizer):
     """A featurizer to combine featurizers."""
 
-    def __init__(self, featurizers: Optional[List[AbstractFeaturizer]] = None):
+    def __init__(self, featurizers: Optional[List[AbstractFeaturizer]] = None, fused: bool = True):
         """Initialize class instance.
 
         Args:
             featurizers (Optional[List[AbstractFeaturizer]]):
                 A list of featurizer objects. Defaults to `None`.
+            fused (bool): Run all featurizers on each molecule in a single pass over the molecules.
+                Otherwise, run `featurize_many` once per featurizer. Defaults to `True`.
 
         """
         super().__init__()
 
         self.featurizers = featurizers
+        self.fused = fused
 
     def featurize(self, molecule: Molecule) -> np.array:
         """
@@ -671,11 +987,41 @@ class MultipleFeaturizer(AbstractFeaturizer):
         """
         assert isinstance(self.featurizers, list)
 
-        features = [
-            feature for f in self.featurizers for feature in f.featurize(molecule).flatten()
-        ]
+        if not self.numeric:
+            features = [
+                feature for f in self.featurizers for feature in f.featurize(molecule).flatten()
+            ]
+            return np.array(features).reshape((1, -1))
+
+        if self.requires_schema:
+            return self._fitted_on(molecule).featurize(molecule)
+
+        features = np.empty((1, len(self.feature_labels)))
+        return _restore_dtype(features, {self.featurize_into(molecule, features)})
+
+    def featurize_into(self, molecule: Molecule, out: np.array) -> np.dtype:
+        """Featurize single Molecule instance, writing the features into a caller-provided row.
+
+        Each lower-level featurizer writes into its own slice of `out`, sized after its feature labels.
+
+        Args:
+            molecule (Molecule): Molecule representation.
+            out (np.array): Output row of shape `(N,)` or `(1, N)`, where `N` is the number of
+                features, i.e., `len(self.feature_labels)`.
+
+        Returns:
+            np.dtype: Data type holding the features of all lower-level featurizers.
+        """
+        assert isinstance(self.featurizers, list)
+
+        row = out.reshape(-1)
+        start, dtypes = 0, set()
+        for f in self.featurizers:
+            stop = start + len(f.feature_labels)
+            dtypes.add(f.featurize_into(molecule, row[start:stop]))
+            start = stop
 
-        return np.array(features).reshape((1, -1))
+        return _promote_dtypes(dtypes)
 
     def text_featurize(
         self,
@@ -698,20 +1044,191 @@ class MultipleFeaturizer(AbstractFeaturizer):
             [f.text_featurize(pos_key=pos_key, molecule=molecule) for f in self.featurizers]
         )
 
-    def featurize_many(self, molecules: List[Molecule]) -> np.array:
+    def featurize_many(self, molecules: List[Molecule], deduplicate: bool = False) -> np.array:
         """
         Featurize a sequence of Molecule objects.
 
         Args:
             molecules (List[Molecule]): A sequence of molecule representations.
+            deduplicate (bool): Featurize each unique structure (by canonical SMILES) once and scatter
+                the results back to the input order. Defaults to `False`.
 
         Returns:
             np.array: An array of features for each molecule instance.
         """
+        blocks = self._featurize_many_blocks(molecules=molecules, deduplicate=deduplicate)
+        return np.concatenate(blocks, axis=1)
+
+    def _featurize_many_blocks(
+        self, molecules: List[Molecule], deduplicate: bool = False
+    ) -> List[np.array]:
+        """Featurize a sequence of Molecule objects, keeping features of each featurizer apart.
+
+        Args:
+            molecules (List[Molecule]): A sequence of molecule representations.
+            deduplicate (bool): Featurize each unique structure once. Defaults to `False`.
+
+        Returns:
+            List[np.array]: Feature blocks, each of shape `(len(molecules), N_i)`.
+        """
+        assert isinstance(self.featurizers, list)
+
+        molecules = list(molecules)
+
+        if deduplicate:
+            unique, inverse = _deduplicate(molecules)
+            return [block[inverse] for block in self._featurize_many_blocks(molecules=unique)]
+
+        if not self.fused:
+            return [f.featurize_many(molecules=molecules) for f in self.featurizers]
+
+        self.prepare(molecules)
+
+        def compute(featurizers: List[AbstractFeaturizer], missing: List[Molecule]):
+            if len(featurizers) == len(self._leaf_featurizers()):
+                return self.get_backend().featurize_blocks(self, missing)
+
+            featurizer = MultipleFeaturizer(featurizers=featurizers)
+            featurizer.execution_backend = self.execution_backend
+            return featurizer.get_backend().featurize_blocks(featurizer, missing)
+
+        return _featurize_cached(self._leaf_featurizers(), molecules, compute)
+
+    def _fitted_on(self, molecule: Molecule):
+        """Return featurizer whose output widths are set, fitting missing widths on one molecule.
+
+        Args:
+            molecule (Molecule): Molecule representation.
+
+        Returns:
+            MultipleFeaturizer: `self` if no output width is missing, else a shallow copy holding
+                fitted copies of lower-level featurizers.
+        """
+        assert isinstance(self.featurizers, list)
+
+        if not self.requires_schema:
+            return self
+
+        featurizer = copy.copy(self)
+        featurizer.featurizers = [f._fitted_on(molecule) for f in self.featurizers]
+        return featurizer
+
+    def _leaf_featurizers(self) -> List[AbstractFeaturizer]:
+        """Return lower-level featurizers, with nested MultipleFeaturizer instances expanded.
+
+        Args:
+            None.
+
+        Returns:
+            List[AbstractFeaturizer]: Featurizers which are not MultipleFeaturizer instances.
+        """
         assert isinstance(self.featurizers, list)
 
-        results = [f.featurize_many(molecules=molecules) for f in self.featurizers]
-        return np.concatenate(results, axis=1)
+        return [
+            leaf
+            for f in self.featurizers
+            for leaf in (f._leaf_featurizers() if isinstance(f, MultipleFeaturizer) else [f])
+        ]
+
+    def featurize_blocks(self, molecules: List[Molecule]) -> List[np.array]:
+        """Featurize a sequence of Molecule objects in-process, one molecule at a time.
+
+        Every lower-level featurizer is applied to a molecule before moving on to the next one,
+        so that per-molecule intermediates are shared between featurizers. Cheap featurizers
+        featurize the whole sequence at once instead.
+
+        Args:
+            molecules (List[Molecule]): A sequence of molecule representations.
+
+        Returns:
+            List[np.array]: One array of features per lower-level featurizer.
+                Nested MultipleFeaturizer instances are expanded.
+        """
+        featurizers = self._leaf_featurizers()
+        molecules = list(molecules)
+
+        self.prepare(molecules)
+
+        blocks = [
+            f.featurize_blocks(molecules)[0] if f.cost == "cheap" else None for f in featurizers
+        ]
+
+        per_molecule = [f for f, block in zip(featurizers, blocks) if block is None]
+        if not per_molecule:
+            return blocks
+
+        # Numeric features are written into one preallocated block per featurizer.
+        buffers = [
+            np.empty((len(molecules), len(f.feature_labels))) if f.numeric else []
+            for f in per_molecule
+        ]
+        dtypes = [set() for _ in per_molecule]
+
+        for row, molecule in enumerate(molecules):
+            for f, buffer, dtype in zip(per_molecule, buffers, dtypes):
+                if f.numeric:
+                    dtype.add(f.featurize_into(molecule, buffer[row]))
+                else:
+                    buffer.append(f.featurize(molecule))
+
+        per_molecule_blocks = iter(
+            [
+                _restore_dtype(buffer, dtype) if f.numeric else np.concatenate(buffer)
+                for f, buffer, dtype in zip(per_molecule, buffers, dtypes)
+            ]
+        )
+        return [next(per_molecule_blocks) if block is None else block for block in blocks]
+
+    @property
+    def numeric(self) -> bool:
+        """Return whether all lower-level featurizers extract numeric features.
+
+        Args:
+            None.
+
+        Returns:
+            bool: Whether features can be written into float buffers.
+        """
+        return all(f.numeric for f in self._leaf_featurizers())
+
+    @property
+    def cost(self) -> str:
+        """Return cost class of the most expensive lower-level featurizer.
+
+        Args:
+            None.
+
+        Returns:
+            str: Cost class.
+        """
+        costs = [f.cost for f in self._leaf_featurizers()]
+        return max(costs, key=COST_CLASSES.index, default="cheap")
+
+    @property
+    def requires_schema(self) -> bool:
+        """Return whether any lower-level featurizer requires a feature schema.
+
+        Args:
+            None.
+
+        Returns:
+            bool: Whether a feature schema has to be fitted ahead of batch featurization.
+        """
+        return any(f.requires_schema for f in self._leaf_featurizers())
+
+    def apply_schema(self, schema: FeatureSchema):
+        """Fix data-dependent output widths of lower-level featurizers from one feature schema.
+
+        Args:
+            schema (FeatureSchema): Dataset-level feature schema.
+
+        Returns:
+            self: Instance of self.
+        """
+        for featurizer in self._leaf_featurizers():
+            featurizer.apply_schema(schema)
+
+        return self
 
     @property
     def feature_labels(self) -> List[str]:
@@ -761,32 +1278,121 @@ class MultipleFeaturizer(AbstractFeaturizer):
 
         return self
 
-    def generate_data(self, molecules: List[Molecule], metadata: bool = False) -> pd.DataFrame:
-        """Convert generated feature array to DataFrame.
+    def generate_data(
+        self, molecules: List[Molecule], metadata: bool = False, deduplicate: bool = False
+    ) -> "pd.DataFrame":
+        """Convert generated features to DataFrame.
+
+        Columns keep the type of the features they hold. Integer features are stored in the
+        smallest integer type holding all values, non-numeric features with few distinct values
+        are stored as categoricals.
 
         Args:
             molecules (List[Molecule]): Collection of molecular instances.
             metadata (bool, optional): Include extra molecule information.
                 Defaults to `False`.
+            deduplicate (bool, optional): Featurize each unique structure (by canonical SMILES) once.
+                Rows still follow the input order. Defaults to `False`.
 
         Returns:
-            pd.DataFrame: DataFrame generated from feature array.
+            pd.DataFrame: DataFrame generated from feature blocks.
         """
-        features = self.featurize_many(molecules=molecules)
+        import pandas as pd
 
-        if metadata:
-            extra_columns = ["representation_system", "representation_string"]
-            extra_features = np.array(
-                [[mol.get_representation(), mol.representation_string] for mol in molecules]
-            ).reshape((-1, 2))
+        molecules = list(molecules)
+        blocks = self._featurize_many_blocks(molecules=molecules, deduplicate=deduplicate)
+
+        columns = [
+            _typed_column(column)
+            for block in blocks
+            for column in block.reshape((len(molecules), -1)).T
+        ]
 
-            features = np.concatenate([extra_features, features], axis=-1)
+        if metadata:
+            extra_columns = list(_METADATA_COLUMNS)
+            columns = [
+                _typed_column(np.array([mol.get_representation() for mol in molecules])),
+                _typed_column(np.array([mol.representation_string for mol in molecules])),
+            ] + columns
         else:
             extra_columns = []
 
-        columns = extra_columns + self.feature_labels
+        data = pd.DataFrame(dict(enumerate(columns)), index=pd.RangeIndex(len(molecules)))
+        data.columns = extra_columns + self.feature_labels
+
+        return data
+
+    def update_data(
+        self,
+        data: "pd.DataFrame",
+        molecules: Iterable[Molecule] = (),
+        representation: Type[Molecule] = SMILESMolecule,
+    ) -> "pd.DataFrame":
+        """Update DataFrame generated by an earlier configuration, computing only missing cells.
+
+        Rows are identified by their `representation_string` and columns by the feature labels of
+        each lower-level featurizer, so `data` must have been generated with `metadata=True`.
+        Lower-level featurizers whose labels are all present in `data` are not run on existing rows.
+        New featurizers are run on existing rows only, and all featurizers are run on molecules not
+        yet in `data`.
+
+        Args:
+            data (pd.DataFrame): Existing data, e.g., as returned by
+                `generate_data(..., metadata=True)`.
+            molecules (Iterable[Molecule]): Molecules to add. Molecules already in `data` are
+                skipped. Defaults to `()`, i.e., only add columns.
+            representation (Type[Molecule]): Molecule class used to rebuild existing rows from their
+                representation strings. Defaults to `SMILESMolecule`.
+
+        Returns:
+            pd.DataFrame: Existing rows followed by new rows, with the metadata columns followed by
+                `self.feature_labels`. Columns not generated by this featurizer are dropped.
+        """
+        import pandas as pd
+
+        missing_columns = [column for column in _METADATA_COLUMNS if column not in data.columns]
+        if missing_columns:
+            raise ValueError(
+                f"Columns {missing_columns} not found. Update data generated with `metadata=True`."
+            )
+
+        data = data.reset_index(drop=True)
+        known = set(data["representation_string"])
+
+        added: Dict[str, Molecule] = {}
+        for molecule in molecules:
+            if molecule.representation_string not in known:
+                added.setdefault(molecule.representation_string, molecule)
+        added_molecules = list(added.values())
+
+        stored = [representation(string) for string in data["representation_string"]]
+        if not stored:
+            return self.generate_data(added_molecules, metadata=True)
+
+        self.prepare(stored + added_molecules)
+
+        # Lower-level featurizers whose columns are missing, e.g., after a change of output width
+        featurizers = [
+            f
+            for f in self._leaf_featurizers()
+            if not set(f.feature_labels).issubset(data.columns)
+        ]
+
+        if featurizers:
+            featurizer = MultipleFeaturizer(featurizers=featurizers)
+            featurizer.execution_backend = self.execution_backend
+            new_columns = featurizer.generate_data(stored)
+
+            data = pd.concat(
+                [data.drop(columns=new_columns.columns, errors="ignore"), new_columns], axis=1
+            )
+
+        columns = _METADATA_COLUMNS + self.feature_labels
+        if not added_molecules:
+            return data[columns]
 
-        return pd.DataFrame(data=features, columns=columns)
+        new_rows = self.generate_data(added_molecules, metadata=True)
+        return pd.concat([data[columns], new_rows], axis=0, ignore_index=True)
 
     def implementors(self) -> List[str]:
         """
@@ -801,6 +1407,227 @@ class MultipleFeaturizer(AbstractFeaturizer):
         return ["Benedict Oshomah Emoekabu"]
 
 
+def _promote_dtypes(dtypes: Iterable[np.dtype]) -> np.dtype:
+    """Return the smallest data type holding all given data types.
+
+    Args:
+        dtypes (Iterable[np.dtype]): Data types.
+
+    Returns:
+        np.dtype: Promoted data type.
+    """
+    return reduce(np.promote_types, dtypes, np.dtype(bool))
+
+
+def _restore_dtype(features: np.array, dtypes: Iterable[np.dtype]) -> np.array:
+    """Cast features written into a float buffer back to integer or boolean type, if applicable.
+
+    Args:
+        features (np.array): Float buffer holding features.
+        dtypes (Iterable[np.dtype]): Data types of the features written into `features`.
+
+    Returns:
+        np.array: Features, of integer or boolean type where all written features were.
+    """
+    dtype = _promote_dtypes(dtypes)
+    return features.astype(dtype) if dtype.kind in "biu" else features
+
+
+def _deduplicate(molecules: List[Molecule]) -> Tuple[List[Molecule], np.array]:
+    """Return unique molecules by canonical SMILES, and the position of each input among them.
+
+    Args:
+        molecules (List[Molecule]): Molecular instances.
+
+    Returns:
+        Tuple[List[Molecule], np.array]: Tuple containing (a). first instance of each unique structure
+            and (b). integer array such that `unique[inverse[i]]` has the structure of `molecules[i]`.
+    """
+    positions: Dict[str, int] = {}
+    unique = []
+    inverse = np.empty(len(molecules), dtype=np.int64)
+
+    for ix, molecule in enumerate(molecules):
+        key = molecule.canonical_smiles
+        if key not in positions:
+            positions[key] = len(unique)
+            unique.append(molecule)
+        inverse[ix] = positions[key]
+
+    return unique, inverse
+
+
+def _stable_value(value: Any) -> Any:
+    """Convert a featurizer attribute to a JSON-serializable value with a stable representation.
+
+    Args:
+        value (Any): Attribute value.
+
+    Returns:
+        Any: Stable representation of `value`.
+
+    Raises:
+        TypeError: If `value` has no stable representation.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_stable_value(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_stable_value(item) for item in value), key=repr)
+    if isinstance(value, dict):
+        return {str(key): _stable_value(item) for key, item in value.items()}
+    if callable(value) and "<" not in getattr(value, "__qualname__", "<"):
+        return f"{value.__module__}.{value.__qualname__}"
+
+    raise TypeError(f"No stable representation for value of type `{type(value).__name__}`.")
+
+
+def _featurize_cached(
+    featurizers: List[AbstractFeaturizer],
+    molecules: List[Molecule],
+    compute: Callable[[List[AbstractFeaturizer], List[Molecule]], List[np.array]],
+) -> List[np.array]:
+    """Featurize molecules, serving features from the result cache where possible.
+
+    Only featurizers with missing results are run, on the molecules with any missing result.
+    Computed results are stored in the cache. Without a result cache, `compute` is called directly.
+
+    Args:
+        featurizers (List[AbstractFeaturizer]): Prepared lower-level featurizers.
+        molecules (List[Molecule]): Molecular instances.
+        compute (Callable[[List[AbstractFeaturizer], List[Molecule]], List[np.array]]): Function
+            returning one feature block per featurizer passed, for the molecules passed.
+
+    Returns:
+        List[np.array]: One feature block per featurizer, of shape `(len(molecules), N_i)`.
+    """
+    cache = get_result_cache()
+    fingerprints = [
+        f.fingerprint() if cache is not None and cache.accepts(f.cost) else None
+        for f in featurizers
+    ]
+    if not any(fingerprints) or not molecules:
+        return compute(featurizers, molecules)
+
+    identities = [(type(molecule).__name__, molecule.canonical_smiles) for molecule in molecules]
+    keys = [
+        [cache_key("features", fingerprint, identity) for identity in identities]
+        if fingerprint is not None
+        else None
+        for fingerprint in fingerprints
+    ]
+    rows = [
+        [cache.get(key) for key in featurizer_keys]
+        if featurizer_keys is not None
+        else [None] * len(molecules)
+        for featurizer_keys in keys
+    ]
+
+    stale = [ix for ix in range(len(featurizers)) if any(row is None for row in rows[ix])]
+    if stale:
+        # Featurizers without a fingerprint miss every molecule and run on the whole collection.
+        missing = [jx for jx in range(len(molecules)) if any(rows[ix][jx] is None for ix in stale)]
+        blocks = compute([featurizers[ix] for ix in stale], [molecules[jx] for jx in missing])
+
+        for ix, block in zip(stale, blocks):
+            for jx, row in zip(missing, block.reshape((len(missing), 1, -1))):
+                rows[ix][jx] = row
+                if keys[ix] is not None:
+                    cache.set(keys[ix][jx], row)
+
+    return [np.concatenate(featurizer_rows) for featurizer_rows in rows]
+
+
+def _hashable_block(block: np.array, epsilon: float = 0.0) -> np.array:
+    """Convert a feature block to an array whose row bytes are equal exactly for equal features.
+
+    Args:
+        block (np.array): Feature block of shape `(N, M)`.
+        epsilon (float): Bin width for numerical features. Defaults to `0.0`, i.e., no binning.
+
+    Returns:
+        np.array: Contiguous array of numbers or fixed-width strings.
+    """
+    if block.dtype.kind in "biuf":
+        block = block.astype(np.float64)
+        if epsilon > 0:
+            block = np.round(block / epsilon)
+        # Adding zero maps negative zeros to zero
+        return np.ascontiguousarray(block + 0.0)
+
+    return np.ascontiguousarray(block.astype(str))
+
+
+def _group_rows(matrix: np.array) -> np.array:
+    """Label rows of a matrix by hashing, with equal labels for equal rows.
+
+    Args:
+        matrix (np.array): Contiguous array of shape `(N, M)`.
+
+    Returns:
+        np.array: Integer label per row, numbered in order of first occurrence.
+    """
+    matrix = np.ascontiguousarray(matrix)
+    labels: Dict[bytes, int] = {}
+
+    return np.fromiter(
+        (labels.setdefault(row.tobytes(), len(labels)) for row in matrix),
+        dtype=np.int64,
+        count=len(matrix),
+    )
+
+
+def _pairs_from_groups(labels: np.array) -> np.array:
+    """Expand group labels into all pairs of members of the same group.
+
+    Args:
+        labels (np.array): Integer group label per item.
+
+    Returns:
+        np.array: Index pairs `(i, j)` with `i < j`, of shape `(N, 2)`, sorted by `i`, then `j`.
+    """
+    order = np.argsort(labels, kind="stable")
+    counts = np.bincount(labels) if len(labels) else np.zeros(0, dtype=np.int64)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+
+    pairs = [np.zeros((0, 2), dtype=np.int64)]
+    for start, count in zip(starts[counts > 1], counts[counts > 1]):
+        members = order[start : start + count]
+        first, second = np.triu_indices(count, k=1)
+        pairs.append(np.stack([members[first], members[second]], axis=1))
+
+    pairs = np.concatenate(pairs)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def _typed_column(values: np.array) -> Union[np.array, "pd.Categorical"]:
+    """Convert a column of features to a compact, typed column.
+
+    Args:
+        values (np.array): One-dimensional array of features.
+
+    Returns:
+        Union[np.array, pd.Categorical]: Column of numeric, boolean, string or categorical type.
+    """
+    import pandas as pd
+
+    if values.dtype.kind not in "biuf":
+        try:
+            values = pd.to_numeric(values)
+        except (ValueError, TypeError):
+            if len(pd.unique(values)) <= len(values) // 2:
+                return pd.Categorical(values)
+            return values.astype(object)
+
+    if values.dtype.kind in "iu":
+        return pd.to_numeric(values, downcast="integer")
+
+    return values
+
+
 class Comparator(AbstractComparator):
     """Compare molecules based on featurizer outputs."""
 
@@ -869,10 +1696,58 @@ class Comparator(AbstractComparator):
         """
         batch_results = featurizer.featurize_many(molecules=molecules)
 
+        # Exact equality only needs a comparison against the first molecule.
+        if epsilon == 0:
+            equal = (batch_results == batch_results[:1]).all()
+            return np.array([equal], dtype=int).reshape((1, -1))
+
+        from scipy.spatial import distance_matrix
+
         distance_results = distance_matrix(batch_results, batch_results)
 
         return (np.mean(distance_results) <= epsilon).astype(int).reshape((1, -1))
 
+    def group(self, molecules: List[Molecule], epsilon: float = 0.0) -> np.array:
+        """Assign molecules to groups of molecules with equal features on all featurizers.
+
+        Molecules are featurized once, in a single pass, and grouped by hashing feature rows, so the
+        cost grows linearly with the number of molecules instead of with the number of pairs.
+
+        Args:
+            molecules (List[Molecule]): Molecule instances to be grouped.
+            epsilon (float, optional): Bin width for numerical features. Features are compared after
+                rounding to multiples of `epsilon`. Defaults to `0.0`, i.e., exact equality.
+
+        Returns:
+            np.array: Integer group label per molecule, numbered in order of first occurrence.
+        """
+        assert isinstance(self.featurizers, list)
+
+        molecules = list(molecules)
+        if not molecules:
+            return np.zeros(0, dtype=np.int64)
+
+        blocks = MultipleFeaturizer(featurizers=self.featurizers)._featurize_many_blocks(molecules)
+        labels = [
+            _group_rows(_hashable_block(block.reshape((len(molecules), -1)), epsilon))
+            for block in blocks
+        ]
+
+        return _group_rows(np.stack(labels, axis=1))
+
+    def pairs(self, molecules: List[Molecule], epsilon: float = 0.0) -> np.array:
+        """Return all pairs of molecules with equal features on all featurizers.
+
+        Args:
+            molecules (List[Molecule]): Molecule instances to be compared.
+            epsilon (float, optional): Bin width for numerical features, see `group`.
+                Defaults to `0.0`.
+
+        Returns:
+            np.array: Index pairs `(i, j)` with `i < j`, of shape `(N, 2)`, sorted by `i`, then `j`.
+        """
+        return _pairs_from_groups(self.group(molecules=molecules, epsilon=epsilon))
+
     def featurize(
         self,
         molecules: List[Molecule],
@@ -1019,6 +1894,29 @@ class MultipleComparator(Comparator):
 
         return np.concatenate(features, axis=-1)
 
+    def group(self, molecules: List[Molecule], epsilon: float = 0.0) -> np.array:
+        """Assign molecules to groups of molecules which are equal under all Comparators.
+
+        Args:
+            molecules (List[Molecule]): Molecule instances to be grouped.
+            epsilon (float, optional): Bin width for numerical features, see `Comparator.group`.
+                Defaults to `0.0`.
+
+        Returns:
+            np.array: Integer group label per molecule, numbered in order of first occurrence.
+        """
+        assert isinstance(self.comparators, list)
+
+        molecules = list(molecules)
+        if not molecules:
+            return np.zeros(0, dtype=np.int64)
+
+        labels = [
+            comparator.group(molecules=molecules, epsilon=epsilon)
+            for comparator in self.comparators
+        ]
+        return _group_rows(np.stack(labels, axis=1))
+
     @property
     def feature_labels(
         self,
@@ -56,6 +56,8 @@ _MAP_BOND_TYPE_TO_CLEAN_NAME = {
 class RotableBondCountFeaturizer(AbstractFeaturizer):
     """Obtain number of rotable (i.e., single, non-terminal, non-hydrogen) bonds in a molecule."""
 
+    cost = "cheap"
+
     def __init__(self):
         """Initialize instance."""
         super().__init__()
@@ -78,6 +80,17 @@ class RotableBondCountFeaturizer(AbstractFeaturizer):
         """
         return ["num_rotable_bonds"]
 
+    def _featurize_values(self, molecule: Molecule) -> int:
+        """Return the raw feature value for a molecule instance.
+
+        Args:
+            molecule (Molecule): Molecular representation.
+
+        Returns:
+            int: Number of rotable bonds in molecule.
+        """
+        return rdMolDescriptors.CalcNumRotatableBonds(molecule.reveal_hydrogens(), strict=True)
+
     def featurize(self, molecule: Molecule) -> np.array:
         """Featurize single molecule instance. Count the number of rotable (single, non-terminal) bonds in a molecule.
 
@@ -87,10 +100,7 @@ class RotableBondCountFeaturizer(AbstractFeaturizer):
         Returns:
             np.array: Number of rotable bonds in molecule.
         """
-        num_rotable = rdMolDescriptors.CalcNumRotatableBonds(
-            molecule.reveal_hydrogens(), strict=True
-        )
-        return np.array([num_rotable]).reshape((1, -1))
+        return np.array([self._featurize_values(molecule)]).reshape((1, -1))
 
     def implementors(self) -> List[str]:
         """
@@ -111,6 +121,8 @@ class RotableBondCountFeaturizer(AbstractFeaturizer):
 class RotableBondProportionFeaturizer(AbstractFeaturizer):
     """Obtain distribution between rotable and non-rotable bonds in a molecule."""
 
+    cost = "cheap"
+
     def __init__(self):
         """Initialize instance."""
         super().__init__()
@@ -205,6 +217,8 @@ class RotableBondProportionFeaturizer(AbstractFeaturizer):
 class BondTypeCountFeaturizer(AbstractFeaturizer):
     """Featurizer for bond type count (or presence) extraction."""
 
+    cost = "cheap"
+
     def __init__(self, count: bool = True, bond_type: Union[str, List[str]] = "all"):
         """
         Initialize class.
@@ -580,6 +594,8 @@ class BondTypeProportionFeaturizer(BondTypeCountFeaturizer):
 class DipoleMomentsFeaturizer(MorfeusFeaturizer):
     """Return the dipole moments for a molecule."""
 
+    schema_field = "max_bonds"
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -626,6 +642,9 @@ class DipoleMomentsFeaturizer(MorfeusFeaturizer):
         Returns:
             (np.array): Array containing dipole moments for bonds in molecule instance.
         """
+        if self.requires_schema:
+            return self._fitted_on(molecule).featurize(molecule)
+
         if self.qc_optimize:
             molecule = self._generate_conformer(molecule=molecule)
 
@@ -634,9 +653,6 @@ class DipoleMomentsFeaturizer(MorfeusFeaturizer):
         dipoles = morfeus_instance.get_dipole(**self.morfeus_kwargs).flatten().tolist()
         num_dipoles = len(dipoles)
 
-        if self.max_index is None:
-            self.max_index = self.fit_on_bond_counts(molecules=molecule)
-
         dipoles = [(dipoles[i] if i < num_dipoles else 0) for i in range(self.max_index)]
 
         if self.aggregation is None:
@@ -653,21 +669,6 @@ class DipoleMomentsFeaturizer(MorfeusFeaturizer):
 
         return np.array(output).reshape(1, -1)
 
-    def featurize_many(self, molecules: List[Molecule]) -> np.array:
-        """
-        Featurize a sequence of Molecule objects.
-
-        Args:
-            molecules (List[Molecule]): A sequence of molecule representations.
-
-        Returns:
-            (np.array): An array of features for each molecule instance.
-        """
-        if self.max_index is None:
-            self.max_index = self.fit_on_bond_counts(molecules=molecules)
-
-        return super().featurize_many(molecules=molecules)
-
     @property
     def feature_labels(self) -> List[str]:
         """Return feature label(s).
@@ -706,6 +707,8 @@ class DipoleMomentsFeaturizer(MorfeusFeaturizer):
 class BondOrderFeaturizer(MorfeusFeaturizer):
     """Return the bond orders for bonds in a molecule."""
 
+    schema_field = "max_bonds"
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -750,6 +753,9 @@ class BondOrderFeaturizer(MorfeusFeaturizer):
         Returns:
             np.array: Array containing bond orders for bonds in molecule instance.
         """
+        if self.requires_schema:
+            return self._fitted_on(molecule).featurize(molecule)
+
         if self.qc_optimize:
             molecule = self._generate_conformer(molecule=molecule)
 
@@ -757,9 +763,6 @@ class BondOrderFeaturizer(MorfeusFeaturizer):
 
         bond_orders = morfeus_instance.get_bond_orders(**self.morfeus_kwargs).flatten().tolist()
 
-        if self.max_index is None:
-            self.max_index = self.fit_on_bond_counts(molecules=molecule)
-
         bond_orders = [
             (bond_orders[i - 1] if i <= self.max_index else 0) for i in range(self.max_index)
         ]
@@ -778,21 +781,6 @@ class BondOrderFeaturizer(MorfeusFeaturizer):
 
         return np.array(output).reshape(1, -1)
 
-    def featurize_many(self, molecules: List[Molecule]) -> np.array:
-        """
-        Featurize a sequence of Molecule objects.
-
-        Args:
-            molecules (List[Molecule]): A sequence of molecule representations.
-
-        Returns:
-            np.array: An array of features for each molecule instance.
-        """
-        if self.max_index is None:
-            self.max_index = self.fit_on_bond_counts(molecules=molecules)
-
-        return super().featurize_many(molecules=molecules)
-
     @property
     def feature_labels(self) -> List[str]:
         """Return feature label(s).
@@ -0,0 +1,766 @@
+# -*- coding: utf-8 -*-
+
+"""Persistent, process-safe caches for expensive featurization intermediates."""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+# Implemented caching utilities
+
+__all__ = [
+    "DiskCache",  # SQLite-backed key-value store.
+    "cache_key",  # Helper function
+    "geometry_key",  # Helper function
+    "get_conformer_cache",  # Helper function
+    "set_conformer_cache",  # Helper function
+    "get_xtb_cache",  # Helper function
+    "set_xtb_cache",  # Helper function
+    "XTBSession",  # Memoized xTB calculations.
+    "get_xtb_session",  # Helper function
+    "get_sasa",  # Helper function
+    "ResultCache",  # Memoized featurizer outputs.
+    "get_result_cache",  # Helper function
+    "set_result_cache",  # Helper function
+]
+
+"""Environment variables."""
+
+CONFORMER_CACHE_ENV = "CHEMCAPTION_CONFORMER_CACHE"
+XTB_CACHE_ENV = "CHEMCAPTION_XTB_CACHE"
+RESULT_CACHE_ENV = "CHEMCAPTION_RESULT_CACHE"
+
+
+def cache_key(*parts: Any) -> str:
+    """Return content-addressed key for a sequence of JSON-serializable parts.
+
+    Mappings are serialized with sorted keys, so equal configurations give equal keys.
+
+    Args:
+        *parts (Any): Key components, e.g., a canonical SMILES string and generation kwargs.
+
+    Returns:
+        str: Hexadecimal SHA-1 digest.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+# Tables, and triggers keeping the total size of stored values in `meta`.
+_DISK_CACHE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entries ("
+    "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)",
+    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO meta (name, value) "
+    "SELECT 'size', COALESCE(SUM(size), 0) FROM entries",
+    "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN "
+    "UPDATE meta SET value = value + NEW.size WHERE name = 'size'; END",
+    "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN "
+    "UPDATE meta SET value = value - OLD.size WHERE name = 'size'; END",
+    "CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN "
+    "UPDATE meta SET value = value + NEW.size - OLD.size WHERE name = 'size'; END",
+)
+
+
+class DiskCache:
+    """SQLite-backed key-value store shared by processes and runs.
+
+    Values are stored compressed. The store is bounded by `max_size` bytes; when full, the least
+    recently used entries are evicted. Concurrent writers are serialized by SQLite, and each
+    process opens its own connection, so one store can be used from pool workers.
+
+    The total size of stored values is kept up to date by triggers, so inserts do not scan the
+    store. Reads do not write: access times are recorded in memory and written along with the
+    next insert of the same process.
+    """
+
+    # Number of recorded access times written without waiting for the next insert.
+    _MAX_PENDING_ACCESSES = 1024
+
+    def __init__(self, path: str, max_size: Optional[int] = 2 * 1024**3, timeout: float = 60.0):
+        """Instantiate class.
+
+        Args:
+            path (str): Path to SQLite database. Parent directories are created if needed.
+            max_size (Optional[int]): Maximum total size of stored values in bytes.
+                Defaults to 2 GiB. `None` disables eviction.
+            timeout (float): Seconds to wait for a lock held by another writer. Defaults to `60.0`.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("`max_size` must be a positive integer or `None`.")
+
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_size = max_size
+        self.timeout = timeout
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._accessed: Dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        """Return string representation of cache.
+
+        Args:
+            None.
+
+        Returns:
+            str: String representation of cache.
+        """
+        return f"{self.__class__.__name__}(path='{self.path}', max_size={self.max_size})"
+
+    def __getstate__(self):
+        """Drop live connection when pickling."""
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_pid"] = None
+        state["_accessed"] = {}
+        return state
+
+    def __len__(self) -> int:
+        """Return number of stored entries."""
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether `key` is stored."""
+        query = "SELECT 1 FROM entries WHERE key = ?"
+        return self._connect().execute(query, (key,)).fetchone() is not None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return connection owned by the current process, opening one if needed.
+
+        Args:
+            None.
+
+        Returns:
+            sqlite3.Connection: Connection to database.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in _DISK_CACHE_SCHEMA:
+                    connection.execute(statement)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+            self._connection, self._pid = connection, os.getpid()
+            self._accessed = {}
+
+        return self._connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return value stored under `key`.
+
+        Args:
+            key (str): Key.
+
+        Returns:
+            Optional[bytes]: Stored value, or `None` if `key` is not stored.
+        """
+        connection = self._connect()
+        row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        self._accessed[key] = time.time()
+        if len(self._accessed) >= self._MAX_PENDING_ACCESSES:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._write_accesses(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+        return zlib.decompress(row[0])
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store value under `key`, evicting least recently used entries if the store is full.
+
+        Args:
+            key (str): Key.
+            value (bytes): Value.
+
+        Returns:
+            None.
+        """
+        blob = zlib.compress(value)
+        connection = self._connect()
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._write_accesses(connection)
+            connection.execute(
+                "INSERT INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "value = excluded.value, size = excluded.size, accessed = excluded.accessed",
+                (key, blob, len(blob), time.time()),
+            )
+            if self.max_size is not None:
+                self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _write_accesses(self, connection: sqlite3.Connection) -> None:
+        """Write access times recorded by `get` since the last write.
+
+        Args:
+            connection (sqlite3.Connection): Connection with an open write transaction.
+
+        Returns:
+            None.
+        """
+        if self._accessed:
+            connection.executemany(
+                "UPDATE entries SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._accessed.items()],
+            )
+            self._accessed = {}
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the store fits in `max_size`.
+
+        Args:
+            connection (sqlite3.Connection): Connection with an open write transaction.
+
+        Returns:
+            None.
+        """
+        total = connection.execute("SELECT value FROM meta WHERE name = 'size'").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        excess = total - self.max_size
+        victims = []
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+
+        connection.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def clear(self) -> None:
+        """Delete all entries.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        self._connect().execute("DELETE FROM entries")
+        self._accessed = {}
+
+    def close(self) -> None:
+        """Write recorded access times and close connection of the current process, if any.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            if self._accessed:
+                self._connection.execute("BEGIN IMMEDIATE")
+                self._write_accesses(self._connection)
+                self._connection.execute("COMMIT")
+            self._connection.close()
+        self._connection, self._pid = None, None
+        self._accessed = {}
+
+
+"""Default caches."""
+
+_CACHES: Dict[str, Optional[DiskCache]] = {}
+
+
+def _get_cache(environment_variable: str) -> Optional[DiskCache]:
+    """Return default cache configured under `environment_variable`.
+
+    Args:
+        environment_variable (str): Environment variable holding the path to the cache.
+
+    Returns:
+        Optional[DiskCache]: Cache, or `None` if no cache is configured.
+    """
+    if environment_variable not in _CACHES:
+        path = os.environ.get(environment_variable)
+        _CACHES[environment_variable] = DiskCache(path) if path else None
+
+    return _CACHES[environment_variable]
+
+
+def _set_cache(environment_variable: str, cache: Optional[DiskCache]) -> Optional[DiskCache]:
+    """Replace default cache configured under `environment_variable`.
+
+    The path of the new cache is also exported to `environment_variable`, so worker
+    processes started afterwards use the same store.
+
+    Args:
+        environment_variable (str): Environment variable holding the path to the cache.
+        cache (Optional[DiskCache]): New cache. `None` disables persistent caching.
+
+    Returns:
+        Optional[DiskCache]: Previous cache.
+    """
+    if cache is not None and not isinstance(cache, DiskCache):
+        raise ValueError("`cache` must be of type `DiskCache` or `None`.")
+
+    previous = _get_cache(environment_variable)
+    _CACHES[environment_variable] = cache
+
+    if cache is None:
+        os.environ.pop(environment_variable, None)
+    else:
+        os.environ[environment_variable] = cache.path
+
+    return previous
+
+
+def get_conformer_cache() -> Optional[DiskCache]:
+    """Return the persistent conformer cache, if any.
+
+    Unless set with `set_conformer_cache`, the cache is read from the path in the
+    `CHEMCAPTION_CONFORMER_CACHE` environment variable on first use.
+
+    Args:
+        None.
+
+    Returns:
+        Optional[DiskCache]: Conformer cache, or `None` if conformers are only cached in memory.
+    """
+    return _get_cache(CONFORMER_CACHE_ENV)
+
+
+def set_conformer_cache(cache: Optional[DiskCache]) -> Optional[DiskCache]:
+    """Replace the persistent conformer cache.
+
+    Args:
+        cache (Optional[DiskCache]): New conformer cache. `None` disables persistent caching.
+
+    Returns:
+        Optional[DiskCache]: Previous conformer cache.
+    """
+    return _set_cache(CONFORMER_CACHE_ENV, cache)
+
+
+def get_xtb_cache() -> Optional[DiskCache]:
+    """Return the persistent xTB result cache, if any.
+
+    Unless set with `set_xtb_cache`, the cache is read from the path in the
+    `CHEMCAPTION_XTB_CACHE` environment variable on first use.
+
+    Args:
+        None.
+
+    Returns:
+        Optional[DiskCache]: xTB result cache, or `None` if results are only cached in memory.
+    """
+    return _get_cache(XTB_CACHE_ENV)
+
+
+def set_xtb_cache(cache: Optional[DiskCache]) -> Optional[DiskCache]:
+    """Replace the persistent xTB result cache.
+
+    Args:
+        cache (Optional[DiskCache]): New xTB result cache. `None` disables persistent caching.
+
+    Returns:
+        Optional[DiskCache]: Previous xTB result cache.
+    """
+    return _set_cache(XTB_CACHE_ENV, cache)
+
+
+"""xTB sessions."""
+
+
+def geometry_key(elements: Sequence[str], coordinates: np.array) -> str:
+    """Return content-addressed key for a molecular geometry.
+
+    Args:
+        elements (Sequence[str]): Element symbols.
+        coordinates (np.array): Atomic coordinates.
+
+    Returns:
+        str: Hexadecimal SHA-1 digest.
+    """
+    digest = hashlib.sha1(" ".join(str(e) for e in elements).encode("utf-8"))
+    digest.update(np.ascontiguousarray(coordinates, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+class XTBSession:
+    """Memoized xTB calculations for one geometry, charge and method.
+
+    Exposes the `get_*` methods of `morfeus.XTB`. Each result is computed once and then served
+    from memory, or from the persistent xTB result cache if one is configured. The underlying
+    `morfeus.XTB` instance is only created if a result is missing, so it keeps its own
+    calculation results across all getters.
+    """
+
+    def __init__(
+        self,
+        elements: Sequence[str],
+        coordinates: np.array,
+        method: Union[int, str] = 2,
+        charge: int = 0,
+    ):
+        """Instantiate class.
+
+        Args:
+            elements (Sequence[str]): Element symbols.
+            coordinates (np.array): Atomic coordinates.
+            method (Union[int, str]): xTB method. Defaults to `2`.
+            charge (int): Molecular charge. Defaults to `0`.
+        """
+        self.elements = list(elements)
+        self.coordinates = np.asarray(coordinates)
+        self.method = method
+        self.charge = charge
+        self.key = cache_key("xtb", geometry_key(self.elements, self.coordinates), method, charge)
+
+        self._xtb = None
+        self._results: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Callable:
+        """Return memoized version of a `morfeus.XTB` getter."""
+        if not name.startswith("get_"):
+            raise AttributeError(name)
+        return partial(self._call, name)
+
+    def _call(self, name: str, *args, **kwargs) -> Any:
+        """Return result of a `morfeus.XTB` getter, computing it if needed.
+
+        Args:
+            name (str): Name of getter.
+            *args (Any): Positional arguments to getter.
+            **kwargs (Any): Keyword arguments to getter.
+
+        Returns:
+            Any: Result of getter. Shared between callers and must not be modified.
+        """
+        key = cache_key(self.key, name, args, kwargs)
+        if key in self._results:
+            return self._results[key]
+
+        cache = get_xtb_cache()
+        value = cache.get(key) if cache is not None else None
+
+        if value is not None:
+            result = pickle.loads(value)
+        else:
+            result = getattr(self._get_xtb(), name)(*args, **kwargs)
+            if cache is not None:
+                cache.set(key, pickle.dumps(result))
+
+        self._results[key] = result
+        return result
+
+    def _get_xtb(self):
+        """Return underlying `morfeus.XTB` instance, creating it if needed.
+
+        Args:
+            None.
+
+        Returns:
+            XTB: morfeus XTB instance.
+        """
+        if self._xtb is None:
+            from morfeus import XTB
+
+            self._xtb = XTB(self.elements, self.coordinates, self.method, charge=self.charge)
+        return self._xtb
+
+
+"""Featurizer results."""
+
+
+class ResultCache:
+    """Memoized featurizer outputs, keyed by molecule and featurizer configuration.
+
+    Results are kept in an in-memory LRU and, if `disk` is given, in a persistent store shared by
+    processes and runs. Featurizers cheaper than `min_cost` are not cached, since recomputing their
+    features is about as fast as looking them up.
+    """
+
+    def __init__(
+        self,
+        disk: Optional[DiskCache] = None,
+        max_entries: Optional[int] = 100_000,
+        min_cost: str = "moderate",
+    ):
+        """Instantiate class.
+
+        Args:
+            disk (Optional[DiskCache]): Persistent store. Defaults to `None`, i.e., results are only
+                cached in memory.
+            max_entries (Optional[int]): Maximum number of results kept in memory.
+                Defaults to `100_000`. `None` disables eviction.
+            min_cost (str): Cost class of the cheapest featurizer to cache. One of `cheap`,
+                `moderate` or `expensive`. Defaults to `moderate`.
+        """
+        from chemcaption.featurize.base import COST_CLASSES
+
+        if disk is not None and not isinstance(disk, DiskCache):
+            raise ValueError("`disk` must be of type `DiskCache` or `None`.")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("`max_entries` must be a positive integer or `None`.")
+        if min_cost not in COST_CLASSES:
+            raise ValueError(
+                f"Invalid cost class '{min_cost}'. "
+                f"Valid cost classes are: {', '.join(COST_CLASSES)}."
+            )
+
+        self.disk = disk
+        self.max_entries = max_entries
+        self.min_cost = min_cost
+
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, np.array]" = OrderedDict()
+
+    def __repr__(self) -> str:
+        """Return string representation of cache.
+
+        Args:
+            None.
+
+        Returns:
+            str: String representation of cache.
+        """
+        return (
+            f"{self.__class__.__name__}(disk={self.disk!r}, max_entries={self.max_entries}, "
+            f"min_cost='{self.min_cost}')"
+        )
+
+    def __len__(self) -> int:
+        """Return number of results kept in memory."""
+        return len(self._memory)
+
+    def accepts(self, cost: str) -> bool:
+        """Check whether results of featurizers of cost class `cost` are cached.
+
+        Args:
+            cost (str): Cost class of featurizer.
+
+        Returns:
+            bool: Whether results are cached.
+        """
+        from chemcaption.featurize.base import COST_CLASSES
+
+        return COST_CLASSES.index(cost) >= COST_CLASSES.index(self.min_cost)
+
+    def get(self, key: str) -> Optional[np.array]:
+        """Return result stored under `key`, from memory or else from the persistent store.
+
+        Args:
+            key (str): Key, e.g., as returned by `cache_key`.
+
+        Returns:
+            Optional[np.array]: Stored features, or `None` if `key` is not stored.
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        value = self.disk.get(key) if self.disk is not None else None
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        result = self._memory[key] = pickle.loads(value)
+        self._trim()
+        return result
+
+    def set(self, key: str, features: np.array) -> None:
+        """Store result under `key`, in memory and in the persistent store.
+
+        Args:
+            key (str): Key, e.g., as returned by `cache_key`.
+            features (np.array): Features of one molecule.
+
+        Returns:
+            None.
+        """
+        features = np.array(features)
+        self._memory[key] = features
+        self._memory.move_to_end(key)
+        self._trim()
+
+        if self.disk is not None:
+            self.disk.set(key, pickle.dumps(features))
+
+    def _trim(self) -> None:
+        """Evict least recently used results from memory until at most `max_entries` are kept.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        if self.max_entries is None:
+            return
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Delete all results, in memory and in the persistent store.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        self._memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+_RESULT_CACHE: Dict[str, Optional[ResultCache]] = {}
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Return the featurizer result cache, if any.
+
+    Unless set with `set_result_cache`, results are cached on disk at the path in the
+    `CHEMCAPTION_RESULT_CACHE` environment variable, read on first use. Without either,
+    results are not cached.
+
+    Args:
+        None.
+
+    Returns:
+        Optional[ResultCache]: Result cache, or `None` if results are not cached.
+    """
+    if RESULT_CACHE_ENV not in _RESULT_CACHE:
+        path = os.environ.get(RESULT_CACHE_ENV)
+        _RESULT_CACHE[RESULT_CACHE_ENV] = ResultCache(disk=DiskCache(path)) if path else None
+
+    return _RESULT_CACHE[RESULT_CACHE_ENV]
+
+
+def set_result_cache(cache: Optional[ResultCache]) -> Optional[ResultCache]:
+    """Replace the featurizer result cache.
+
+    If the new cache has a persistent store, its path is also exported to the
+    `CHEMCAPTION_RESULT_CACHE` environment variable.
+
+    Args:
+        cache (Optional[ResultCache]): New result cache. `None` disables result caching.
+
+    Returns:
+        Optional[ResultCache]: Previous result cache.
+    """
+    if cache is not None and not isinstance(cache, ResultCache):
+        raise ValueError("`cache` must be of type `ResultCache` or `None`.")
+
+    previous = get_result_cache()
+    _RESULT_CACHE[RESULT_CACHE_ENV] = cache
+
+    if cache is None or cache.disk is None:
+        os.environ.pop(RESULT_CACHE_ENV, None)
+    else:
+        os.environ[RESULT_CACHE_ENV] = cache.disk.path
+
+    return previous
+
+
+"""Per-process registries."""
+
+_REGISTRY_SIZE = 128
+
+_XTB_SESSIONS: "OrderedDict[str, XTBSession]" = OrderedDict()
+_SASA_INSTANCES: "OrderedDict[str, Any]" = OrderedDict()
+
+
+def _lookup(registry: "OrderedDict[str, Any]", key: str, factory: Callable[[], Any]) -> Any:
+    """Return entry of a least-recently-used registry, creating it if needed.
+
+    Args:
+        registry (OrderedDict[str, Any]): Registry.
+        key (str): Key of entry.
+        factory (Callable[[], Any]): Function creating the entry.
+
+    Returns:
+        Any: Registry entry.
+    """
+    if key in registry:
+        registry.move_to_end(key)
+        return registry[key]
+
+    entry = registry[key] = factory()
+    if len(registry) > _REGISTRY_SIZE:
+        registry.popitem(last=False)
+
+    return entry
+
+
+def get_xtb_session(
+    elements: Sequence[str],
+    coordinates: np.array,
+    method: Union[int, str] = 2,
+    charge: int = 0,
+) -> XTBSession:
+    """Return xTB session shared by all featurizers of the current process.
+
+    Sessions are keyed by geometry, method and charge. The most recently used sessions are kept.
+
+    Args:
+        elements (Sequence[str]): Element symbols.
+        coordinates (np.array): Atomic coordinates.
+        method (Union[int, str]): xTB method. Defaults to `2`.
+        charge (int): Molecular charge. Defaults to `0`.
+
+    Returns:
+        XTBSession: xTB session.
+    """
+    session = XTBSession(elements, coordinates, method=method, charge=charge)
+    return _lookup(_XTB_SESSIONS, session.key, lambda: session)
+
+
+def get_sasa(elements: Sequence[str], coordinates: np.array, **kwargs):
+    """Return morfeus SASA instance shared by all featurizers of the current process.
+
+    Instances are keyed by geometry and SASA parameters, so total and per-atom areas and
+    volumes are computed once per molecule and parameter set. The most recently used
+    instances are kept.
+
+    Args:
+        elements (Sequence[str]): Element symbols.
+        coordinates (np.array): Atomic coordinates.
+        **kwargs (Any): Keyword arguments to `morfeus.SASA`.
+
+    Returns:
+        SASA: morfeus SASA instance. Shared between callers and must not be modified.
+    """
+    from morfeus import SASA
+
+    key = cache_key("sasa", geometry_key(elements, coordinates), dict(kwargs))
+    return _lookup(_SASA_INSTANCES, key, lambda: SASA(elements, coordinates, **kwargs))
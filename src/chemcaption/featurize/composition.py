@@ -3,12 +3,14 @@
 """Featurizers describing the composition of a molecule."""
 
 from collections import Counter
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from rdkit.Chem import Descriptors
 
 from chemcaption.featurize.base import PERIODIC_TABLE, AbstractFeaturizer
+from chemcaption.featurize.schema import FeatureSchema
 from chemcaption.featurize.utils import join_list_elements
 from chemcaption.molecules import Molecule
 
@@ -26,10 +28,84 @@ __all__ = [
     "DegreeOfUnsaturationFeaturizer",
 ]
 
+"""Composition kernel.
+
+Element featurizers share one atomic-number histogram per molecule, from which counts, masses and
+proportions are derived for any preset by column selection.
+"""
+
+_MAX_ATOMIC_NUMBER = 118
+
+# Histogram width; the last column is never populated and absorbs unknown preset elements.
+_HISTOGRAM_WIDTH = _MAX_ATOMIC_NUMBER + 2
+
+_ATOMIC_WEIGHTS = np.array(
+    [PERIODIC_TABLE.GetAtomicWeight(i) for i in range(_MAX_ATOMIC_NUMBER + 1)] + [0.0]
+)
+
+
+@lru_cache(maxsize=1)
+def _element_lookup() -> Dict[str, int]:
+    """Return mapping from element names and symbols to atomic numbers.
+
+    Args:
+        None.
+
+    Returns:
+        Dict[str, int]: Atomic number per element name (e.g., `Carbon`) and symbol (e.g., `C`).
+    """
+    lookup = {}
+    for atomic_number in range(1, _MAX_ATOMIC_NUMBER + 1):
+        lookup[PERIODIC_TABLE.GetElementName(atomic_number).capitalize()] = atomic_number
+        lookup[PERIODIC_TABLE.GetElementSymbol(atomic_number)] = atomic_number
+    return lookup
+
+
+@lru_cache(maxsize=64)
+def _preset_columns(preset: Tuple[str, ...]) -> np.array:
+    """Return histogram columns for the elements in a preset.
+
+    Args:
+        preset (Tuple[str, ...]): Element names or symbols.
+
+    Returns:
+        np.array: Atomic number per element. Unknown elements map to an always-empty column.
+    """
+    lookup = _element_lookup()
+    return np.array([lookup.get(element, _HISTOGRAM_WIDTH - 1) for element in preset], dtype=int)
+
+
+def _element_histograms(molecules: Sequence[Molecule]) -> np.array:
+    """Return atomic-number histograms for a sequence of molecules, including hydrogen atoms.
+
+    All molecules are binned in a single `np.bincount` call.
+
+    Args:
+        molecules (Sequence[Molecule]): Molecular representations.
+
+    Returns:
+        np.array: Integer array of shape (molecules, 120). Entry (i, z) is the number of atoms with
+            atomic number `z` in molecule `i`.
+    """
+    atomic_numbers = [molecule.get_atomic_numbers(hydrogen=True) for molecule in molecules]
+    if not atomic_numbers:
+        return np.zeros((0, _HISTOGRAM_WIDTH), dtype=int)
+
+    rows = np.repeat(np.arange(len(atomic_numbers)), [len(item) for item in atomic_numbers])
+    bins = rows * _HISTOGRAM_WIDTH + np.concatenate(atomic_numbers)
+
+    return np.bincount(bins, minlength=len(atomic_numbers) * _HISTOGRAM_WIDTH).reshape(
+        (len(atomic_numbers), _HISTOGRAM_WIDTH)
+    )
+
 
 class MolecularFormulaFeaturizer(AbstractFeaturizer):
     """Get the molecular formula of a molecule."""
 
+    cost = "cheap"
+
+    numeric = False
+
     def __init__(self):
         """Initialize class."""
         super().__init__()
@@ -80,6 +156,8 @@ class MolecularFormulaFeaturizer(AbstractFeaturizer):
 class MolecularMassFeaturizer(AbstractFeaturizer):
     """Get the molecular mass of a molecule."""
 
+    cost = "cheap"
+
     def __init__(self):
         """Get the molecular mass of a molecule."""
         super().__init__()
@@ -105,6 +183,17 @@ class MolecularMassFeaturizer(AbstractFeaturizer):
         """
         return ["molecular_mass"]
 
+    def _featurize_values(self, molecule: Molecule) -> float:
+        """Return the raw feature value for a molecule instance.
+
+        Args:
+            molecule (Molecule): Molecular representation.
+
+        Returns:
+            float: Molecular mass of `molecule`.
+        """
+        return Descriptors.MolWt(molecule.rdkit_mol)
+
     def featurize(
         self,
         molecule: Molecule,
@@ -118,8 +207,7 @@ class MolecularMassFeaturizer(AbstractFeaturizer):
         Returns:
             float: Molecular mass of `molecule`.
         """
-        molar_mass = Descriptors.MolWt(molecule.rdkit_mol)
-        return np.array([molar_mass]).reshape((1, -1))
+        return np.array([self._featurize_values(molecule)]).reshape((1, -1))
 
     def implementors(self) -> List[str]:
         """
@@ -137,6 +225,8 @@ class MolecularMassFeaturizer(AbstractFeaturizer):
 class MonoisotopicMolecularMassFeaturizer(AbstractFeaturizer):
     """Get the monoisotopic molecular mass of a molecule."""
 
+    cost = "cheap"
+
     def __init__(self):
         """Instantiate instance."""
         super().__init__()
@@ -162,6 +252,17 @@ class MonoisotopicMolecularMassFeaturizer(AbstractFeaturizer):
         """
         return ["monoisotopic_molecular_mass"]
 
+    def _featurize_values(self, molecule: Molecule) -> float:
+        """Return the raw feature value for a molecule instance.
+
+        Args:
+            molecule (Molecule): Molecular representation.
+
+        Returns:
+            float: Monoisotopic molecular mass of `molecule`.
+        """
+        return Descriptors.ExactMolWt(molecule.rdkit_mol)
+
     def featurize(
         self,
         molecule: Molecule,
@@ -175,8 +276,7 @@ class MonoisotopicMolecularMassFeaturizer(AbstractFeaturizer):
         Returns:
             float: Monoisotopic molecular mass of `molecule`.
         """
-        monoisotopic_molar_mass = Descriptors.ExactMolWt(molecule.rdkit_mol)
-        return np.array([monoisotopic_molar_mass]).reshape((1, -1))
+        return np.array([self._featurize_values(molecule)]).reshape((1, -1))
 
     def implementors(self) -> List[str]:
         """
@@ -194,6 +294,8 @@ class MonoisotopicMolecularMassFeaturizer(AbstractFeaturizer):
 class ElementMassFeaturizer(AbstractFeaturizer):
     """Obtain mass for elements in a molecule."""
 
+    cost = "cheap"
+
     def __init__(self, preset: Optional[Union[List[str], Dict[str, str]]] = None):
         """Get the total mass component of an element in a molecule.
 
@@ -271,14 +373,8 @@ class ElementMassFeaturizer(AbstractFeaturizer):
         Returns:
             ElementMassFeaturizer: Instance of self with updated state.
         """
-        if isinstance(molecules, list):
-            unique_elements = set()
-            for molecule in molecules:
-                unique_elements.update(set(self._get_unique_elements(molecule)))
-        else:
-            unique_elements = set(self._get_unique_elements(molecules))
-
-        self.preset = list(unique_elements)
+        molecules = molecules if isinstance(molecules, list) else [molecules]
+        self.preset = list(FeatureSchema.fit(molecules).elements)
 
         return self
 
@@ -294,51 +390,31 @@ class ElementMassFeaturizer(AbstractFeaturizer):
         Returns:
             float: Total mass accounted for by `element` in `molecule`.
         """
-        if len(element) > 2:
-            element_mass = [
-                PERIODIC_TABLE.GetAtomicWeight(atom.GetAtomicNum())
-                for atom in molecule.get_atoms(True)
-                if PERIODIC_TABLE.GetElementName(atom.GetAtomicNum()) == element
-            ]
-        else:
-            element_mass = [
-                PERIODIC_TABLE.GetAtomicWeight(atom.GetAtomicNum())
-                for atom in molecule.get_atoms(True)
-                if PERIODIC_TABLE.GetElementSymbol(atom.GetAtomicNum()) == element
-            ]
-        return sum(element_mass)
+        column = _preset_columns((element,))[0]
+        return float(_element_histograms([molecule])[0, column] * _ATOMIC_WEIGHTS[column])
 
-    def _get_profile(self, molecule: Molecule) -> List:
-        """Generate molecular profile based of preset attribute.
+    def _get_element_counts(self, histograms: np.array) -> np.array:
+        """Select preset element counts from atomic-number histograms.
 
         Args:
-            molecule (Molecule): Molecular representation instance.
+            histograms (np.array): Atomic-number histograms, one row per molecule.
 
         Returns:
-            List: List of elemental masses.
+            np.array: Atom counts of shape (molecules, elements in preset).
         """
-        element_masses = [
-            self._get_element_mass(element=element, molecule=molecule) for element in self.preset
-        ]
+        return histograms[:, _preset_columns(tuple(self.preset))]
 
-        return element_masses
-
-    @staticmethod
-    def _get_unique_elements(molecule: Molecule) -> List[str]:
-        """
-        Get unique elements that make up a molecule.
+    def _featurize_histograms(self, histograms: np.array) -> np.array:
+        """Derive features from atomic-number histograms.
 
         Args:
-            molecule (Molecule): Molecular representation.
+            histograms (np.array): Atomic-number histograms, one row per molecule.
 
         Returns:
-            List[str]: Unique list of element_names or element_symbols in `molecule`.
+            np.array: Elemental masses of shape (molecules, elements in preset).
         """
-        unique_elements = [
-            PERIODIC_TABLE.GetElementName(atom.GetAtomicNum()).capitalize()
-            for atom in set(molecule.get_atoms(True))
-        ]
-        return unique_elements
+        atomic_weights = _ATOMIC_WEIGHTS[_preset_columns(tuple(self.preset))]
+        return self._get_element_counts(histograms) * atomic_weights
 
     def featurize(self, molecule: Molecule) -> np.array:
         """
@@ -350,7 +426,18 @@ class ElementMassFeaturizer(AbstractFeaturizer):
         Returns:
             np.array: Molecular contribution by mass for elements in molecule.
         """
-        return np.array(self._get_profile(molecule=molecule)).reshape((1, -1))
+        return self._featurize_histograms(_element_histograms([molecule]))
+
+    def featurize_blocks(self, molecules: List[Molecule]) -> List[np.array]:
+        """Featurize a sequence of Molecule objects from a single batch of histograms.
+
+        Args:
+            molecules (List[Molecule]): A sequence of molecule representations.
+
+        Returns:
+            List[np.array]: List containing a (molecules x elements) feature matrix.
+        """
+        return [self._featurize_histograms(_element_histograms(molecules))]
 
     def implementors(self) -> List[str]:
         """
@@ -400,18 +487,17 @@ class ElementMassProportionFeaturizer(ElementMassFeaturizer):
         """
         return [self.prefix + element.lower() + self.suffix for element in self.preset]
 
-    def featurize(self, molecule: Molecule) -> np.array:
-        """
-        Featurize single molecule instance. Get the total mass proportion for elements in a molecule.
+    def _featurize_histograms(self, histograms: np.array) -> np.array:
+        """Derive features from atomic-number histograms.
 
         Args:
-            molecule (Molecule): Molecular representation.
+            histograms (np.array): Atomic-number histograms, one row per molecule.
 
         Returns:
-            np.array: Molecular proportional contribution by mass for elements in molecule.
+            np.array: Molecular proportional contribution by mass for elements in preset.
         """
-        molar_mass = Descriptors.MolWt(molecule.rdkit_mol)
-        return np.array(self._get_profile(molecule=molecule)).reshape((1, -1)) / molar_mass
+        molar_masses = histograms @ _ATOMIC_WEIGHTS
+        return super()._featurize_histograms(histograms) / molar_masses.reshape((-1, 1))
 
     def implementors(self) -> List[str]:
         """
@@ -470,43 +556,18 @@ class ElementCountFeaturizer(ElementMassFeaturizer):
         Returns:
             int: Number of atoms of element in molecule.
         """
+        return int(_element_histograms([molecule])[0, _preset_columns((element,))[0]])
 
-        atom_count = []
-
-        for atom in molecule.get_atoms():
-            if PERIODIC_TABLE.GetElementName(atom.GetAtomicNum()) == element:
-                atom_count.append(atom)
-            if PERIODIC_TABLE.GetElementSymbol(atom.GetAtomicNum()) == element:
-                atom_count.append(atom)
-
-        return len(atom_count)
-
-    def _get_profile(self, molecule: Molecule) -> List:
-        """Generate number of atoms per element based of preset attribute.
-
-        Args:
-            molecule (Molecule): Molecular representation instance.
-
-        Returns:
-            List: List of elemental atom counts.
-        """
-        atom_counts = [
-            self._get_atom_count(element=element, molecule=molecule) for element in self.preset
-        ]
-
-        return atom_counts
-
-    def featurize(self, molecule: Molecule) -> np.array:
-        """
-        Featurize single molecule instance. Get the atom count for elements in a molecule.
+    def _featurize_histograms(self, histograms: np.array) -> np.array:
+        """Derive features from atomic-number histograms.
 
         Args:
-            molecule (Molecule): Molecular representation.
+            histograms (np.array): Atomic-number histograms, one row per molecule.
 
         Returns:
-            np.array: Molecular contribution by atom count for elements in molecule.
+            np.array: Atom counts of shape (molecules, elements in preset).
         """
-        return np.array([self._get_profile(molecule=molecule)]).reshape((1, -1))
+        return self._get_element_counts(histograms)
 
     def implementors(self) -> List[str]:
         """
@@ -558,18 +619,17 @@ class ElementCountProportionFeaturizer(ElementCountFeaturizer):
         """
         return [element.lower() + "_atom_ratio" for element in self.preset]
 
-    def featurize(self, molecule: Molecule) -> np.array:
-        """
-        Featurize single molecule instance. Get the atom count proportion for elements in a molecule.
+    def _featurize_histograms(self, histograms: np.array) -> np.array:
+        """Derive features from atomic-number histograms.
 
         Args:
-            molecule (Molecule): Molecular representation.
+            histograms (np.array): Atomic-number histograms, one row per molecule.
 
         Returns:
-            np.array: Molecular proportional contribution by atom count for elements in molecule.
+            np.array: Molecular proportional contribution by atom count for elements in preset.
         """
-        num_atoms = len(molecule.get_atoms(hydrogen=True))
-        return np.array(self._get_profile(molecule=molecule)).reshape((1, -1)) / num_atoms
+        num_atoms = histograms.sum(axis=1, keepdims=True)
+        return self._get_element_counts(histograms) / num_atoms
 
     def implementors(self) -> List[str]:
         """
@@ -620,17 +680,16 @@ class AtomCountFeaturizer(ElementCountFeaturizer):
         """
         return ["num_atoms"]
 
-    def featurize(self, molecule: Molecule) -> np.array:
-        """
-        Featurize single molecule instance. Get the atom count proportion for elements in a molecule.
+    def _featurize_histograms(self, histograms: np.array) -> np.array:
+        """Derive features from atomic-number histograms.
 
         Args:
-            molecule (Molecule): Molecular representation.
+            histograms (np.array): Atomic-number histograms, one row per molecule.
 
         Returns:
-            np.array: Number of atoms in `molecule`.
+            np.array: Number of atoms per molecule.
         """
-        return np.array([len(molecule.get_atoms(hydrogen=True))]).reshape((1, -1))
+        return histograms.sum(axis=1, keepdims=True)
 
     def implementors(self) -> List[str]:
         """
@@ -648,6 +707,8 @@ class AtomCountFeaturizer(ElementCountFeaturizer):
 class DegreeOfUnsaturationFeaturizer(AbstractFeaturizer):
     """Return the degree of unsaturation."""
 
+    cost = "cheap"
+
     def __init__(self):
         """Instantiate class.
 
@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+
+"""Batched conformer generation with per-molecule time and attempt budgets."""
+
+import multiprocessing
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from rdkit import Chem
+
+from chemcaption.featurize.cache import cache_key, get_conformer_cache
+
+# Implemented conformer generation utilities
+
+__all__ = [
+    "FALLBACK_KWARGS",  # Cheaper conformer generation settings tried on failure
+    "ConformerFailure",  # Failure manifest entry.
+    "ConformerBatch",  # Conformers and failures of a batch.
+    "ConformerService",  # Batched conformer generation.
+    "get_conformer_service",  # Helper function
+    "set_conformer_service",  # Helper function
+]
+
+"""Conformer generation settings."""
+
+# Overrides of the requested generation kwargs, one per attempt. Later attempts are cheaper.
+FALLBACK_KWARGS: Tuple[Dict[str, Any], ...] = (
+    {},
+    {"use_etkdg": True, "num_samples": 50},
+    {"use_etkdg": True, "num_samples": 5, "ff": "uff"},
+)
+
+# Store coordinates at full precision, so cached conformers match freshly generated ones.
+_CONFORMER_PICKLE_OPTIONS = (
+    Chem.PropertyPickleOptions.AllProps | Chem.PropertyPickleOptions.CoordsAsDouble
+)
+
+_MEMO_SIZE = 256
+
+
+def _embed(smiles: str, kwargs: Mapping[str, Any]) -> Chem.Mol:
+    """Generate conformers for a molecule with givemeconformer.
+
+    Args:
+        smiles (str): SMILES string.
+        kwargs (Mapping[str, Any]): Keyword arguments for conformer generation.
+
+    Returns:
+        Chem.Mol: Molecule embedded with conformers.
+    """
+    from givemeconformer.api import _get_conformer
+
+    mol, conformers = _get_conformer(smiles=smiles, **kwargs)
+    for conf in conformers.keys():
+        mol.AddConformer(mol.GetConformer(conf))
+    return mol
+
+
+def _run_attempt(connection: Connection, smiles: str, kwargs: Mapping[str, Any]) -> None:
+    """Generate conformers in a child process and send the outcome through `connection`.
+
+    Args:
+        connection (Connection): Sending end of a pipe to the parent process.
+        smiles (str): SMILES string.
+        kwargs (Mapping[str, Any]): Keyword arguments for conformer generation.
+
+    Returns:
+        None.
+    """
+    try:
+        mol = _embed(smiles, kwargs)
+        connection.send(("ok", mol.ToBinary(_CONFORMER_PICKLE_OPTIONS)))
+    except Exception as exception:
+        connection.send(("error", f"{type(exception).__name__}: {exception}"))
+    finally:
+        connection.close()
+
+
+@dataclass(frozen=True)
+class ConformerFailure:
+    """Molecule for which no conformer could be generated within budget."""
+
+    smiles: str
+    attempts: int
+    reason: str
+
+
+@dataclass
+class ConformerBatch:
+    """Outcome of batched conformer generation."""
+
+    conformers: Dict[str, Chem.Mol] = field(default_factory=dict)
+    failures: List[ConformerFailure] = field(default_factory=list)
+
+
+class ConformerService:
+    """Generate conformers for batches of molecules across worker processes.
+
+    Every attempt runs in its own child process, which is killed once the molecule's wall-clock
+    budget is spent, so a single pathological molecule cannot stall a batch. Failed attempts are
+    retried with the cheaper settings in `FALLBACK_KWARGS`. Results are memoized in-process and,
+    if a persistent conformer cache is configured, stored on disk.
+    """
+
+    def __init__(
+        self,
+        n_jobs: Optional[int] = None,
+        timeout: Optional[float] = 300.0,
+        max_attempts: int = len(FALLBACK_KWARGS),
+    ):
+        """Instantiate class.
+
+        Args:
+            n_jobs (Optional[int]): Number of concurrent worker processes. Defaults to `None`,
+                i.e., the number of CPUs.
+            timeout (Optional[float]): Wall-clock budget per molecule in seconds, shared by all attempts.
+                Defaults to `300.0`. If `None`, attempts are not timed out.
+            max_attempts (int): Maximum number of attempts per molecule. Defaults to the number of
+                settings in `FALLBACK_KWARGS`.
+        """
+        if n_jobs is not None and n_jobs < 1:
+            raise ValueError("`n_jobs` must be a positive integer.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("`timeout` must be positive.")
+        if not 1 <= max_attempts <= len(FALLBACK_KWARGS):
+            raise ValueError(f"`max_attempts` must be between 1 and {len(FALLBACK_KWARGS)}.")
+
+        self.n_jobs = n_jobs
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+
+        self._memo: "OrderedDict[str, Chem.Mol]" = OrderedDict()
+        self._failures: Dict[str, ConformerFailure] = {}
+
+    def __repr__(self) -> str:
+        """Return string representation of service.
+
+        Args:
+            None.
+
+        Returns:
+            str: String representation of service.
+        """
+        return (
+            f"{self.__class__.__name__}(n_jobs={self.n_jobs}, timeout={self.timeout}, "
+            f"max_attempts={self.max_attempts})"
+        )
+
+    @property
+    def num_workers(self) -> int:
+        """Return number of worker processes.
+
+        Args:
+            None.
+
+        Returns:
+            int: Number of concurrent worker processes.
+        """
+        return self.n_jobs or os.cpu_count() or 1
+
+    @staticmethod
+    def _attempt_kwargs(kwargs: Mapping[str, Any], attempt: int) -> Dict[str, Any]:
+        """Return conformer generation settings for an attempt.
+
+        Args:
+            kwargs (Mapping[str, Any]): Requested keyword arguments for conformer generation.
+            attempt (int): Zero-based attempt number.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for conformer generation.
+        """
+        overrides = dict(FALLBACK_KWARGS[attempt])
+        if "num_samples" in overrides:
+            # Fallbacks never sample more than requested
+            overrides["num_samples"] = min(overrides["num_samples"], kwargs.get("num_samples", 1000))
+        return {**kwargs, **overrides}
+
+    def generate(
+        self, smiles: Sequence[str], kwargs: Optional[Mapping[str, Any]] = None
+    ) -> ConformerBatch:
+        """Generate conformers for a batch of molecules.
+
+        Args:
+            smiles (Sequence[str]): SMILES strings.
+            kwargs (Optional[Mapping[str, Any]]): Keyword arguments for conformer generation.
+                Defaults to `None`.
+
+        Returns:
+            ConformerBatch: Conformers keyed by SMILES string, and failures.
+        """
+        kwargs = dict(kwargs or {})
+        cache = get_conformer_cache()
+        batch = ConformerBatch()
+
+        keys = {}
+        for item in dict.fromkeys(smiles):
+            key = cache_key("conformer", item, kwargs)
+
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                batch.conformers[item] = self._memo[key]
+            elif key in self._failures:
+                batch.failures.append(self._failures[key])
+            elif Chem.MolFromSmiles(item) is None:
+                # Retrying cannot fix invalid input
+                self._failures[key] = ConformerFailure(item, 0, "invalid SMILES")
+                batch.failures.append(self._failures[key])
+            else:
+                value = cache.get(key) if cache is not None else None
+                if value is not None:
+                    batch.conformers[item] = self._remember(key, Chem.Mol(value))
+                else:
+                    keys[item] = key
+
+        for item, mol, failure in self._run(list(keys), kwargs):
+            if mol is not None:
+                if cache is not None:
+                    cache.set(keys[item], mol.ToBinary(_CONFORMER_PICKLE_OPTIONS))
+                batch.conformers[item] = self._remember(keys[item], mol)
+            else:
+                self._failures[keys[item]] = failure
+                batch.failures.append(failure)
+
+        return batch
+
+    def get(self, smiles: str, kwargs: Optional[Mapping[str, Any]] = None) -> Chem.Mol:
+        """Return molecule embedded with conformers.
+
+        Args:
+            smiles (str): SMILES string.
+            kwargs (Optional[Mapping[str, Any]]): Keyword arguments for conformer generation.
+                Defaults to `None`.
+
+        Returns:
+            Chem.Mol: Molecule embedded with conformers.
+
+        Raises:
+            RuntimeError: If no conformer could be generated within budget.
+        """
+        batch = self.generate([smiles], kwargs)
+        if batch.failures:
+            failure = batch.failures[0]
+            raise RuntimeError(
+                f"Conformer generation failed for '{smiles}' after {failure.attempts} attempt(s): "
+                f"{failure.reason}"
+            )
+        return batch.conformers[smiles]
+
+    def _remember(self, key: str, mol: Chem.Mol) -> Chem.Mol:
+        """Memoize generated molecule in-process.
+
+        Args:
+            key (str): Cache key.
+            mol (Chem.Mol): Molecule embedded with conformers.
+
+        Returns:
+            Chem.Mol: `mol`.
+        """
+        self._memo[key] = mol
+        if len(self._memo) > _MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return mol
+
+    def _run(
+        self, smiles: List[str], kwargs: Dict[str, Any]
+    ) -> List[Tuple[str, Optional[Chem.Mol], Optional[ConformerFailure]]]:
+        """Generate conformers, trying cheaper settings on failure.
+
+        Args:
+            smiles (List[str]): Unique SMILES strings.
+            kwargs (Dict[str, Any]): Requested keyword arguments for conformer generation.
+
+        Returns:
+            List[Tuple[str, Optional[Chem.Mol], Optional[ConformerFailure]]]: Per molecule, either the
+                molecule embedded with conformers or the failure.
+        """
+        if not smiles:
+            return []
+
+        # Daemonic processes (e.g., `multiprocessing.Pool` workers) cannot start children.
+        if (self.timeout is None and self.num_workers == 1) or multiprocessing.current_process().daemon:
+            return [self._run_in_process(item, kwargs) for item in smiles]
+
+        return self._run_in_children(smiles, kwargs)
+
+    def _run_in_process(
+        self, smiles: str, kwargs: Dict[str, Any]
+    ) -> Tuple[str, Optional[Chem.Mol], Optional[ConformerFailure]]:
+        """Generate conformers in the current process, without time budget.
+
+        Args:
+            smiles (str): SMILES string.
+            kwargs (Dict[str, Any]): Requested keyword arguments for conformer generation.
+
+        Returns:
+            Tuple[str, Optional[Chem.Mol], Optional[ConformerFailure]]: Molecule embedded with
+                conformers or failure.
+        """
+        errors = []
+        for attempt in range(self.max_attempts):
+            try:
+                return smiles, _embed(smiles, self._attempt_kwargs(kwargs, attempt)), None
+            except Exception as exception:
+                errors.append(f"{type(exception).__name__}: {exception}")
+
+        return smiles, None, ConformerFailure(smiles, self.max_attempts, "; ".join(errors))
+
+    def _run_in_children(
+        self, smiles: List[str], kwargs: Dict[str, Any]
+    ) -> List[Tuple[str, Optional[Chem.Mol], Optional[ConformerFailure]]]:
+        """Generate conformers in child processes, killing attempts which exceed their budget.
+
+        The remaining budget of a molecule is split evenly among its remaining attempts, so that
+        a hanging attempt leaves time for the cheaper fallbacks.
+
+        Args:
+            smiles (List[str]): Unique SMILES strings.
+            kwargs (Dict[str, Any]): Requested keyword arguments for conformer generation.
+
+        Returns:
+            List[Tuple[str, Optional[Chem.Mol], Optional[ConformerFailure]]]: Per molecule, either the
+                molecule embedded with conformers or the failure.
+        """
+        context = multiprocessing.get_context()
+
+        queue = deque((item, 0) for item in smiles)
+        budgets = {item: self.timeout for item in smiles}
+        errors: Dict[str, List[str]] = {item: [] for item in smiles}
+
+        running: Dict[Connection, Tuple[Any, str, int, float, Optional[float]]] = {}
+        results = []
+
+        try:
+            while queue or running:
+                while queue and len(running) < self.num_workers:
+                    item, attempt = queue.popleft()
+                    receiver, sender = context.Pipe(duplex=False)
+                    process = context.Process(
+                        target=_run_attempt,
+                        args=(sender, item, self._attempt_kwargs(kwargs, attempt)),
+                        daemon=True,
+                    )
+                    process.start()
+                    sender.close()
+
+                    started = time.monotonic()
+                    deadline = (
+                        None
+                        if budgets[item] is None
+                        else started + budgets[item] / (self.max_attempts - attempt)
+                    )
+                    running[receiver] = (process, item, attempt, started, deadline)
+
+                deadlines = [entry[-1] for entry in running.values() if entry[-1] is not None]
+                wait_time = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                ready = wait(list(running), timeout=wait_time)
+                now = time.monotonic()
+
+                for receiver in list(running):
+                    process, item, attempt, started, deadline = running[receiver]
+
+                    if receiver in ready:
+                        try:
+                            status, payload = receiver.recv()
+                        except EOFError:
+                            process.join()
+                            status, payload = "error", f"worker exited with code {process.exitcode}"
+                    elif deadline is not None and now >= deadline:
+                        process.kill()
+                        status, payload = "error", f"timed out after {now - started:.1f} s"
+                    else:
+                        continue
+
+                    del running[receiver]
+                    receiver.close()
+                    process.join()
+
+                    if status == "ok":
+                        results.append((item, Chem.Mol(payload), None))
+                        continue
+
+                    errors[item].append(payload)
+                    if budgets[item] is not None:
+                        budgets[item] -= now - started
+
+                    if attempt + 1 < self.max_attempts and (
+                        budgets[item] is None or budgets[item] > 0
+                    ):
+                        queue.append((item, attempt + 1))
+                    else:
+                        failure = ConformerFailure(item, attempt + 1, "; ".join(errors[item]))
+                        results.append((item, None, failure))
+        finally:
+            for process, *_ in running.values():
+                process.kill()
+                process.join()
+
+        return results
+
+
+"""Default service."""
+
+_DEFAULT_SERVICE = ConformerService()
+
+
+def get_conformer_service() -> ConformerService:
+    """Return the conformer generation service shared by featurizers.
+
+    Args:
+        None.
+
+    Returns:
+        ConformerService: Default conformer generation service.
+    """
+    return _DEFAULT_SERVICE
+
+
+def set_conformer_service(service: ConformerService) -> ConformerService:
+    """Replace the conformer generation service shared by featurizers.
+
+    Args:
+        service (ConformerService): New default service.
+
+    Returns:
+        ConformerService: Previous default service.
+    """
+    global _DEFAULT_SERVICE
+
+    if not isinstance(service, ConformerService):
+        raise ValueError("`service` must be of type `ConformerService`.")
+
+    previous, _DEFAULT_SERVICE = _DEFAULT_SERVICE, service
+    return previous
@@ -2,7 +2,7 @@
 
 """Featurizers for charge-, proton- and electron-related molecular information."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from rdkit.Chem import Descriptors, rdMolDescriptors
@@ -35,6 +35,8 @@ __all__ = [
 class HydrogenAcceptorCountFeaturizer(AbstractFeaturizer):
     """Obtain number of Hydrogen bond acceptors in a molecule."""
 
+    cost = "cheap"
+
     def __init__(self):
         """Get the number of Hydrogen bond acceptors present in a molecule."""
         super().__init__()
@@ -57,6 +59,17 @@ class HydrogenAcceptorCountFeaturizer(AbstractFeaturizer):
         """
         return ["num_hydrogen_bond_acceptors"]
 
+    def _featurize_values(self, molecule: Molecule) -> int:
+        """Return the raw feature value for a molecule instance.
+
+        Args:
+            molecule (Molecule): Molecular representation.
+
+        Returns:
+            int: Number of Hydrogen bond acceptors present in `molecule`.
+        """
+        return rdMolDescriptors.CalcNumHBA(molecule.reveal_hydrogens())
+
     def featurize(self, molecule: Molecule) -> np.array:
         """
         Featurize single molecule instance. Get the number of Hydrogen bond acceptors present in a molecule.
@@ -67,7 +80,7 @@ class HydrogenAcceptorCountFeaturizer(AbstractFeaturizer):
         Returns:
             np.array: Number of Hydrogen bond acceptors present in `molecule`.
         """
-        return np.array([rdMolDescriptors.CalcNumHBA(molecule.reveal_hydrogens())]).reshape((1, -1))
+        return np.array([self._featurize_values(molecule)]).reshape((1, -1))
 
     def implementors(self) -> List[str]:
         """
@@ -88,6 +101,8 @@ class HydrogenAcceptorCountFeaturizer(AbstractFeaturizer):
 class HydrogenDonorCountFeaturizer(AbstractFeaturizer):
     """Obtain number of Hydrogen bond donors in a molecule."""
 
+    cost = "cheap"
+
     def __init__(self):
         """Get the number of Hydrogen bond donors present in a molecule."""
         super().__init__()
@@ -110,6 +125,17 @@ class HydrogenDonorCountFeaturizer(AbstractFeaturizer):
         """
         return ["num_hydrogen_bond_donors"]
 
+    def _featurize_values(self, molecule: Molecule) -> int:
+        """Return the raw feature value for a molecule instance.
+
+        Args:
+            molecule (Molecule): Molecular representation.
+
+        Returns:
+            int: Number of Hydrogen bond donors present in `molecule`.
+        """
+        return rdMolDescriptors.CalcNumHBD(molecule.reveal_hydrogens())
+
     def featurize(self, molecule: Molecule) -> np.array:
         """
         Featurize single molecule instance. Get the number of Hydrogen bond donors present in a molecule.
@@ -120,7 +146,7 @@ class HydrogenDonorCountFeaturizer(AbstractFeaturizer):
         Returns:
             np.array: Number of Hydrogen bond donors present in `molecule`.
         """
-        return np.array([rdMolDescriptors.CalcNumHBD(molecule.reveal_hydrogens())]).reshape((1, -1))
+        return np.array([self._featurize_values(molecule)]).reshape((1, -1))
 
     def implementors(self) -> List[str]:
         """
@@ -141,6 +167,8 @@ class HydrogenDonorCountFeaturizer(AbstractFeaturizer):
 class ValenceElectronCountFeaturizer(AbstractFeaturizer):
     """A featurizer for extracting valence electron count."""
 
+    cost = "cheap"
+
     def __init__(self):
         """Initialize class.
 
@@ -473,6 +501,8 @@ class LUMOEnergyFeaturizer(MorfeusFeaturizer):
 class AtomChargeFeaturizer(MorfeusFeaturizer):
     """Return the charges for atoms in molecules."""
 
+    schema_field = "max_atoms"
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -507,61 +537,33 @@ class AtomChargeFeaturizer(MorfeusFeaturizer):
 
         self.max_index = max_index
 
-    def featurize(self, molecule: Molecule) -> np.array:
-        """
-        Featurize single molecule instance. Returns charges for atoms in molecules.
+    def featurize_atoms(self, molecule: Molecule) -> Tuple[np.array, np.array]:
+        """Featurize single molecule instance atom by atom, without padding or aggregation.
 
         Args:
             molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): Array containing charges for atoms in molecule instance.
+            Tuple[np.array, np.array]: Per-atom charges and atomic numbers, ordered by atom index.
         """
         if self.qc_optimize:
             molecule = self._generate_conformer(molecule=molecule)
 
         morfeus_instance = self._get_morfeus_instance(molecule=molecule, morpheus_instance="xtb")
+        values = self._atom_values(morfeus_instance.get_charges())
 
-        atom_charges = morfeus_instance.get_charges()
-        num_atoms = len(atom_charges)
-
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecule)
-
-        atom_charges = [
-            (atom_charges[i] if i <= num_atoms else 0) for i in range(1, self.max_index + 1)
-        ]
-
-        if self.aggregation is None:
-            # Track atom identities
-            atomic_numbers = self._track_atom_identity(molecule=molecule, max_index=self.max_index)
+        return values, molecule.get_atomic_numbers(hydrogen=True)
 
-            # Combine descriptors with atom identities
-            atom_charges = atom_charges + atomic_numbers
-        else:
-            if isinstance(self.aggregation, (list, set, tuple)):
-                atom_charges = [
-                    self.aggregation_func[agg](atom_charges) for agg in self.aggregation
-                ]
-            else:
-                atom_charges = self.aggregation_func[self.aggregation](atom_charges)
-
-        return np.array(atom_charges).reshape(1, -1)
-
-    def featurize_many(self, molecules: List[Molecule]) -> np.array:
-        """
-        Featurize a sequence of Molecule objects.
+    def featurize(self, molecule: Molecule) -> np.array:
+        """Featurize single molecule instance. Returns charges for atoms in molecules.
 
         Args:
-            molecules (List[Molecule]): A sequence of molecule representations.
+            molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): An array of features for each molecule instance.
+            (np.array): Array containing charges for atoms in molecule instance.
         """
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecules)
-
-        return super().featurize_many(molecules=molecules)
+        return self._pad_atom_features(molecule=molecule)
 
     @property
     def feature_labels(self) -> List[str]:
@@ -602,6 +604,8 @@ class AtomChargeFeaturizer(MorfeusFeaturizer):
 class AtomNucleophilicityFeaturizer(MorfeusFeaturizer):
     """Return the nucleophilicity value for each atom in a molecule."""
 
+    schema_field = "max_atoms"
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -640,63 +644,34 @@ class AtomNucleophilicityFeaturizer(MorfeusFeaturizer):
 
         self.max_index = max_index
 
-    def featurize(self, molecule: Molecule) -> np.array:
-        """Featurize single molecule instance. Returns nucleophilicity value for each atom in a molecule.
+    def featurize_atoms(self, molecule: Molecule) -> Tuple[np.array, np.array]:
+        """Featurize single molecule instance atom by atom, without padding or aggregation.
 
         Args:
             molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): Array containing nucleophilicity value for each atom in a molecule instance.
+            Tuple[np.array, np.array]: Per-atom nucleophilicities and atomic numbers, ordered by atom index.
         """
         if self.qc_optimize:
             molecule = self._generate_conformer(molecule=molecule)
 
         morfeus_instance = self._get_morfeus_instance(molecule=molecule, morpheus_instance="xtb")
         descriptor = "local_nucleophilicity" if self.local else "nucleophilicity"
+        values = self._atom_values(morfeus_instance.get_fukui(descriptor))
 
-        nucleophilicity = morfeus_instance.get_fukui(descriptor)
-        num_atoms = len(nucleophilicity)
-
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecule)
-
-        atom_nucleophilicities = [
-            (nucleophilicity[i] if i <= num_atoms else 0) for i in range(1, self.max_index + 1)
-        ]
-
-        if self.aggregation is None:
-            # Track atom identities
-            atomic_numbers = self._track_atom_identity(molecule=molecule, max_index=self.max_index)
-
-            # Combine descriptors with atom identities
-            atom_nucleophilicities = atom_nucleophilicities + atomic_numbers
-        else:
-            if isinstance(self.aggregation, (list, set, tuple)):
-                atom_nucleophilicities = [
-                    self.aggregation_func[agg](atom_nucleophilicities) for agg in self.aggregation
-                ]
-            else:
-                atom_nucleophilicities = self.aggregation_func[self.aggregation](
-                    atom_nucleophilicities
-                )
-
-        return np.array(atom_nucleophilicities).reshape(1, -1)
+        return values, molecule.get_atomic_numbers(hydrogen=True)
 
-    def featurize_many(self, molecules: List[Molecule]) -> np.array:
-        """
-        Featurize a sequence of Molecule objects.
+    def featurize(self, molecule: Molecule) -> np.array:
+        """Featurize single molecule instance. Returns nucleophilicity value for each atom in a molecule.
 
         Args:
-            molecules (List[Molecule]): A sequence of molecule representations.
+            molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): An array of features for each molecule instance.
+            (np.array): Array containing nucleophilicity value for each atom in a molecule instance.
         """
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecules)
-
-        return super().featurize_many(molecules=molecules)
+        return self._pad_atom_features(molecule=molecule)
 
     @property
     def feature_labels(self) -> List[str]:
@@ -743,6 +718,8 @@ class AtomNucleophilicityFeaturizer(MorfeusFeaturizer):
 class AtomElectrophilicityFeaturizer(MorfeusFeaturizer):
     """Return electrophilicity values for each atom in a molecule."""
 
+    schema_field = "max_atoms"
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -781,63 +758,34 @@ class AtomElectrophilicityFeaturizer(MorfeusFeaturizer):
 
         self.max_index = max_index
 
-    def featurize(self, molecule: Molecule) -> np.array:
-        """Featurize single molecule instance. Returns electrophilicity values for each atom in a molecule.
+    def featurize_atoms(self, molecule: Molecule) -> Tuple[np.array, np.array]:
+        """Featurize single molecule instance atom by atom, without padding or aggregation.
 
         Args:
             molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): Array containing electrophilicity value for each atom in a molecule instance.
+            Tuple[np.array, np.array]: Per-atom electrophilicities and atomic numbers, ordered by atom index.
         """
         if self.qc_optimize:
             molecule = self._generate_conformer(molecule=molecule)
 
         morfeus_instance = self._get_morfeus_instance(molecule=molecule, morpheus_instance="xtb")
         descriptor = "local_electrophilicity" if self.local else "electrophilicity"
+        values = self._atom_values(morfeus_instance.get_fukui(descriptor))
 
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecule)
-
-        electrophilicity = morfeus_instance.get_fukui(descriptor)
-        num_atoms = len(electrophilicity)
-
-        atom_electrophilicities = [
-            (electrophilicity[i] if i <= num_atoms else 0) for i in range(1, self.max_index + 1)
-        ]
-
-        if self.aggregation is None:
-            # Track atom identities
-            atomic_numbers = self._track_atom_identity(molecule=molecule, max_index=self.max_index)
+        return values, molecule.get_atomic_numbers(hydrogen=True)
 
-            # Combine descriptors with atom identities
-            atom_electrophilicities = atom_electrophilicities + atomic_numbers
-        else:
-            if isinstance(self.aggregation, (list, tuple, set)):
-                atom_electrophilicities = [
-                    self.aggregation_func[agg](atom_electrophilicities) for agg in self.aggregation
-                ]
-            else:
-                atom_electrophilicities = self.aggregation_func[self.aggregation](
-                    atom_electrophilicities
-                )
-
-        return np.array(atom_electrophilicities).reshape(1, -1)
-
-    def featurize_many(self, molecules: List[Molecule]) -> np.array:
-        """
-        Featurize a sequence of Molecule objects.
+    def featurize(self, molecule: Molecule) -> np.array:
+        """Featurize single molecule instance. Returns electrophilicity values for each atom in a molecule.
 
         Args:
-            molecules (List[Molecule]): A sequence of molecule representations.
+            molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): An array of features for each molecule instance.
+            (np.array): Array containing electrophilicity value for each atom in a molecule instance.
         """
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecules)
-
-        return super().featurize_many(molecules=molecules)
+        return self._pad_atom_features(molecule=molecule)
 
     @property
     def feature_labels(self) -> List[str]:
@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+
+"""Execution backends for batch featurization."""
+
+import atexit
+import hashlib
+import math
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import partial
+from typing import Any, Callable, List, Optional, Sequence
+
+import numpy as np
+
+# Implemented execution utilities
+
+__all__ = [
+    "ExecutionBackend",  # Configurable serial/thread/process executor.
+    "get_default_backend",  # Helper function
+    "set_default_backend",  # Helper function
+]
+
+"""Worker-side state."""
+
+# Featurizers unpickled in the current (worker) process, keyed by payload digest.
+_WORKER_FEATURIZERS: "OrderedDict[str, Any]" = OrderedDict()
+_WORKER_CACHE_SIZE = 32
+
+
+def _featurize_chunk(
+    token: str, payload: Optional[bytes], molecules: Sequence
+) -> Optional[List[np.array]]:
+    """Featurize a chunk of molecules in a pool worker.
+
+    The featurizer is unpickled once per worker and kept around for subsequent chunks.
+
+    Args:
+        token (str): Digest identifying the pickled featurizer.
+        payload (Optional[bytes]): Pickled featurizer. May be `None` if the worker is expected to hold it already.
+        molecules (Sequence[Molecule]): Molecules to featurize.
+
+    Returns:
+        Optional[List[np.array]]: Feature blocks for `molecules`, or `None` if the worker has not received the
+            featurizer yet.
+    """
+    if token not in _WORKER_FEATURIZERS:
+        if payload is None:
+            return None
+
+        _WORKER_FEATURIZERS[token] = pickle.loads(payload)
+        if len(_WORKER_FEATURIZERS) > _WORKER_CACHE_SIZE:
+            _WORKER_FEATURIZERS.popitem(last=False)
+
+    return _WORKER_FEATURIZERS[token].featurize_blocks(molecules)
+
+
+def _apply_chunk(function: Callable, items: Sequence) -> List[Any]:
+    """Apply `function` to every element of a chunk.
+
+    Args:
+        function (Callable): Function to apply.
+        items (Sequence[Any]): Chunk of inputs.
+
+    Returns:
+        List[Any]: Function outputs.
+    """
+    return [function(item) for item in items]
+
+
+"""Backends."""
+
+
+class ExecutionBackend:
+    """Serial, thread- or process-based executor shared by featurizers.
+
+    Pools are created lazily and kept alive across calls, so repeated `featurize_many` calls
+    (and calls from different featurizers) do not pay for pool startup again.
+    In `process` mode, work is dispatched in chunks and each featurizer is shipped to a
+    worker once instead of once per molecule.
+    """
+
+    MODES = ("serial", "thread", "process")
+
+    def __init__(
+        self,
+        mode: str = "process",
+        n_jobs: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ):
+        """Instantiate class.
+
+        Args:
+            mode (str): Execution mode. One of `serial`, `thread` or `process`. Defaults to `process`.
+            n_jobs (Optional[int]): Number of workers. Defaults to `None`, i.e., the number of CPUs.
+            chunksize (Optional[int]): Number of molecules per task. Defaults to `None`,
+                i.e., about four chunks per worker.
+        """
+        mode = mode.lower()
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Invalid execution mode '{mode}'. Valid modes are: {', '.join(self.MODES)}."
+            )
+        if n_jobs is not None and n_jobs < 1:
+            raise ValueError("`n_jobs` must be a positive integer.")
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("`chunksize` must be a positive integer.")
+
+        self.mode = mode
+        self.n_jobs = n_jobs
+        self.chunksize = chunksize
+
+        self._executor: Optional[Executor] = None
+
+    def __repr__(self) -> str:
+        """Return string representation of backend.
+
+        Args:
+            None.
+
+        Returns:
+            str: String representation of backend.
+        """
+        return (
+            f"{self.__class__.__name__}(mode='{self.mode}', n_jobs={self.n_jobs}, "
+            f"chunksize={self.chunksize})"
+        )
+
+    def __getstate__(self):
+        """Drop live executor when pickling."""
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def __enter__(self):
+        """Enter context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit context. Shut down worker pool."""
+        self.shutdown()
+
+    @property
+    def num_workers(self) -> int:
+        """Return number of workers.
+
+        Args:
+            None.
+
+        Returns:
+            int: Number of workers used by pooled modes.
+        """
+        return self.n_jobs or os.cpu_count() or 1
+
+    def _chunk(self, items: Sequence) -> List[Sequence]:
+        """Split inputs into chunks.
+
+        Args:
+            items (Sequence[Any]): Inputs.
+
+        Returns:
+            List[Sequence[Any]]: Chunks of inputs.
+        """
+        size = self.chunksize or max(1, math.ceil(len(items) / (4 * self.num_workers)))
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    def _get_executor(self) -> Executor:
+        """Return live executor, creating one if needed.
+
+        Args:
+            None.
+
+        Returns:
+            Executor: Thread or process pool.
+        """
+        if self._executor is None:
+            executor_class = ThreadPoolExecutor if self.mode == "thread" else ProcessPoolExecutor
+            self._executor = executor_class(max_workers=self.num_workers)
+        return self._executor
+
+    def map(self, function: Callable, items: Sequence) -> List[Any]:
+        """Apply a function to every input.
+
+        Args:
+            function (Callable): Function to apply. Must be picklable in `process` mode.
+            items (Sequence[Any]): Inputs.
+
+        Returns:
+            List[Any]: Outputs, in input order.
+        """
+        items = list(items)
+        if self.mode == "serial" or len(items) <= 1:
+            return [function(item) for item in items]
+
+        chunks = self._chunk(items)
+        results = self._get_executor().map(partial(_apply_chunk, function), chunks)
+        return [result for chunk in results for result in chunk]
+
+    def featurize_blocks(self, featurizer: Any, molecules: Sequence) -> List[np.array]:
+        """Featurize molecules, returning one feature block per lower-level featurizer.
+
+        Args:
+            featurizer (AbstractFeaturizer): Featurizer to apply.
+            molecules (Sequence[Molecule]): Molecules to featurize.
+
+        Returns:
+            List[np.array]: Feature blocks of shape `(len(molecules), N_i)`, where `N_i` is the number of
+                features extracted by the `i`-th lower-level featurizer.
+        """
+        molecules = list(molecules)
+
+        # Output widths are fixed on the whole collection before any chunk is dispatched.
+        featurizer.prepare(molecules)
+
+        if self.mode == "serial" or len(molecules) <= 1:
+            return featurizer.featurize_blocks(molecules)
+
+        chunks = self._chunk(molecules)
+        executor = self._get_executor()
+
+        if self.mode == "thread":
+            results = list(executor.map(featurizer.featurize_blocks, chunks))
+        else:
+            payload = pickle.dumps(featurizer)
+            token = hashlib.sha1(payload).hexdigest()
+
+            # Only the first wave of chunks carries the featurizer. Chunks landing on a worker
+            # that has not seen it yet are resubmitted with the payload, without waiting for
+            # the retry, so that retries run concurrently with the remaining chunks.
+            pending = {
+                executor.submit(
+                    _featurize_chunk, token, payload if ix < self.num_workers else None, chunk
+                ): ix
+                for ix, chunk in enumerate(chunks)
+            }
+
+            results: List[Optional[List[np.array]]] = [None] * len(chunks)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ix = pending.pop(future)
+                    result = future.result()
+                    if result is None:
+                        retry = executor.submit(_featurize_chunk, token, payload, chunks[ix])
+                        pending[retry] = ix
+                    else:
+                        results[ix] = result
+
+        return [np.concatenate(blocks) for blocks in zip(*results)]
+
+    def featurize_many(self, featurizer: Any, molecules: Sequence) -> np.array:
+        """Featurize molecules with a featurizer.
+
+        Args:
+            featurizer (AbstractFeaturizer): Featurizer to apply.
+            molecules (Sequence[Molecule]): Molecules to featurize.
+
+        Returns:
+            np.array: An array of features for each molecule instance.
+        """
+        return np.concatenate(self.featurize_blocks(featurizer, molecules), axis=1)
+
+    def shutdown(self) -> None:
+        """Shut down worker pool, if any.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+"""Default backend."""
+
+_DEFAULT_BACKEND = ExecutionBackend()
+
+# Backend for cheap featurizers, for which dispatch to a pool costs more than the work itself.
+_CHEAP_BACKEND = ExecutionBackend(mode="serial")
+
+
+def get_default_backend(cost: Optional[str] = None) -> ExecutionBackend:
+    """Return the execution backend shared by featurizers.
+
+    Args:
+        cost (Optional[str]): Cost class of the featurizer to run. Cheap featurizers share their own
+            backend, which runs in-process unless replaced. Defaults to `None`.
+
+    Returns:
+        ExecutionBackend: Default execution backend.
+    """
+    if cost == "cheap":
+        return _CHEAP_BACKEND
+    return _DEFAULT_BACKEND
+
+
+def set_default_backend(
+    backend: ExecutionBackend, cost: Optional[str] = None
+) -> ExecutionBackend:
+    """Replace the execution backend shared by featurizers.
+
+    Args:
+        backend (ExecutionBackend): New default backend.
+        cost (Optional[str]): Cost class whose backend to replace. If `cheap`, replace the
+            backend of cheap featurizers (in-process by default), e.g., to force pooled execution.
+            Else, replace the backend of all other featurizers. Defaults to `None`.
+
+    Returns:
+        ExecutionBackend: Previous default backend. Its worker pool is shut down.
+    """
+    global _CHEAP_BACKEND, _DEFAULT_BACKEND
+
+    if not isinstance(backend, ExecutionBackend):
+        raise ValueError("`backend` must be of type `ExecutionBackend`.")
+
+    if cost == "cheap":
+        previous, _CHEAP_BACKEND = _CHEAP_BACKEND, backend
+    else:
+        previous, _DEFAULT_BACKEND = _DEFAULT_BACKEND, backend
+
+    if previous not in (backend, _CHEAP_BACKEND, _DEFAULT_BACKEND):
+        previous.shutdown()
+
+    return previous
+
+
+@atexit.register
+def _shutdown_default_backend() -> None:
+    """Shut down the default backends on interpreter exit."""
+    _CHEAP_BACKEND.shutdown()
+    _DEFAULT_BACKEND.shutdown()
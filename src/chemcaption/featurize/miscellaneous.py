@@ -21,6 +21,8 @@ __all__ = [
 class SVGFeaturizer(AbstractFeaturizer):
     """Convert molecule instance to SVG image."""
 
+    numeric = False
+
     def __init__(
         self,
         canvas_width: int = 300,
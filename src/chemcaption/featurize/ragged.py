@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+"""Compact (CSR) layout for atom-level features."""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Implemented ragged layout classes
+
+__all__ = [
+    "RaggedFeatures",  # Atom-level features stored without padding.
+]
+
+
+@dataclass(frozen=True)
+class RaggedFeatures:
+    """Atom-level features of a molecule collection, stored without padding.
+
+    The features of molecule `i` are `values[offsets[i]:offsets[i + 1]]`, for the atoms with atomic
+    numbers `atomic_numbers[offsets[i]:offsets[i + 1]]`, ordered by atom index.
+    """
+
+    values: np.array
+    offsets: np.array
+    atomic_numbers: np.array
+
+    def __len__(self) -> int:
+        """Return number of molecules."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Tuple[np.array, np.array]:
+        """Return atom-level features and atomic numbers of one molecule.
+
+        Args:
+            index (int): Position of molecule in collection.
+
+        Returns:
+            Tuple[np.array, np.array]: Feature values and atomic numbers of molecule atoms.
+        """
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return self.values[start:stop], self.atomic_numbers[start:stop]
+
+    @property
+    def lengths(self) -> np.array:
+        """Return number of atoms per molecule.
+
+        Args:
+            None.
+
+        Returns:
+            np.array: Number of atoms per molecule.
+        """
+        return np.diff(self.offsets)
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple[np.array, np.array]]) -> "RaggedFeatures":
+        """Build ragged features from per-molecule feature values and atomic numbers.
+
+        Args:
+            rows (List[Tuple[np.array, np.array]]): Feature values and atomic numbers, one pair
+                per molecule.
+
+        Returns:
+            RaggedFeatures: Ragged features.
+        """
+        lengths = [len(values) for values, _ in rows]
+        offsets = np.concatenate([[0], np.cumsum(lengths, dtype=int)])
+
+        if not rows:
+            return cls(values=np.zeros(0), offsets=offsets, atomic_numbers=np.zeros(0, dtype=int))
+
+        return cls(
+            values=np.concatenate([np.asarray(values, dtype=float) for values, _ in rows]),
+            offsets=offsets,
+            atomic_numbers=np.concatenate(
+                [np.asarray(atomic_numbers, dtype=int) for _, atomic_numbers in rows]
+            ),
+        )
+
+    def to_padded(self, max_index: Optional[int] = None) -> np.array:
+        """Convert to the padded layout of atom-level featurizers.
+
+        Each row holds `max_index` feature values followed by `max_index` atomic numbers, padded
+        with zeros.
+
+        Args:
+            max_index (Optional[int]): Number of atoms per row. Molecules with more atoms are
+                truncated. Defaults to `None`, i.e., the largest number of atoms, which is lossless.
+
+        Returns:
+            np.array: Padded features of shape `(len(self), 2 * max_index)`.
+        """
+        lengths = self.lengths
+        if max_index is None:
+            max_index = int(lengths.max(initial=0))
+
+        rows = np.repeat(np.arange(len(self)), lengths)
+        columns = np.arange(len(self.values)) - np.repeat(self.offsets[:-1], lengths)
+        kept = columns < max_index
+
+        padded = np.zeros((len(self), 2 * max_index))
+        padded[rows[kept], columns[kept]] = self.values[kept]
+        padded[rows[kept], max_index + columns[kept]] = self.atomic_numbers[kept]
+
+        return padded
+
+    @classmethod
+    def from_padded(cls, features: np.array) -> "RaggedFeatures":
+        """Convert from the padded layout of atom-level featurizers.
+
+        Padding is recognized by a zero atomic number.
+
+        Args:
+            features (np.array): Padded features of shape `(N, 2 * max_index)`.
+
+        Returns:
+            RaggedFeatures: Ragged features.
+        """
+        features = np.asarray(features)
+        max_index = features.shape[1] // 2
+
+        values, atomic_numbers = features[:, :max_index], features[:, max_index:]
+        mask = atomic_numbers != 0
+        lengths = mask.sum(axis=1)
+
+        return cls(
+            values=values[mask].astype(float),
+            offsets=np.concatenate([[0], np.cumsum(lengths)]).astype(int),
+            atomic_numbers=atomic_numbers[mask].astype(int),
+        )
@@ -2,7 +2,7 @@
 
 """Featurizers for solubility- and reaction-based features."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -21,6 +21,9 @@ __all__ = [
 class SolventAccessibleSurfaceAreaFeaturizer(MorfeusFeaturizer):
     """Return the solvent accessible surface area (SASA) value."""
 
+    cost = "moderate"
+    backends = ("givemeconformer", "morfeus")
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -89,6 +92,9 @@ class SolventAccessibleSurfaceAreaFeaturizer(MorfeusFeaturizer):
 class SolventAccessibleVolumeFeaturizer(MorfeusFeaturizer):
     """Return the solvent accessible volume value for a molecule."""
 
+    cost = "moderate"
+    backends = ("givemeconformer", "morfeus")
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -157,6 +163,10 @@ class SolventAccessibleVolumeFeaturizer(MorfeusFeaturizer):
 class SolventAccessibleAtomAreaFeaturizer(MorfeusFeaturizer):
     """Return the solvent accessible area value for each atom in a molecule."""
 
+    cost = "moderate"
+    backends = ("givemeconformer", "morfeus")
+    schema_field = "max_atoms"
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -191,59 +201,33 @@ class SolventAccessibleAtomAreaFeaturizer(MorfeusFeaturizer):
 
         self.max_index = max_index
 
-    def featurize(self, molecule: Molecule) -> np.array:
-        """
-        Featurize single molecule instance. Returns the solvent accessible area value for each atom in a molecule.
+    def featurize_atoms(self, molecule: Molecule) -> Tuple[np.array, np.array]:
+        """Featurize single molecule instance atom by atom, without padding or aggregation.
 
         Args:
             molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): Array containing solvent accessible atom area for atoms in molecule instance.
+            Tuple[np.array, np.array]: Per-atom solvent accessible areas and atomic numbers, ordered by atom index.
         """
         if self.qc_optimize:
             molecule = self._generate_conformer(molecule=molecule)
 
         morfeus_instance = self._get_morfeus_instance(molecule=molecule, morpheus_instance="sasa")
+        values = self._atom_values(morfeus_instance.atom_areas)
 
-        atom_areas = morfeus_instance.atom_areas
-        num_atoms = len(atom_areas)
-
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecule)
-
-        atom_areas = [
-            (atom_areas[i] if i <= num_atoms else 0) for i in range(1, self.max_index + 1)
-        ]
-
-        if self.aggregation is None:
-            # Track atom identities
-            atomic_numbers = self._track_atom_identity(molecule=molecule, max_index=self.max_index)
-
-            # Combine descriptors with atom identities
-            output = atom_areas + atomic_numbers
-        else:
-            if isinstance(self.aggregation, (list, tuple, set)):
-                output = [self.aggregation_func[agg](atom_areas) for agg in self.aggregation]
-            else:
-                output = self.aggregation_func[self.aggregation](atom_areas)
-
-        return np.array(output).reshape(1, -1)
+        return values, molecule.get_atomic_numbers(hydrogen=True)
 
-    def featurize_many(self, molecules: List[Molecule]) -> np.array:
-        """
-        Featurize a sequence of Molecule objects.
+    def featurize(self, molecule: Molecule) -> np.array:
+        """Featurize single molecule instance. Returns the solvent accessible area value for each atom in a molecule.
 
         Args:
-            molecules (List[Molecule]): A sequence of molecule representations.
+            molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): An array of features for each molecule instance.
+            (np.array): Array containing solvent accessible atom area for atoms in molecule instance.
         """
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecules)
-
-        return super().featurize_many(molecules=molecules)
+        return self._pad_atom_features(molecule=molecule)
 
     @property
     def feature_labels(self) -> List[str]:
@@ -1,83 +1,166 @@
 # -*- coding: utf-8 -*-
 
-"""Implementations for utlity functions to generate all comparators in a submodule."""
+"""Implementations for utlity functions to generate all featurizers and comparators in a submodule.
 
-import chemcaption
+Featurizer classes declare their registry metadata as class attributes: `cost`, the relative cost of
+featurization (`cheap`, `moderate` or `expensive`), and `backends`, the libraries needed beyond RDKit.
+The registry reads this metadata without running any featurizer, and the module-level collections
+(e.g., `BONDS_FEATURIZERS`) are only built when first accessed.
+"""
+
+import importlib
+import inspect
+from types import ModuleType
+from typing import Any, Iterable, List, Optional, Type, Union
 
-from abc import ABCMeta
 from chemcaption.featurize.base import (
-    AbstractFeaturizer,
-    MultipleFeaturizer,
+    COST_CLASSES,
     AbstractComparator,
+    AbstractFeaturizer,
     Comparator,
-    MultipleComparator
+    MultipleComparator,
+    MultipleFeaturizer,
 )
 
-from chemcaption.molecules import SMILESMolecule
+# Implemented registry utilities
+
+__all__ = [
+    "COST_CLASSES",  # Supported cost classes
+    "featurizer_classes",  # Helper function
+    "init_all_featurizers",  # Helper function
+    "init_all_comparators",  # Helper function
+]
+
+"""Registered submodules."""
+
+_FEATURIZER_MODULES = {
+    "BONDS_FEATURIZERS": "chemcaption.featurize.bonds",
+    "COMPOSITION_FEATURIZERS": "chemcaption.featurize.composition",
+    "ELECTRONICITY_FEATURIZERS": "chemcaption.featurize.electronicity",
+    "MISCELLANEOUS_FEATURIZERS": "chemcaption.featurize.miscellaneous",
+    "REACTION_FEATURIZERS": "chemcaption.featurize.reaction",
+    "RULES_FEATURIZERS": "chemcaption.featurize.rules",
+    "SPATIAL_FEATURIZERS": "chemcaption.featurize.spatial",
+    "STEREOCHEMISTRY_FEATURIZERS": "chemcaption.featurize.stereochemistry",
+    "SUBSTRUCTURE_FEATURIZERS": "chemcaption.featurize.substructure",
+    "SYMMETRY_FEATURIZERS": "chemcaption.featurize.symmetry",
+}
+
+_COMPARATOR_MODULES = {
+    "COMPARATORS": "chemcaption.featurize.comparator",
+}
+
+
+def _import(module: Union[ModuleType, str]) -> ModuleType:
+    """Return module, importing it by name if needed.
+
+    Args:
+        module (Union[ModuleType, str]): Module or fully qualified module name.
+
+    Returns:
+        ModuleType: Module.
+    """
+    return importlib.import_module(module) if isinstance(module, str) else module
+
+
+def featurizer_classes(
+    module: Union[ModuleType, str],
+    cost: Optional[Union[str, Iterable[str]]] = None,
+    backends: Optional[Iterable[str]] = None,
+) -> List[Type[AbstractFeaturizer]]:
+    """Returns featurizer classes in a chemcaption submodule, without instantiating them.
+
+    Args:
+        module (Union[ModuleType, str]): Submodule or fully qualified submodule name.
+        cost (Optional[Union[str, Iterable[str]]]): Keep only featurizers of these cost classes.
+            Defaults to `None`, i.e., all cost classes.
+        backends (Optional[Iterable[str]]): Keep only featurizers whose required backends are all in
+            `backends`. Defaults to `None`, i.e., no restriction.
+
+    Returns:
+        List[Type[AbstractFeaturizer]]: Concrete featurizer classes.
+    """
+    if isinstance(cost, str):
+        cost = [cost]
+    if cost is not None and not set(cost).issubset(COST_CLASSES):
+        raise ValueError(f"Invalid cost class. Valid cost classes are: {', '.join(COST_CLASSES)}.")
 
-def init_all_featurizers(module) -> list:
-    """Returns a list of initialized featurizers per chemcaption submodule."""
-    
     classes = []
-    for item in module.__dict__.values():
-        if isinstance(item, ABCMeta):
-            if not issubclass(item, AbstractFeaturizer):
-                continue
-                
-            try:
-                f = item()
-            except:
-                continue
-
-            if isinstance(f, MultipleFeaturizer):
-                continue
-
-            try:
-                f.featurize(SMILESMolecule('O'))
-            except NotImplementedError:
-                continue
-
-            classes.append(f)
+    for item in _import(module).__dict__.values():
+        if not (inspect.isclass(item) and issubclass(item, AbstractFeaturizer)):
+            continue
+
+        if inspect.isabstract(item) or issubclass(item, MultipleFeaturizer):
+            continue
+
+        if cost is not None and item.cost not in cost:
+            continue
+
+        if backends is not None and not set(item.backends).issubset(backends):
+            continue
+
+        classes.append(item)
 
     return classes
 
-def init_all_comparators(module) -> list:
+
+def init_all_featurizers(
+    module: Union[ModuleType, str],
+    cost: Optional[Union[str, Iterable[str]]] = None,
+    backends: Optional[Iterable[str]] = None,
+) -> list:
+    """Returns a list of initialized featurizers per chemcaption submodule.
+
+    Featurizers are only instantiated, not run. Featurizers which cannot be built without arguments
+    are skipped.
+
+    Args:
+        module (Union[ModuleType, str]): Submodule or fully qualified submodule name.
+        cost (Optional[Union[str, Iterable[str]]]): Keep only featurizers of these cost classes.
+            Defaults to `None`, i.e., all cost classes.
+        backends (Optional[Iterable[str]]): Keep only featurizers whose required backends are all in
+            `backends`. Defaults to `None`, i.e., no restriction.
+
+    Returns:
+        list: Featurizer instances.
+    """
+    featurizers = []
+    for item in featurizer_classes(module, cost=cost, backends=backends):
+        try:
+            featurizers.append(item())
+        except Exception:
+            continue
+
+    return featurizers
+
+
+def init_all_comparators(module: Union[ModuleType, str]) -> list:
     """Returns a list of initialized comparators per chemcaption submodule."""
-    
-    classes = []
-    for item in module.__dict__.values():
-        if isinstance(item, ABCMeta):
-            if not issubclass(item, AbstractComparator):
-                continue
-                
-            try:
-                f = item()
-            except:
-                continue
 
-            if isinstance(f, MultipleComparator):
-                continue
+    classes = []
+    for item in _import(module).__dict__.values():
+        if not (inspect.isclass(item) and issubclass(item, AbstractComparator)):
+            continue
 
-            if type(f) == Comparator:
-                continue
+        if inspect.isabstract(item) or issubclass(item, MultipleComparator) or item is Comparator:
+            continue
 
-            classes.append(f)
+        try:
+            classes.append(item())
+        except Exception:
+            continue
 
     return classes
 
-"""Featurizers"""
-
-BONDS_FEATURIZERS = init_all_featurizers(chemcaption.featurize.bonds)
-COMPOSITION_FEATURIZERS = init_all_featurizers(chemcaption.featurize.composition)
-ELECTRONICITY_FEATURIZERS = init_all_featurizers(chemcaption.featurize.electronicity)
-MISCELLANEOUS_FEATURIZERS = init_all_featurizers(chemcaption.featurize.miscellaneous)
-REACTION_FEATURIZERS = init_all_featurizers(chemcaption.featurize.reaction)
-RULES_FEATURIZERS = init_all_featurizers(chemcaption.featurize.rules)
-SPATIAL_FEATURIZERS = init_all_featurizers(chemcaption.featurize.spatial)
-STEREOCHEMISTRY_FEATURIZERS = init_all_featurizers(chemcaption.featurize.stereochemistry)
-SUBSTRUCTURE_FEATURIZERS = init_all_featurizers(chemcaption.featurize.substructure)
-SYMMETRY_FEATURIZERS = init_all_featurizers(chemcaption.featurize.symmetry)
 
-"""Comparators"""
+def __getattr__(name: str) -> Any:
+    """Build featurizer and comparator collections on first access."""
+    if name in _FEATURIZER_MODULES:
+        value = init_all_featurizers(_FEATURIZER_MODULES[name])
+    elif name in _COMPARATOR_MODULES:
+        value = init_all_comparators(_COMPARATOR_MODULES[name])
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-COMPARATORS = init_all_comparators(chemcaption.featurize.comparator)
\ No newline at end of file
+    globals()[name] = value
+    return value
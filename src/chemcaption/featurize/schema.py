@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""Dataset-level feature schema fixing the output widths of featurizers."""
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+from rdkit.Chem import GetPeriodicTable
+
+from chemcaption.molecules import Molecule
+
+# Implemented schema-related classes
+
+__all__ = [
+    "FeatureSchema",  # Immutable dataset-level quantities fixing featurizer output widths.
+]
+
+
+@dataclass(frozen=True)
+class FeatureSchema:
+    """Immutable dataset-level quantities which fix the output widths of featurizers.
+
+    Per-atom and per-bond featurizers pad their outputs to `max_atoms` and `max_bonds`. The schema is
+    fitted once per dataset, ahead of batch featurization, and shipped to workers as part of the
+    featurizers, so that every worker produces features of the same width.
+    """
+
+    max_atoms: int
+    max_bonds: int
+    elements: Tuple[str, ...]
+
+    @classmethod
+    def fit(cls, molecules: Sequence[Molecule]) -> "FeatureSchema":
+        """Fit schema on a molecule collection in a single pass.
+
+        Args:
+            molecules (Sequence[Molecule]): Molecular representations.
+
+        Returns:
+            FeatureSchema: Schema covering all molecules in `molecules`.
+        """
+        molecules = list(molecules)
+        if not molecules:
+            raise ValueError("Cannot fit a feature schema on an empty collection of molecules.")
+
+        atomic_numbers = [molecule.get_atomic_numbers(hydrogen=True) for molecule in molecules]
+        atom_counts = np.fromiter(map(len, atomic_numbers), dtype=int, count=len(molecules))
+        bond_counts = np.fromiter(
+            (molecule.reveal_hydrogens().GetNumBonds() for molecule in molecules),
+            dtype=int,
+            count=len(molecules),
+        )
+
+        periodic_table = GetPeriodicTable()
+        present = np.flatnonzero(np.bincount(np.concatenate(atomic_numbers)))
+
+        return cls(
+            max_atoms=int(atom_counts.max()),
+            max_bonds=int(bond_counts.max()),
+            elements=tuple(
+                periodic_table.GetElementName(int(number)).capitalize() for number in present
+            ),
+        )
+
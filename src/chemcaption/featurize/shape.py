@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+"""NumPy kernels computing all shape descriptors from one inertia tensor per conformer."""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from rdkit import Chem
+from rdkit.Chem import AllChem
+
+# Implemented shape kernels
+
+__all__ = [
+    "CONFORMER_AGGREGATIONS",  # Supported aggregations over conformer ensembles
+    "conformer_coordinates",  # Helper function
+    "conformer_energies",  # Helper function
+    "boltzmann_weights",  # Helper function
+    "segment_principal_moments",  # Helper function
+    "principal_moments",  # Helper function
+    "shape_descriptors",  # Helper function
+    "aggregate_segments",  # Helper function
+    "aggregate_conformers",  # Helper function
+]
+
+"""Supported aggregations over conformer ensembles."""
+
+CONFORMER_AGGREGATIONS = ("boltzmann", "mean", "min", "max")
+
+# Gas constant in kcal/(mol K), matching the units of force field energies.
+_GAS_CONSTANT = 1.987204e-3
+
+# Denominators below this value are treated as zero, as in `rdkit.Chem.Descriptors3D`.
+_EPSILON = 1e-4
+
+
+def conformer_coordinates(mol: Chem.Mol) -> np.array:
+    """Return coordinates of all conformers of a molecule, stacked.
+
+    Args:
+        mol (Chem.Mol): Molecule embedded with conformers.
+
+    Returns:
+        np.array: Coordinates of shape `(n_conformers, n_atoms, 3)`.
+    """
+    if mol.GetNumConformers() == 0:
+        raise ValueError("Molecule has no conformers.")
+
+    return np.stack([conformer.GetPositions() for conformer in mol.GetConformers()])
+
+
+def conformer_energies(mol: Chem.Mol) -> np.array:
+    """Return force field energies of all conformers of a molecule, without optimizing them.
+
+    MMFF94 is used if parametrized for the molecule, else UFF.
+
+    Args:
+        mol (Chem.Mol): Molecule embedded with conformers.
+
+    Returns:
+        np.array: Energies in kcal/mol, of shape `(n_conformers,)`.
+    """
+    mol = Chem.Mol(mol)
+
+    if AllChem.MMFFHasAllMoleculeParams(mol):
+        results = AllChem.MMFFOptimizeMoleculeConfs(mol, maxIters=0)
+    else:
+        results = AllChem.UFFOptimizeMoleculeConfs(mol, maxIters=0)
+
+    return np.array([energy for _, energy in results])
+
+
+def boltzmann_weights(energies: np.array, temperature: float = 298.15) -> np.array:
+    """Return Boltzmann weights of conformers.
+
+    Args:
+        energies (np.array): Conformer energies in kcal/mol.
+        temperature (float): Temperature in Kelvin. Defaults to `298.15`.
+
+    Returns:
+        np.array: Weights summing up to one.
+    """
+    energies = np.asarray(energies, dtype=float)
+    exponents = -(energies - energies.min()) / (_GAS_CONSTANT * temperature)
+    weights = np.exp(exponents)
+    return weights / weights.sum()
+
+
+def segment_principal_moments(
+    coordinates: np.array, weights: np.array, lengths: Sequence[int]
+) -> Tuple[np.array, np.array]:
+    """Return principal moments of inertia of many conformers at once.
+
+    Conformers (e.g., of different molecules) are stored back to back and may differ in size. All
+    inertia tensors are built with segment sums and diagonalized in a single batched call.
+
+    Args:
+        coordinates (np.array): Atom coordinates of all conformers, of shape `(n_atoms_total, 3)`.
+        weights (np.array): Atom weights (e.g., masses) of shape `(n_atoms_total,)`.
+        lengths (Sequence[int]): Number of atoms per conformer. Must be positive.
+
+    Returns:
+        Tuple[np.array, np.array]: Tuple containing (a). principal moments of shape `(n_conformers, 3)`,
+            in ascending order, and (b). total weight per conformer.
+    """
+    coordinates = np.asarray(coordinates, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    lengths = np.asarray(lengths, dtype=int)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+
+    total_weights = np.add.reduceat(weights, starts)
+    centers = np.add.reduceat(weights[:, None] * coordinates, starts) / total_weights[:, None]
+    centered = coordinates - np.repeat(centers, lengths, axis=0)
+
+    # Second moments of the weighted atom distributions, then inertia tensors
+    second_moments = np.add.reduceat(
+        weights[:, None, None] * centered[:, :, None] * centered[:, None, :], starts
+    )
+    trace = np.trace(second_moments, axis1=1, axis2=2)
+    inertia = trace[:, None, None] * np.eye(3) - second_moments
+
+    return np.linalg.eigvalsh(inertia), total_weights
+
+
+def principal_moments(coordinates: np.array, weights: Optional[np.array] = None) -> np.array:
+    """Return principal moments of inertia of stacked conformers.
+
+    Args:
+        coordinates (np.array): Coordinates of shape `(n_conformers, n_atoms, 3)`.
+        weights (Optional[np.array]): Atom weights (e.g., masses) of shape `(n_atoms,)`.
+            Defaults to `None`, i.e., unit weights.
+
+    Returns:
+        np.array: Principal moments of shape `(n_conformers, 3)`, in ascending order.
+    """
+    coordinates = np.asarray(coordinates, dtype=float)
+    n_conformers, n_atoms, _ = coordinates.shape
+    if weights is None:
+        weights = np.ones(n_atoms)
+
+    moments, _ = segment_principal_moments(
+        coordinates.reshape(-1, 3), np.tile(weights, n_conformers), [n_atoms] * n_conformers
+    )
+    return moments
+
+
+def shape_descriptors(
+    moments: np.array, total_weight: np.array, unweighted_moments: Optional[np.array] = None
+) -> Dict[str, np.array]:
+    """Return shape descriptors derived from principal moments of inertia.
+
+    Definitions follow `rdkit.Chem.Descriptors3D`. The eigenvalues of the gyration tensor are derived
+    from the principal moments, so no further decomposition is needed.
+
+    Args:
+        moments (np.array): Principal moments of shape `(n_conformers, 3)`, in ascending order.
+        total_weight (np.array): Sum of atom weights used to compute `moments`, per conformer.
+        unweighted_moments (Optional[np.array]): Principal moments for unit atom weights, used by the
+            mass-independent spherocity index. Defaults to `None`, i.e., `moments`.
+
+    Returns:
+        Dict[str, np.array]: Mapping of descriptor name to array of shape `(n_conformers,)`.
+    """
+    pmi1, pmi2, pmi3 = moments[:, 0], moments[:, 1], moments[:, 2]
+
+    # Eigenvalues of the (unnormalized) gyration tensor
+    gyration = _gyration_eigenvalues(moments)
+    unweighted_gyration = (
+        gyration if unweighted_moments is None else _gyration_eigenvalues(unweighted_moments)
+    )
+
+    return {
+        "pmi1": pmi1,
+        "pmi2": pmi2,
+        "pmi3": pmi3,
+        "npr1": _divide(pmi1, pmi3),
+        "npr2": _divide(pmi2, pmi3),
+        "eccentricity": _divide(np.sqrt(np.maximum(pmi3**2 - pmi1**2, 0)), pmi3),
+        "inertial_shape_factor": _divide(pmi2, pmi1 * pmi3),
+        "asphericity": _divide(
+            (gyration[:, 0] - gyration[:, 1]) ** 2
+            + (gyration[:, 0] - gyration[:, 2]) ** 2
+            + (gyration[:, 1] - gyration[:, 2]) ** 2,
+            2 * gyration.sum(axis=1) ** 2,
+        ),
+        "radius_of_gyration": np.sqrt(np.maximum(gyration.sum(axis=1), 0) / total_weight),
+        "spherocity_index": _divide(
+            3 * unweighted_gyration.min(axis=1), unweighted_gyration.sum(axis=1)
+        ),
+    }
+
+
+def _divide(numerator: np.array, denominator: np.array) -> np.array:
+    """Divide element-wise, returning zero for vanishing denominators (e.g., single atoms).
+
+    Args:
+        numerator (np.array): Numerator.
+        denominator (np.array): Denominator.
+
+    Returns:
+        np.array: Quotient, or zero where `denominator` is below `_EPSILON`.
+    """
+    valid = np.abs(denominator) >= _EPSILON
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=valid)
+
+
+def _gyration_eigenvalues(moments: np.array) -> np.array:
+    """Return eigenvalues of the gyration tensor from principal moments of inertia.
+
+    Args:
+        moments (np.array): Principal moments of shape `(n_conformers, 3)`.
+
+    Returns:
+        np.array: Gyration tensor eigenvalues of shape `(n_conformers, 3)`.
+    """
+    return moments.sum(axis=1, keepdims=True) / 2 - moments
+
+
+def aggregate_segments(
+    values: np.array, counts: Sequence[int], aggregation: str, weights: Optional[np.array] = None
+) -> np.array:
+    """Aggregate per-conformer values over the conformer ensembles of many molecules.
+
+    Args:
+        values (np.array): Per-conformer values of shape `(n_conformers_total, N)`, stored back to
+            back per molecule.
+        counts (Sequence[int]): Number of conformers per molecule. Must be positive.
+        aggregation (str): One of `boltzmann`, `mean`, `min` or `max`.
+        weights (Optional[np.array]): Boltzmann weights of shape `(n_conformers_total,)`, summing up
+            to one per molecule. Required if `aggregation` is `boltzmann`.
+
+    Returns:
+        np.array: Aggregated values of shape `(n_molecules, N)`.
+    """
+    counts = np.asarray(counts, dtype=int)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    if aggregation == "boltzmann":
+        if weights is None:
+            raise ValueError("Boltzmann aggregation requires conformer weights.")
+        return np.add.reduceat(weights[:, None] * values, starts)
+    elif aggregation == "mean":
+        return np.add.reduceat(values, starts) / counts[:, None]
+    elif aggregation == "min":
+        return np.minimum.reduceat(values, starts)
+    elif aggregation == "max":
+        return np.maximum.reduceat(values, starts)
+
+    raise ValueError(
+        f"Invalid conformer aggregation. Valid aggregations are: {', '.join(CONFORMER_AGGREGATIONS)}."
+    )
+
+
+def aggregate_conformers(
+    values: np.array, aggregation: str, weights: Optional[np.array] = None
+) -> np.array:
+    """Aggregate per-conformer values over a conformer ensemble.
+
+    Args:
+        values (np.array): Per-conformer values of shape `(n_conformers, N)`.
+        aggregation (str): One of `boltzmann`, `mean`, `min` or `max`.
+        weights (Optional[np.array]): Boltzmann weights of shape `(n_conformers,)`.
+            Required if `aggregation` is `boltzmann`.
+
+    Returns:
+        np.array: Aggregated values of shape `(N,)`.
+    """
+    values = np.asarray(values, dtype=float).reshape(len(values), -1)
+    return aggregate_segments(values, [len(values)], aggregation, weights=weights)[0]
@@ -2,14 +2,25 @@
 
 """Featurizers for 3D (i.e., spatial) features."""
 
-from typing import Any, Dict, List, Optional, Union
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from frozendict import frozendict
 from rdkit import Chem
-from rdkit.Chem import Descriptors3D
 
 from chemcaption.featurize.base import AbstractFeaturizer, MorfeusFeaturizer
+from chemcaption.featurize.conformers import get_conformer_service
+from chemcaption.featurize.shape import (
+    CONFORMER_AGGREGATIONS,
+    aggregate_segments,
+    boltzmann_weights,
+    conformer_coordinates,
+    conformer_energies,
+    segment_principal_moments,
+    shape_descriptors,
+)
 from chemcaption.featurize.utils import cached_conformer, join_list_elements
 from chemcaption.molecules import Molecule
 
@@ -28,17 +39,29 @@ __all__ = [
 ]
 
 
+"""Shape descriptors shared between spatial featurizers."""
+
+# All shape descriptors of a molecule, keyed by SMILES and featurizer settings.
+_SHAPE_BLOCKS: "OrderedDict[Tuple[Any, ...], Dict[str, float]]" = OrderedDict()
+_SHAPE_BLOCK_SIZE = 1024
+
+
 """Abstract Featurizer for extracting 3D features from molecule."""
 
 
 class SpatialFeaturizer(AbstractFeaturizer):
     """Abstract class for 3-D featurizers."""
 
+    cost = "moderate"
+    backends = ("givemeconformer",)
+
     def __init__(
         self,
         use_masses: bool = True,
         force: bool = True,
         conformer_generation_kwargs: Optional[Dict[str, Union[int, str]]] = None,
+        conformer_aggregation: Optional[str] = None,
+        temperature: float = 298.15,
     ):
         """Instantiate initialization scheme to be inherited.
 
@@ -47,64 +70,186 @@ class SpatialFeaturizer(AbstractFeaturizer):
             force (bool): Utilize force field calculations for energy minimization. Defaults to `True`.
             conformer_generation_kwargs (Optional[Dict[str, Union[int, str]]]):
                 Keyword arguments for conformer generation. Defaults to `None`.
+            conformer_aggregation (Optional[str]): Aggregation over the conformer ensemble. One of
+                `boltzmann`, `mean`, `min` or `max`. Defaults to `None`, i.e., use the default conformer.
+            temperature (float): Temperature in Kelvin for Boltzmann weighting. Defaults to `298.15`.
         """
         super().__init__()
 
         self.use_masses = use_masses
         self.force = force
 
-        self.FUNCTION_MAP: Optional[Dict] = None
         self._conf_gen_kwargs = (
             frozendict(conformer_generation_kwargs)
             if conformer_generation_kwargs
             else frozendict({})
         )
 
-    def _get_conformer(self, mol: Chem.Mol) -> Chem.Mol:
-        """Returns molecular object embedded with conformers.
+        if conformer_aggregation is not None:
+            conformer_aggregation = conformer_aggregation.lower()
+            if conformer_aggregation not in CONFORMER_AGGREGATIONS:
+                raise ValueError(
+                    "Invalid conformer aggregation. Valid aggregations are: "
+                    + ", ".join(CONFORMER_AGGREGATIONS)
+                    + "."
+                )
+
+        self.conformer_aggregation = conformer_aggregation
+        self.temperature = temperature
+
+    # Names of `shape_descriptors` computed by featurizer, in order of `feature_labels`.
+    _shape_descriptors: Tuple[str, ...] = ()
+
+    def _shape_block_key(self, molecule: Molecule) -> Tuple[Any, ...]:
+        """Return key identifying the shape descriptors of a molecule under current settings.
 
         Args:
-            mol (Chem.Mol): Rdkit molecular instance.
+            molecule (Molecule): Molecule representation.
 
         Returns:
-            (Chem.Mol): Rdkit molecular instance embedded with conformers.
+            Tuple[Any, ...]: Memoization key.
         """
-        smiles = Chem.MolToSmiles(mol)
-        return cached_conformer(smiles, self._conf_gen_kwargs)
+        return (
+            Chem.MolToSmiles(molecule.rdkit_mol),
+            self._conf_gen_kwargs,
+            self.use_masses,
+            self.conformer_aggregation,
+            self.temperature,
+        )
+
+    def _shape_blocks(self, molecules: List[Molecule]) -> List[Dict[str, float]]:
+        """Return all shape descriptors for a sequence of molecules.
 
-    def _base_rdkit_utility_keys(self) -> List[str]:
-        """Returns sorted identifiers for `rdkit` functions in function map.
+        Conformers of all molecules are requested from the conformer service at once, so they are
+        generated concurrently. Descriptors are derived from one inertia tensor per conformer, and
+        the tensors of all conformers of all molecules are diagonalized in a single batched call.
+        Results are memoized, so that other spatial featurizers with the same settings reuse them.
 
         Args:
-            None.
+            molecules (List[Molecule]): A sequence of molecule representations.
 
         Returns:
-            List[str]: List of ordered function keys.
-        """
-        assert isinstance(self.FUNCTION_MAP, dict)
+            List[Dict[str, float]]: Mapping of descriptor name to value, per molecule.
 
-        keys = list(k for k in self.FUNCTION_MAP.keys())
-        keys.sort()
-        return keys
+        Raises:
+            RuntimeError: If no conformer could be generated within budget for some molecule.
+        """
+        keys = [self._shape_block_key(molecule) for molecule in molecules]
+        blocks = {key: _SHAPE_BLOCKS[key] for key in keys if key in _SHAPE_BLOCKS}
+        missing = [key for key in dict.fromkeys(keys) if key not in blocks]
+
+        if missing:
+            coordinates, masses, lengths, counts, conformer_weights = [], [], [], [], []
+
+            # Generate conformers of all missing molecules concurrently
+            batch = get_conformer_service().generate(
+                [smiles for smiles, *_ in missing], self._conf_gen_kwargs
+            )
+            if batch.failures:
+                raise RuntimeError(
+                    "Conformer generation failed for "
+                    + join_list_elements(
+                        [
+                            f"'{failure.smiles}' after {failure.attempts} attempt(s): "
+                            f"{failure.reason}"
+                            for failure in batch.failures
+                        ]
+                    )
+                )
+
+            for smiles, *_ in missing:
+                mol = batch.conformers[smiles]
+
+                if self.conformer_aggregation is None:
+                    positions = mol.GetConformer().GetPositions()[None]
+                else:
+                    positions = conformer_coordinates(mol)
+                    if self.conformer_aggregation == "boltzmann":
+                        conformer_weights.append(
+                            boltzmann_weights(conformer_energies(mol), temperature=self.temperature)
+                        )
+
+                n_conformers, n_atoms, _ = positions.shape
+                coordinates.append(positions.reshape(-1, 3))
+                masses.append(np.tile([atom.GetMass() for atom in mol.GetAtoms()], n_conformers))
+                lengths.extend([n_atoms] * n_conformers)
+                counts.append(n_conformers)
+
+            coordinates = np.concatenate(coordinates)
+            masses = np.concatenate(masses)
+            unit_weights = np.ones(len(coordinates))
+
+            moments, total_weights = segment_principal_moments(
+                coordinates, masses if self.use_masses else unit_weights, lengths
+            )
+            unweighted_moments = (
+                segment_principal_moments(coordinates, unit_weights, lengths)[0]
+                if self.use_masses
+                else None
+            )
+
+            descriptors = shape_descriptors(moments, total_weights, unweighted_moments)
+            names = list(descriptors)
+            values = np.stack([descriptors[name] for name in names], axis=1)
+
+            if self.conformer_aggregation is not None:
+                values = aggregate_segments(
+                    values,
+                    counts,
+                    self.conformer_aggregation,
+                    weights=np.concatenate(conformer_weights) if conformer_weights else None,
+                )
+
+            for key, row in zip(missing, values):
+                blocks[key] = dict(zip(names, row.tolist()))
+
+        # Memoize once all blocks of the batch are collected, so that eviction cannot drop them
+        for key in dict.fromkeys(keys):
+            _SHAPE_BLOCKS[key] = blocks[key]
+            _SHAPE_BLOCKS.move_to_end(key)
+        while len(_SHAPE_BLOCKS) > _SHAPE_BLOCK_SIZE:
+            _SHAPE_BLOCKS.popitem(last=False)
+
+        return [blocks[key] for key in keys]
+
+    def _featurize_shape(self, molecules: List[Molecule]) -> np.array:
+        """Featurize a sequence of Molecule objects with the shared shape kernel.
+
+        Args:
+            molecules (List[Molecule]): A sequence of molecule representations.
+
+        Returns:
+            np.array: Array of shape `(len(molecules), N)` containing shape descriptors.
+        """
+        blocks = self._shape_blocks(molecules)
+        return np.array(
+            [[block[name] for name in self._shape_descriptors] for block in blocks]
+        ).reshape(len(molecules), -1)
 
-    def _measure_all(
-        self, *x: Chem.Mol, **y: Dict[str, Union[int, str]]
-    ) -> List[Union[int, float]]:
-        """Return results for all possible variants of 3D featurizer.
+    def featurize_blocks(self, molecules: List[Molecule]) -> List[np.array]:
+        """Featurize a sequence of Molecule objects in-process, all molecules at once.
 
         Args:
-            *x (Chem.Mol): rdkit Molecule object.
-            **y (Dict[str, Union[int, str]]): Keyword arguments.
+            molecules (List[Molecule]): A sequence of molecule representations.
 
         Returns:
-            List[Union[int, float]]: List of computed results for different variants of interest.
+            List[np.array]: List containing a single array of features for each molecule instance.
         """
-        assert isinstance(self.FUNCTION_MAP, dict)
+        return [self._featurize_shape(list(molecules))]
 
-        keys = self._base_rdkit_utility_keys()
-        results = [self.FUNCTION_MAP[idx](*x, **y) for idx in keys]
-        return results
+    def _get_conformer(self, mol: Chem.Mol) -> Chem.Mol:
+        """Returns molecular object embedded with conformers.
+
+        Args:
+            mol (Chem.Mol): Rdkit molecular instance.
+
+        Returns:
+            (Chem.Mol): Rdkit molecular instance embedded with conformers.
+        """
+        smiles = Chem.MolToSmiles(mol)
+        return cached_conformer(smiles, self._conf_gen_kwargs)
 
+    @abstractmethod
     def featurize(self, molecule: Molecule) -> None:
         """
         Featurize single molecule instance. Extract 3D feature value for `molecule`.
@@ -133,11 +278,15 @@ class SpatialFeaturizer(AbstractFeaturizer):
 class EccentricityFeaturizer(SpatialFeaturizer):
     """Featurizer to return eccentricity value of a molecule."""
 
+    _shape_descriptors = ("eccentricity",)
+
     def __init__(
         self,
         use_masses: bool = True,
         force: bool = True,
         conformer_generation_kwargs: Optional[Dict[str, Union[int, str]]] = None,
+        conformer_aggregation: Optional[str] = None,
+        temperature: float = 298.15,
     ):
         """Initialize class object.
 
@@ -146,11 +295,16 @@ class EccentricityFeaturizer(SpatialFeaturizer):
             force (bool): Utilize force field calculations for energy minimization. Defaults to `True`.
             conformer_generation_kwargs (Optional[Dict[str, Union[int, str]]]):
                 Keyword arguments for conformer generation. Defaults to `None`.
+            conformer_aggregation (Optional[str]): Aggregation over the conformer ensemble. One of
+                `boltzmann`, `mean`, `min` or `max`. Defaults to `None`, i.e., use the default conformer.
+            temperature (float): Temperature in Kelvin for Boltzmann weighting. Defaults to `298.15`.
         """
         super().__init__(
             use_masses=use_masses,
             force=force,
             conformer_generation_kwargs=conformer_generation_kwargs,
+            conformer_aggregation=conformer_aggregation,
+            temperature=temperature,
         )
 
         self._names = [{"noun": "eccentricity"}]
@@ -177,13 +331,7 @@ class EccentricityFeaturizer(SpatialFeaturizer):
         Returns:
             np.array: Array containing eccentricity value.
         """
-        mol = molecule.rdkit_mol
-        mol = self._get_conformer(mol)
-
-        eccentricity_value = Descriptors3D.Eccentricity(
-            mol, force=self.force, useAtomicMasses=self.use_masses
-        )
-        return np.array([eccentricity_value]).reshape(1, -1)
+        return self._featurize_shape([molecule])
 
     def implementors(self) -> List[str]:
         """
@@ -201,11 +349,15 @@ class EccentricityFeaturizer(SpatialFeaturizer):
 class AsphericityFeaturizer(SpatialFeaturizer):
     """Featurizer to return number of asphericity value of a molecule."""
 
+    _shape_descriptors = ("asphericity",)
+
     def __init__(
         self,
         use_masses: bool = True,
         force: bool = True,
         conformer_generation_kwargs: Optional[Dict[str, Union[int, str]]] = None,
+        conformer_aggregation: Optional[str] = None,
+        temperature: float = 298.15,
     ):
         """Initialize class object.
 
@@ -214,11 +366,16 @@ class AsphericityFeaturizer(SpatialFeaturizer):
             force (bool): Utilize force field calculations for energy minimization. Defaults to `True`.
             conformer_generation_kwargs (Optional[Dict[str, Union[int, str]]]):
                 Keyword arguments for conformer generation. Defaults to `None`.
+            conformer_aggregation (Optional[str]): Aggregation over the conformer ensemble. One of
+                `boltzmann`, `mean`, `min` or `max`. Defaults to `None`, i.e., use the default conformer.
+            temperature (float): Temperature in Kelvin for Boltzmann weighting. Defaults to `298.15`.
         """
         super().__init__(
             use_masses=use_masses,
             force=force,
             conformer_generation_kwargs=conformer_generation_kwargs,
+            conformer_aggregation=conformer_aggregation,
+            temperature=temperature,
         )
 
         self._names = [{"noun": "asphericity"}]
@@ -245,14 +402,7 @@ class AsphericityFeaturizer(SpatialFeaturizer):
         Returns:
             np.array: Array containing asphericity value.
         """
-        mol = molecule.reveal_hydrogens()
-
-        mol = self._get_conformer(mol)
-
-        asphericity_value = Descriptors3D.Asphericity(
-            mol, force=self.force, useAtomicMasses=self.use_masses
-        )
-        return np.array([asphericity_value]).reshape(1, -1)
+        return self._featurize_shape([molecule])
 
     def implementors(self) -> List[str]:
         """
@@ -270,11 +420,15 @@ class AsphericityFeaturizer(SpatialFeaturizer):
 class InertialShapeFactorFeaturizer(SpatialFeaturizer):
     """Featurizer to return inertial shape factor of a molecule."""
 
+    _shape_descriptors = ("inertial_shape_factor",)
+
     def __init__(
         self,
         use_masses: bool = True,
         force: bool = True,
         conformer_generation_kwargs: Optional[Dict[str, Union[int, str]]] = None,
+        conformer_aggregation: Optional[str] = None,
+        temperature: float = 298.15,
     ):
         """Initialize class object.
 
@@ -283,11 +437,16 @@ class InertialShapeFactorFeaturizer(SpatialFeaturizer):
             force (bool): Utilize force field calculations for energy minimization. Defaults to `True`.
             conformer_generation_kwargs (Optional[Dict[str, Union[int, str]]]):
                 Keyword arguments for conformer generation. Defaults to `None`.
+            conformer_aggregation (Optional[str]): Aggregation over the conformer ensemble. One of
+                `boltzmann`, `mean`, `min` or `max`. Defaults to `None`, i.e., use the default conformer.
+            temperature (float): Temperature in Kelvin for Boltzmann weighting. Defaults to `298.15`.
         """
         super().__init__(
             use_masses=use_masses,
             force=force,
             conformer_generation_kwargs=conformer_generation_kwargs,
+            conformer_aggregation=conformer_aggregation,
+            temperature=temperature,
         )
 
         self._names = [{"noun": "inertial shape factor"}]
@@ -314,14 +473,7 @@ class InertialShapeFactorFeaturizer(SpatialFeaturizer):
         Returns:
             np.array: Array containing inertia shape factor.
         """
-        mol = molecule.rdkit_mol
-
-        mol = self._get_conformer(mol)
-
-        asphericity_value = Descriptors3D.InertialShapeFactor(
-            mol, force=self.force, useAtomicMasses=self.use_masses
-        )
-        return np.array([asphericity_value]).reshape(1, -1)
+        return self._featurize_shape([molecule])
 
     def implementors(self) -> List[str]:
         """
@@ -345,6 +497,8 @@ class NPRFeaturizer(SpatialFeaturizer):
         use_masses: bool = True,
         force: bool = True,
         conformer_generation_kwargs: Optional[Dict[str, Union[int, str]]] = None,
+        conformer_aggregation: Optional[str] = None,
+        temperature: float = 298.15,
     ):
         """Initialize class object.
 
@@ -355,6 +509,9 @@ class NPRFeaturizer(SpatialFeaturizer):
             force (bool): Utilize force field calculations for energy minimization. Defaults to `True`.
             conformer_generation_kwargs (Optional[Dict[str, Union[int, str]]]):
                 Keyword arguments for conformer generation. Defaults to `None`.
+            conformer_aggregation (Optional[str]): Aggregation over the conformer ensemble. One of
+                `boltzmann`, `mean`, `min` or `max`. Defaults to `None`, i.e., use the default conformer.
+            temperature (float): Temperature in Kelvin for Boltzmann weighting. Defaults to `298.15`.
         """
         variant = variant if isinstance(variant, int) else variant.lower()
 
@@ -362,6 +519,8 @@ class NPRFeaturizer(SpatialFeaturizer):
             use_masses=use_masses,
             force=force,
             conformer_generation_kwargs=conformer_generation_kwargs,
+            conformer_aggregation=conformer_aggregation,
+            temperature=temperature,
         )
 
         if variant not in list(range(1, 3)) + ["all"]:
@@ -369,10 +528,6 @@ class NPRFeaturizer(SpatialFeaturizer):
 
         self.variant = variant
 
-        self.FUNCTION_MAP = {
-            1: Descriptors3D.NPR1,
-            2: Descriptors3D.NPR2,
-        }
 
     @property
     def get_names(self) -> List[Dict[str, str]]:
@@ -422,6 +577,18 @@ class NPRFeaturizer(SpatialFeaturizer):
         """
         return self._parse_labels()
 
+    @property
+    def _shape_descriptors(self) -> Tuple[str, ...]:
+        """Return names of shape descriptors computed by featurizer.
+
+        Args:
+            None.
+
+        Returns:
+            Tuple[str, ...]: Names of shape descriptors.
+        """
+        return tuple(label.split("_")[0] for label in self._parse_labels())
+
     def featurize(self, molecule: Molecule) -> np.array:
         """
         Featurize single molecule instance. Extract NPR value for `molecule`.
@@ -432,15 +599,7 @@ class NPRFeaturizer(SpatialFeaturizer):
         Returns:
             np.array: Array containing value(s) for NPR.
         """
-        assert isinstance(self.FUNCTION_MAP, dict)
-
-        mol = molecule.rdkit_mol
-
-        mol = self._get_conformer(mol)
-
-        npr_function = self.FUNCTION_MAP.get(self.variant, self._measure_all)
-        npr_value = npr_function(mol, force=self.force, useAtomicMasses=self.use_masses)
-        return np.array([npr_value]).reshape(1, -1)
+        return self._featurize_shape([molecule])
 
     def implementors(self) -> List[str]:
         """
@@ -464,6 +623,8 @@ class PMIFeaturizer(SpatialFeaturizer):
         use_masses: bool = True,
         force: bool = True,
         conformer_generation_kwargs: Optional[Dict[str, Union[int, str]]] = None,
+        conformer_aggregation: Optional[str] = None,
+        temperature: float = 298.15,
     ):
         """Initialize class object.
 
@@ -474,12 +635,17 @@ class PMIFeaturizer(SpatialFeaturizer):
             force (bool): Utilize force field calculations for energy minimization. Defaults to `True`.
             conformer_generation_kwargs (Optional[Dict[str, Union[int, str]]]):
                 Keyword arguments for conformer generation. Defaults to `None`.
+            conformer_aggregation (Optional[str]): Aggregation over the conformer ensemble. One of
+                `boltzmann`, `mean`, `min` or `max`. Defaults to `None`, i.e., use the default conformer.
+            temperature (float): Temperature in Kelvin for Boltzmann weighting. Defaults to `298.15`.
         """
 
         super().__init__(
             use_masses=use_masses,
             force=force,
             conformer_generation_kwargs=conformer_generation_kwargs,
+            conformer_aggregation=conformer_aggregation,
+            temperature=temperature,
         )
 
         variant = variant if isinstance(variant, int) else variant.lower()
@@ -489,7 +655,6 @@ class PMIFeaturizer(SpatialFeaturizer):
 
         self.variant = variant
 
-        self.FUNCTION_MAP = {1: Descriptors3D.PMI1, 2: Descriptors3D.PMI2, 3: Descriptors3D.PMI3}
 
     def _parse_labels(self) -> List[str]:
         """
@@ -542,6 +707,18 @@ class PMIFeaturizer(SpatialFeaturizer):
         )
         return [{"noun": join_list_elements(names) + name}]
 
+    @property
+    def _shape_descriptors(self) -> Tuple[str, ...]:
+        """Return names of shape descriptors computed by featurizer.
+
+        Args:
+            None.
+
+        Returns:
+            Tuple[str, ...]: Names of shape descriptors.
+        """
+        return tuple(label.split("_")[0] for label in self._parse_labels())
+
     def featurize(self, molecule: Molecule) -> np.array:
         """
         Featurize single molecule instance. Extract PMI value for `molecule`.
@@ -552,16 +729,7 @@ class PMIFeaturizer(SpatialFeaturizer):
         Returns:
             np.array: Array containing value(s) for PMI.
         """
-        assert isinstance(self.FUNCTION_MAP, dict)
-
-        mol = molecule.rdkit_mol
-
-        mol = self._get_conformer(mol)
-
-        pmi_function = self.FUNCTION_MAP.get(self.variant, self._measure_all)
-
-        pmi_value = pmi_function(mol, force=self.force, useAtomicMasses=self.use_masses)
-        return np.array([pmi_value]).reshape(1, -1)
+        return self._featurize_shape([molecule])
 
     def implementors(self) -> List[str]:
         """
@@ -579,6 +747,10 @@ class PMIFeaturizer(SpatialFeaturizer):
 class AtomVolumeFeaturizer(MorfeusFeaturizer):
     """Return the solvent accessible volume per atom in molecule."""
 
+    cost = "moderate"
+    backends = ("givemeconformer", "morfeus")
+    schema_field = "max_atoms"
+
     def __init__(
         self,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
@@ -613,60 +785,33 @@ class AtomVolumeFeaturizer(MorfeusFeaturizer):
 
         self.max_index = max_index
 
-    def featurize(self, molecule: Molecule) -> np.array:
-        """Featurize single molecule instance. Return the solvent accessible volume per atom in molecule.
+    def featurize_atoms(self, molecule: Molecule) -> Tuple[np.array, np.array]:
+        """Featurize single molecule instance atom by atom, without padding or aggregation.
 
         Args:
             molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): Array containing solvent accessible volumes for atoms in molecule instance.
+            Tuple[np.array, np.array]: Per-atom solvent accessible volumes and atomic numbers, ordered by atom index.
         """
         if self.qc_optimize:
             molecule = self._generate_conformer(molecule=molecule)
 
         morfeus_instance = self._get_morfeus_instance(molecule=molecule, morpheus_instance="sasa")
+        values = self._atom_values(morfeus_instance.atom_volumes)
 
-        atom_volumes = morfeus_instance.atom_volumes
-        num_atoms = len(atom_volumes)
-
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecule)
-
-        atom_volumes = [
-            (atom_volumes[i] if i <= num_atoms else 0) for i in range(1, self.max_index + 1)
-        ]
+        return values, molecule.get_atomic_numbers(hydrogen=True)
 
-        if self.aggregation is None:
-            # Track atom identities
-            atomic_numbers = self._track_atom_identity(molecule=molecule, max_index=self.max_index)
-
-            # Combine descriptors with atom identities
-            atom_volumes = atom_volumes + atomic_numbers
-        else:
-            if isinstance(self.aggregation, (list, tuple, set)):
-                atom_volumes = [
-                    self.aggregation_func[agg](atom_volumes) for agg in self.aggregation
-                ]
-            else:
-                atom_volumes = self.aggregation_func[self.aggregation](atom_volumes)
-
-        return np.array(atom_volumes).reshape(1, -1)
-
-    def featurize_many(self, molecules: List[Molecule]) -> np.array:
-        """
-        Featurize a sequence of Molecule objects.
+    def featurize(self, molecule: Molecule) -> np.array:
+        """Featurize single molecule instance. Return the solvent accessible volume per atom in molecule.
 
         Args:
-            molecules (List[Molecule]): A sequence of molecule representations.
+            molecule (Molecule): Molecule representation.
 
         Returns:
-            (np.array): An array of features for each molecule instance.
+            (np.array): Array containing solvent accessible volumes for atoms in molecule instance.
         """
-        if self.max_index is None:
-            self.max_index = self.fit_on_atom_counts(molecules=molecules)
-
-        return super().featurize_many(molecules=molecules)
+        return self._pad_atom_features(molecule=molecule)
 
     @property
     def feature_labels(self) -> List[str]:
@@ -706,11 +851,15 @@ class AtomVolumeFeaturizer(MorfeusFeaturizer):
 class SpherocityIndexFeaturizer(SpatialFeaturizer):
     """Featurizer to return the spherocity index of a molecule."""
 
+    _shape_descriptors = ("spherocity_index",)
+
     def __init__(
         self,
         use_masses: bool = True,
         force: bool = True,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
+        conformer_aggregation: Optional[str] = None,
+        temperature: float = 298.15,
     ):
         """Initialize class object.
 
@@ -718,11 +867,16 @@ class SpherocityIndexFeaturizer(SpatialFeaturizer):
             use_masses (bool): Utilize elemental masses in eccentricity calculation. Defaults to `True`.
             force (bool): Utilize force field calculations for energy minimization.
             conformer_generation_kwargs (Optional[Dict[str, Any]]): Keyword arguments for conformer generation.
+            conformer_aggregation (Optional[str]): Aggregation over the conformer ensemble. One of
+                `boltzmann`, `mean`, `min` or `max`. Defaults to `None`, i.e., use the default conformer.
+            temperature (float): Temperature in Kelvin for Boltzmann weighting. Defaults to `298.15`.
         """
         super().__init__(
             use_masses=use_masses,
             force=force,
             conformer_generation_kwargs=conformer_generation_kwargs,
+            conformer_aggregation=conformer_aggregation,
+            temperature=temperature,
         )
 
         self._names = [{"noun": "spherocity index"}]
@@ -749,14 +903,7 @@ class SpherocityIndexFeaturizer(SpatialFeaturizer):
         Returns:
             np.array: Array containing spherocity index value.
         """
-        mol = molecule.rdkit_mol
-
-        mol = self._get_conformer(mol)
-
-        spherocity_index = Descriptors3D.SpherocityIndex(
-            mol,
-        )
-        return np.array([spherocity_index]).reshape(1, -1)
+        return self._featurize_shape([molecule])
 
     def implementors(self) -> List[str]:
         """
@@ -774,11 +921,15 @@ class SpherocityIndexFeaturizer(SpatialFeaturizer):
 class RadiusOfGyrationFeaturizer(SpatialFeaturizer):
     """Featurizer to return the radius of gyration of a molecule."""
 
+    _shape_descriptors = ("radius_of_gyration",)
+
     def __init__(
         self,
         use_masses: bool = True,
         force: bool = True,
         conformer_generation_kwargs: Optional[Dict[str, Any]] = None,
+        conformer_aggregation: Optional[str] = None,
+        temperature: float = 298.15,
     ):
         """Initialize class object.
 
@@ -786,11 +937,16 @@ class RadiusOfGyrationFeaturizer(SpatialFeaturizer):
             use_masses (bool): Utilize elemental masses in eccentricity calculation. Defaults to `True`.
             force (bool): Utilize force field calculations for energy minimization.
             conformer_generation_kwargs (Optional[Dict[str, Any]]): Keyword arguments for conformer generation.
+            conformer_aggregation (Optional[str]): Aggregation over the conformer ensemble. One of
+                `boltzmann`, `mean`, `min` or `max`. Defaults to `None`, i.e., use the default conformer.
+            temperature (float): Temperature in Kelvin for Boltzmann weighting. Defaults to `298.15`.
         """
         super().__init__(
             use_masses=use_masses,
             force=force,
             conformer_generation_kwargs=conformer_generation_kwargs,
+            conformer_aggregation=conformer_aggregation,
+            temperature=temperature,
         )
 
         self._names = [{"noun": "radius of gyration"}]
@@ -817,14 +973,7 @@ class RadiusOfGyrationFeaturizer(SpatialFeaturizer):
         Returns:
             np.array: Array containing the value for the radius of gyration.
         """
-        mol = molecule.rdkit_mol
-
-        mol = self._get_conformer(mol)
-
-        gyration_radius = Descriptors3D.RadiusOfGyration(
-            mol, force=self.force, useAtomicMasses=self.use_masses
-        )
-        return np.array([gyration_radius]).reshape(1, -1)
+        return self._featurize_shape([molecule])
 
     def implementors(self) -> List[str]:
         """
@@ -21,6 +21,8 @@ __all__ = [
 class ChiralCenterCountFeaturizer(AbstractFeaturizer):
     """Return the number of chiral centers."""
 
+    cost = "moderate"
+
     def __init__(self):
         """Instantiate class."""
         super().__init__()
@@ -53,7 +55,7 @@ class ChiralCenterCountFeaturizer(AbstractFeaturizer):
         Returns:
             List[Tuple[Any, Union[Any, str]]]: Indices for chiral centers.
         """
-        mol = molecule.reveal_hydrogens()
+        mol = Chem.Mol(molecule.reveal_hydrogens())
         AllChem.EmbedMolecule(mol)
         Chem.AssignAtomChiralTagsFromStructure(mol)
         chiral_cc = Chem.FindMolChiralCenters(mol)
@@ -0,0 +1,496 @@
+# -*- coding: utf-8 -*-
+
+"""Chunked featurization of large molecule collections, streamed to disk."""
+
+import copy
+import dataclasses
+import glob
+import json
+import os
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Type, Union
+
+import pandas as pd
+
+from chemcaption.featurize.base import AbstractFeaturizer, MultipleFeaturizer
+from chemcaption.featurize.schema import FeatureSchema
+from chemcaption.molecules import Molecule, SMILESMolecule
+
+# Implemented streaming utilities
+
+__all__ = [
+    "iter_data",  # Helper function
+    "write_data",  # Helper function
+    "read_data",  # Helper function
+    "update_data",  # Helper function
+]
+
+"""Sink formats."""
+
+_FORMATS = {
+    "csv": "csv",
+    "parquet": "parquet",
+    "arrow": "arrow",
+}
+
+_MANIFEST = "_manifest.json"
+
+
+def _part_path(path: str, index: int, file_format: str) -> str:
+    """Return path to part file holding one chunk.
+
+    Args:
+        path (str): Output directory.
+        index (int): Chunk index.
+        file_format (str): Output format.
+
+    Returns:
+        str: Path to part file.
+    """
+    return os.path.join(path, f"part-{index:06d}.{_FORMATS[file_format]}")
+
+
+def _write_frame(data: pd.DataFrame, path: str, file_format: str) -> None:
+    """Write DataFrame to a single file.
+
+    The file is written under a temporary name and renamed once complete,
+    so an interrupted run never leaves a partial chunk behind.
+
+    Args:
+        data (pd.DataFrame): Data to write.
+        path (str): Destination path.
+        file_format (str): Output format.
+
+    Returns:
+        None.
+    """
+    temporary_path = path + ".tmp"
+
+    if file_format == "csv":
+        data.to_csv(temporary_path, index=False)
+    elif file_format == "parquet":
+        data.to_parquet(temporary_path, index=False)
+    else:
+        data.to_feather(temporary_path)
+
+    os.replace(temporary_path, path)
+
+
+def _read_frame(path: str, file_format: str) -> pd.DataFrame:
+    """Read DataFrame from a single file.
+
+    Args:
+        path (str): Source path.
+        file_format (str): Output format.
+
+    Returns:
+        pd.DataFrame: Data stored in file.
+    """
+    if file_format == "csv":
+        return pd.read_csv(path)
+    elif file_format == "parquet":
+        return pd.read_parquet(path)
+    else:
+        return pd.read_feather(path)
+
+
+def _read_manifest(path: str) -> Optional[dict]:
+    """Read manifest of output directory, if any.
+
+    Args:
+        path (str): Output directory.
+
+    Returns:
+        Optional[dict]: Manifest, or `None` if the directory holds no output yet.
+    """
+    manifest_path = os.path.join(path, _MANIFEST)
+    if not os.path.isfile(manifest_path):
+        return None
+
+    with open(manifest_path, "r") as file:
+        return json.load(file)
+
+
+def _write_manifest(path: str, manifest: dict) -> None:
+    """Write manifest of output directory.
+
+    Args:
+        path (str): Output directory.
+        manifest (dict): Manifest.
+
+    Returns:
+        None.
+    """
+    temporary_path = os.path.join(path, _MANIFEST + ".tmp")
+    with open(temporary_path, "w") as file:
+        json.dump(manifest, file, indent=2)
+
+    os.replace(temporary_path, os.path.join(path, _MANIFEST))
+
+
+def _schema_from_manifest(schema: dict) -> FeatureSchema:
+    """Restore feature schema stored in a manifest.
+
+    Args:
+        schema (dict): Fields of feature schema, as stored in the manifest.
+
+    Returns:
+        FeatureSchema: Feature schema.
+    """
+    return FeatureSchema(
+        max_atoms=schema["max_atoms"],
+        max_bonds=schema["max_bonds"],
+        elements=tuple(schema["elements"]),
+    )
+
+
+def _clear_output(path: str) -> None:
+    """Remove part files and manifest written by a previous run.
+
+    Args:
+        path (str): Output directory.
+
+    Returns:
+        None.
+    """
+    for extension in set(_FORMATS.values()):
+        for part in glob.glob(os.path.join(path, f"part-*.{extension}*")):
+            os.remove(part)
+
+    manifest_path = os.path.join(path, _MANIFEST)
+    if os.path.isfile(manifest_path):
+        os.remove(manifest_path)
+
+
+"""Chunking."""
+
+
+def _as_multiple_featurizer(featurizer: AbstractFeaturizer) -> MultipleFeaturizer:
+    """Wrap featurizer into a MultipleFeaturizer, if needed.
+
+    Args:
+        featurizer (AbstractFeaturizer): Featurizer.
+
+    Returns:
+        MultipleFeaturizer: Featurizer able to generate DataFrames.
+    """
+    if isinstance(featurizer, MultipleFeaturizer):
+        return featurizer
+    return MultipleFeaturizer(featurizers=[featurizer])
+
+
+def _chunks(
+    molecules: Iterable[Union[Molecule, str]], chunk_size: int
+) -> Iterator[List[Union[Molecule, str]]]:
+    """Split a (possibly lazy) iterable of molecules into lists of size `chunk_size`.
+
+    Args:
+        molecules (Iterable[Union[Molecule, str]]): Molecules or molecular strings.
+        chunk_size (int): Number of molecules per chunk.
+
+    Returns:
+        Iterator[List[Union[Molecule, str]]]: Chunks of molecules.
+    """
+    iterator = iter(molecules)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _to_molecules(
+    chunk: List[Union[Molecule, str]], representation: Type[Molecule]
+) -> List[Molecule]:
+    """Convert molecular strings in a chunk to molecule instances.
+
+    Args:
+        chunk (List[Union[Molecule, str]]): Molecules or molecular strings.
+        representation (Type[Molecule]): Molecule class used for strings.
+
+    Returns:
+        List[Molecule]: Molecule instances.
+    """
+    return [representation(item) if isinstance(item, str) else item for item in chunk]
+
+
+def _width_template(
+    featurizer: MultipleFeaturizer, schema: Optional[FeatureSchema]
+) -> Optional[MultipleFeaturizer]:
+    """Fix output widths from `schema`, keeping an unfitted copy to check later chunks against.
+
+    Args:
+        featurizer (MultipleFeaturizer): Featurizer to apply.
+        schema (Optional[FeatureSchema]): Feature schema fixing output widths, if any.
+
+    Returns:
+        Optional[MultipleFeaturizer]: Copy of `featurizer` before fitting, or `None` if its output
+            widths do not depend on the data.
+    """
+    if not featurizer.requires_schema:
+        return None
+
+    template = copy.deepcopy(featurizer)
+    if schema is not None:
+        featurizer.apply_schema(schema)
+
+    return template
+
+
+def _fit_chunk(
+    featurizer: MultipleFeaturizer,
+    template: Optional[MultipleFeaturizer],
+    molecules: List[Molecule],
+    index: int,
+) -> Optional[FeatureSchema]:
+    """Fix output widths on the first chunk, and check that later chunks fit into them.
+
+    Args:
+        featurizer (MultipleFeaturizer): Featurizer to apply.
+        template (Optional[MultipleFeaturizer]): Copy of `featurizer` before fitting, as returned by
+            `_width_template`.
+        molecules (List[Molecule]): Molecules of chunk.
+        index (int): Chunk index.
+
+    Returns:
+        Optional[FeatureSchema]: Schema fitted on `molecules`, if it fixed the output widths.
+
+    Raises:
+        ValueError: If features of `molecules` are wider than the fixed output widths, i.e.,
+            would be truncated.
+    """
+    if template is None or not molecules:
+        return None
+
+    schema = FeatureSchema.fit(molecules)
+    if featurizer.requires_schema:
+        featurizer.apply_schema(schema)
+        return schema
+
+    required = copy.deepcopy(template).apply_schema(schema)
+    for fitted, needed in zip(featurizer._leaf_featurizers(), required._leaf_featurizers()):
+        if len(needed.feature_labels) > len(fitted.feature_labels):
+            raise ValueError(
+                f"Features of chunk {index} are wider than the output widths fixed on previous "
+                f"chunks, e.g., for `{fitted.__class__.__name__}`. Pass a schema fitted on the "
+                "whole collection (`FeatureSchema.fit`), or fix `max_index`, to stream data."
+            )
+
+    return None
+
+
+def iter_data(
+    featurizer: AbstractFeaturizer,
+    molecules: Iterable[Union[Molecule, str]],
+    chunk_size: int = 1000,
+    metadata: bool = False,
+    representation: Type[Molecule] = SMILESMolecule,
+    schema: Optional[FeatureSchema] = None,
+) -> Iterator[pd.DataFrame]:
+    """Featurize molecules chunk by chunk, yielding one DataFrame per chunk.
+
+    Only one chunk of molecules and features is held in memory at a time. Data-dependent output
+    widths (e.g., `max_index`) are fixed by `schema` or else on the first chunk; later chunks which
+    would be truncated raise an error.
+
+    Args:
+        featurizer (AbstractFeaturizer): Featurizer to apply.
+        molecules (Iterable[Union[Molecule, str]]): Molecules or molecular strings. May be a generator.
+        chunk_size (int): Number of molecules per chunk. Defaults to `1000`.
+        metadata (bool): Include extra molecule information. Defaults to `False`.
+        representation (Type[Molecule]): Molecule class used for molecular strings.
+            Defaults to `SMILESMolecule`.
+        schema (Optional[FeatureSchema]): Feature schema fixing output widths, e.g., fitted on the
+            whole collection. Defaults to `None`, i.e., widths are fitted on the first chunk.
+
+    Returns:
+        Iterator[pd.DataFrame]: DataFrames generated from feature arrays.
+    """
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be a positive integer.")
+
+    featurizer = _as_multiple_featurizer(featurizer)
+    template = _width_template(featurizer, schema)
+
+    for index, chunk in enumerate(_chunks(molecules, chunk_size)):
+        chunk = _to_molecules(chunk, representation)
+        _fit_chunk(featurizer, template, chunk, index)
+        yield featurizer.generate_data(chunk, metadata=metadata)
+
+
+def write_data(
+    featurizer: AbstractFeaturizer,
+    molecules: Iterable[Union[Molecule, str]],
+    path: str,
+    chunk_size: int = 1000,
+    file_format: str = "parquet",
+    metadata: bool = False,
+    resume: bool = True,
+    representation: Type[Molecule] = SMILESMolecule,
+    schema: Optional[FeatureSchema] = None,
+) -> str:
+    """Featurize molecules chunk by chunk and write every chunk to its own part file.
+
+    Part files are written atomically into directory `path` (`part-000000.parquet`, ...).
+    With `resume=True`, chunks whose part file already exists are skipped without featurization,
+    so an interrupted run picks up from the last completed chunk. Data-dependent output widths are
+    fixed as in `iter_data`. The schema fixing them is kept in the manifest, so a resumed run uses
+    the widths of the original run.
+
+    Args:
+        featurizer (AbstractFeaturizer): Featurizer to apply.
+        molecules (Iterable[Union[Molecule, str]]): Molecules or molecular strings. May be a generator.
+        path (str): Output directory.
+        chunk_size (int): Number of molecules per chunk. Defaults to `1000`.
+        file_format (str): One of `parquet`, `arrow` (Arrow IPC/Feather) or `csv`. Defaults to `parquet`.
+            `parquet` and `arrow` require `pyarrow`.
+        metadata (bool): Include extra molecule information. Defaults to `False`.
+        resume (bool): Keep chunks written by a previous run. If `False`, previous output is removed.
+            Defaults to `True`.
+        representation (Type[Molecule]): Molecule class used for molecular strings.
+            Defaults to `SMILESMolecule`.
+        schema (Optional[FeatureSchema]): Feature schema fixing output widths, e.g., fitted on the
+            whole collection. Defaults to `None`, i.e., widths are fitted on the first chunk.
+
+    Returns:
+        str: Output directory.
+    """
+    file_format = file_format.lower()
+    if file_format not in _FORMATS:
+        raise ValueError(
+            f"Invalid file format '{file_format}'. "
+            f"Valid file formats are: {', '.join(_FORMATS.keys())}."
+        )
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be a positive integer.")
+
+    os.makedirs(path, exist_ok=True)
+    featurizer = _as_multiple_featurizer(featurizer)
+    template = _width_template(featurizer, schema)
+
+    manifest = _read_manifest(path)
+    if manifest is not None and not resume:
+        _clear_output(path)
+        manifest = None
+
+    if manifest is not None and (
+        manifest["chunk_size"] != chunk_size
+        or manifest["file_format"] != file_format
+        or manifest["metadata"] != metadata
+    ):
+        raise ValueError(
+            f"Output in '{path}' was written with chunk_size={manifest['chunk_size']}, "
+            f"file_format='{manifest['file_format']}' and metadata={manifest['metadata']}. "
+            "Use the same settings to resume, or pass `resume=False` to start over."
+        )
+
+    if manifest is not None and manifest.get("schema") is not None:
+        # Widths fixed by the original run, before any chunk was skipped
+        featurizer.apply_schema(_schema_from_manifest(manifest["schema"]))
+
+    for index, chunk in enumerate(_chunks(molecules, chunk_size)):
+        part_path = _part_path(path, index, file_format)
+        if os.path.isfile(part_path):
+            continue
+
+        chunk = _to_molecules(chunk, representation)
+        schema = _fit_chunk(featurizer, template, chunk, index) or schema
+
+        data = featurizer.generate_data(chunk, metadata=metadata)
+        columns = [str(column) for column in data.columns]
+
+        if manifest is None:
+            manifest = dict(
+                chunk_size=chunk_size,
+                file_format=file_format,
+                metadata=metadata,
+                columns=columns,
+                schema=dataclasses.asdict(schema) if schema is not None else None,
+            )
+            _write_manifest(path, manifest)
+        elif manifest["columns"] != columns:
+            raise ValueError(
+                f"Columns generated for chunk {index} do not match columns of previous chunks. "
+                "Fix the feature width of size-dependent featurizers (e.g., `max_index`) to stream data."
+            )
+
+        _write_frame(data, part_path, file_format)
+
+    return path
+
+
+def read_data(path: str) -> pd.DataFrame:
+    """Read all chunks written by `write_data` into one DataFrame.
+
+    Args:
+        path (str): Output directory.
+
+    Returns:
+        pd.DataFrame: Concatenated data, in input order.
+    """
+    manifest = _read_manifest(path)
+    if manifest is None:
+        raise ValueError(f"No featurization output found in '{path}'.")
+
+    file_format = manifest["file_format"]
+    parts = sorted(glob.glob(os.path.join(path, f"part-*.{_FORMATS[file_format]}")))
+
+    if not parts:
+        return pd.DataFrame(columns=manifest["columns"])
+
+    return pd.concat(
+        [_read_frame(part, file_format) for part in parts], axis=0, ignore_index=True
+    )
+
+
+def update_data(
+    featurizer: AbstractFeaturizer,
+    molecules: Iterable[Union[Molecule, str]],
+    path: str,
+    file_format: Optional[str] = None,
+    representation: Type[Molecule] = SMILESMolecule,
+) -> str:
+    """Update a feature table on disk in place, computing only missing cells.
+
+    New molecules are appended as rows and new featurizers as column blocks, see
+    `MultipleFeaturizer.update_data`. The table is written back atomically. If `path` does not
+    exist yet, a table is generated from scratch.
+
+    Args:
+        featurizer (AbstractFeaturizer): Featurizer defining the columns of the updated table.
+        molecules (Iterable[Union[Molecule, str]]): Molecules or molecular strings to add.
+            Molecules already in the table are skipped.
+        path (str): Path to a single file written with molecule metadata, e.g., by
+            `generate_data(..., metadata=True)`.
+        file_format (Optional[str]): One of `parquet`, `arrow` (Arrow IPC/Feather) or `csv`.
+            Defaults to `None`, i.e., inferred from the file extension.
+        representation (Type[Molecule]): Molecule class used for molecular strings and existing
+            rows. Defaults to `SMILESMolecule`.
+
+    Returns:
+        str: Path to updated table.
+    """
+    if file_format is None:
+        file_format = os.path.splitext(path)[1].lstrip(".")
+    file_format = file_format.lower()
+    if file_format not in _FORMATS:
+        raise ValueError(
+            f"Invalid file format '{file_format}'. "
+            f"Valid file formats are: {', '.join(_FORMATS.keys())}."
+        )
+
+    featurizer = _as_multiple_featurizer(featurizer)
+    molecules = _to_molecules(list(molecules), representation)
+
+    if os.path.isfile(path):
+        data = _read_frame(path, file_format)
+    else:
+        data = pd.DataFrame(columns=["representation_system", "representation_string"])
+
+    data = featurizer.update_data(data, molecules, representation=representation)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    _write_frame(data, path, file_format)
+
+    return path
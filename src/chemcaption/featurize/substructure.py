@@ -2,14 +2,19 @@
 
 """Featurizers describing the structure of (and/or the count and/or presence of substructures in) a molecule."""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import rdkit
 from rdkit.Chem import GetPeriodicTable, PeriodicTable
 
 from chemcaption.featurize.base import AbstractFeaturizer
-from chemcaption.featurize.utils import join_list_elements
+from chemcaption.featurize.utils import (
+    compile_smarts,
+    join_list_elements,
+    pattern_fingerprint,
+    smarts_screen,
+)
 from chemcaption.molecules import Molecule
 from chemcaption.presets import SMARTS_MAP
 
@@ -22,12 +27,15 @@ __all__ = ["FragmentSearchFeaturizer", "IsomorphismFeaturizer", "TopologyCountFe
 class FragmentSearchFeaturizer(AbstractFeaturizer):
     """A featurizer for molecular substructure search via SMARTS."""
 
+    _derived_attributes = ("_patterns", "_screens")
+
     def __init__(
         self,
         smarts: List[str],
         names: Optional[List[str]],
         count: bool = True,
         preset_name: str = "custom",
+        screen: bool = True,
     ):
         """
         Initialize class.
@@ -42,11 +50,19 @@ class FragmentSearchFeaturizer(AbstractFeaturizer):
                 Otherwise, only encode presence.
                 Defaults to `True`.
             preset_name (str): Name to give preset of interest. Defaults to `custom`.
+            screen (bool): Skip substructure matching for patterns that cannot match a molecule,
+                based on pattern fingerprints and atom counts. Does not change results. Defaults to `True`.
+
+        Raises:
+            ValueError: If any of the SMARTS strings is invalid.
         """
         super().__init__()
 
         self.smart_names = names if names is not None else smarts
         self.smarts = smarts
+        self._patterns: Optional[List[rdkit.Chem.Mol]] = [compile_smarts(smart) for smart in smarts]
+        self._screens: Optional[Tuple[np.array, np.array]] = None
+        self.screen = screen
         self.count = count
         self.preset_name = preset_name
         self.constraint = (
@@ -57,6 +73,63 @@ class FragmentSearchFeaturizer(AbstractFeaturizer):
 
         self.prompt_template = "{PROPERTY_NAME} in the molecule with {REPR_SYSTEM} {REPR_STRING}?"
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return picklable state. Compiled patterns are rebuilt from the process-wide registry."""
+        state = self.__dict__.copy()
+        state["_patterns"] = None
+        state["_screens"] = None
+        return state
+
+    @property
+    def patterns(self) -> List[rdkit.Chem.Mol]:
+        """Return compiled SMARTS patterns.
+
+        Args:
+            None.
+
+        Returns:
+            List[Chem.Mol]: Query molecules, one per SMARTS string.
+        """
+        if self._patterns is None:
+            self._patterns = [compile_smarts(smart) for smart in self.smarts]
+        return self._patterns
+
+    @property
+    def screens(self) -> Tuple[np.array, np.array]:
+        """Return screening data for SMARTS patterns.
+
+        Args:
+            None.
+
+        Returns:
+            Tuple[np.array, np.array]: Tuple containing (a). packed pattern fingerprints, one row per pattern and
+                (b). number of query atoms per pattern.
+        """
+        if self._screens is None:
+            fingerprints, atom_counts = zip(*[smarts_screen(smart) for smart in self.smarts])
+            self._screens = np.stack(fingerprints), np.array(atom_counts)
+        return self._screens
+
+    def _screen_patterns(self, molecule: Molecule) -> np.array:
+        """Return indices of patterns which may match a molecule.
+
+        Args:
+            molecule (Molecule): Molecule representation.
+
+        Returns:
+            np.array: Indices of candidate patterns.
+        """
+        fingerprints, atom_counts = self.screens
+        fingerprint = molecule.get_derived(
+            "pattern_fingerprint", lambda: pattern_fingerprint(molecule.rdkit_mol)
+        )
+
+        # Every bit set for the pattern must be set for the molecule
+        possible = ~np.any(fingerprints & ~fingerprint, axis=1)
+        possible &= atom_counts <= molecule.rdkit_mol.GetNumAtoms()
+
+        return np.flatnonzero(possible)
+
     @property
     def get_names(self) -> List[Dict[str, str]]:
         """Return names of extracted features.
@@ -85,7 +158,7 @@ class FragmentSearchFeaturizer(AbstractFeaturizer):
         return [{"noun": name}]
 
     @classmethod
-    def from_preset(cls, preset: str, count: bool = True):
+    def from_preset(cls, preset: str, count: bool = True, screen: bool = True):
         """Generate class instance with atomic numbers of interest based on predefined presets.
 
         Args:
@@ -100,6 +173,8 @@ class FragmentSearchFeaturizer(AbstractFeaturizer):
                 * `all`
 
             count (bool): If set to True, count pattern frequency.
+            screen (bool): Skip substructure matching for patterns that cannot match a molecule.
+                Defaults to `True`.
         """
 
         if preset not in SMARTS_MAP:
@@ -110,7 +185,11 @@ class FragmentSearchFeaturizer(AbstractFeaturizer):
 
         smarts_set = SMARTS_MAP[preset]
         return cls(
-            smarts=smarts_set["smarts"], names=smarts_set["names"], count=count, preset_name=preset
+            smarts=smarts_set["smarts"],
+            names=smarts_set["names"],
+            count=count,
+            preset_name=preset,
+            screen=screen,
         )
 
     def featurize(self, molecule: Molecule) -> np.array:
@@ -129,16 +208,17 @@ class FragmentSearchFeaturizer(AbstractFeaturizer):
         Returns:
             np.array: Array containing integer counts/signifier of pattern presence.
         """
-        if self.count:
-            results = [
-                len(molecule.rdkit_mol.GetSubstructMatches(rdkit.Chem.MolFromSmarts(smart)))
-                for smart in self.smarts
-            ]
-        else:
-            results = [
-                int(molecule.rdkit_mol.HasSubstructMatch(rdkit.Chem.MolFromSmarts(smart)))
-                for smart in self.smarts
-            ]
+        mol = molecule.rdkit_mol
+        patterns = self.patterns
+
+        candidates = self._screen_patterns(molecule) if self.screen else range(len(patterns))
+
+        results = np.zeros(len(patterns), dtype=int)
+        for ix in candidates:
+            if self.count:
+                results[ix] = len(mol.GetSubstructMatches(patterns[ix]))
+            else:
+                results[ix] = int(mol.HasSubstructMatch(patterns[ix]))
 
         return np.array(results).reshape((1, -1))
 
@@ -188,6 +268,8 @@ class FragmentSearchFeaturizer(AbstractFeaturizer):
 class IsomorphismFeaturizer(AbstractFeaturizer):
     """Convert molecule graph to Weisfeiler-Lehman hash."""
 
+    numeric = False
+
     def __init__(self):
         """Instantiate class."""
         super().__init__()
@@ -342,20 +424,20 @@ class TopologyCountFeaturizer(AbstractFeaturizer):
         Returns:
             int: Number of unique environments.
         """
-        mol = molecule.reveal_hydrogens() if atomic_number == 1 else molecule.rdkit_mol
+        hydrogen = atomic_number == 1
+        mol = molecule.reveal_hydrogens() if hydrogen else molecule.rdkit_mol
 
-        # Get unique canonical atom rankings
-        atom_ranks = list(rdkit.Chem.rdmolfiles.CanonicalRankAtoms(mol, breakTies=False))
+        # Get unique canonical atom rankings. Shared by all elements of interest.
+        atom_ranks = molecule.get_derived(
+            f"canonical_ranks_{hydrogen}",
+            lambda: np.array(list(rdkit.Chem.rdmolfiles.CanonicalRankAtoms(mol, breakTies=False))),
+        )
 
         # Select the unique element environments
-        atom_ranks = np.array(atom_ranks)
+        atomic_numbers = molecule.get_atomic_numbers(hydrogen=hydrogen)
 
-        # Atom indices
-        atom_indices = [
-            atom.GetIdx() for atom in mol.GetAtoms() if atom.GetAtomicNum() == atomic_number
-        ]
         # Count them
-        return len(set(atom_ranks[atom_indices]))
+        return len(set(atom_ranks[atomic_numbers == atomic_number]))
 
     def implementors(self) -> List[str]:
         """
@@ -21,6 +21,9 @@ __all__ = [
 class RotationalSymmetryNumberFeaturizer(AbstractFeaturizer):
     """Obtain the rotational symmetry number of a molecule."""
 
+    cost = "moderate"
+    backends = ("givemeconformer", "pymatgen")
+
     def __init__(self):
         """Initialize instance."""
         super().__init__()
@@ -79,6 +82,9 @@ class RotationalSymmetryNumberFeaturizer(AbstractFeaturizer):
 class PointGroupFeaturizer(AbstractFeaturizer):
     """Return point group of molecule."""
 
+    cost = "moderate"
+    backends = ("givemeconformer", "pymatgen")
+
     def __init__(self):
         """Initialize instance."""
         super().__init__()
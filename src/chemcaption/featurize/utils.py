@@ -6,9 +6,9 @@ from functools import lru_cache
 from typing import Any, List, Tuple
 
 import numpy as np
-from pymatgen.core import IMolecule  # use immutable for caching
-from pymatgen.symmetry.analyzer import PointGroupAnalyzer
-from rdkit import Chem
+from rdkit import Chem, DataStructs
+
+from chemcaption.featurize.conformers import get_conformer_service
 
 # Implemented helper functions.
 
@@ -19,7 +19,9 @@ __all__ = [
     "get_atom_symbols_and_positions",  # Helper function
     "cached_conformer",  # Helper function
     "apply_featurizer",  # Helper function
-    "cached_conformer",
+    "compile_smarts",  # Helper function
+    "pattern_fingerprint",  # Helper function
+    "smarts_screen",  # Helper function
 ]
 
 
@@ -34,6 +36,7 @@ def join_list_elements(elements: Any) -> str:
 @lru_cache(maxsize=128)
 def _rdkit_to_pymatgen(mol):
     from givemeconformer.api import get_conformer
+    from pymatgen.core import IMolecule  # use immutable for caching
 
     c = get_conformer(Chem.MolToSmiles(mol))[0]
     m = IMolecule(*get_atom_symbols_and_positions(c))
@@ -42,6 +45,8 @@ def _rdkit_to_pymatgen(mol):
 
 @lru_cache(maxsize=128)
 def _pmg_mol_to_pointgroup_analyzer(mol):
+    from pymatgen.symmetry.analyzer import PointGroupAnalyzer
+
     analyzer = PointGroupAnalyzer(mol)
     return analyzer
 
@@ -62,16 +67,70 @@ def get_atom_symbols_and_positions(conf: Any) -> Tuple[List, List]:
     return symbols, positions
 
 
-@lru_cache(maxsize=None)
+@lru_cache(maxsize=256)
 def cached_conformer(smiles, kwargs):
-    """Returns cached konformer."""
+    """Returns cached konformer.
+
+    Conformers are generated by the shared conformer service (see
+    `chemcaption.featurize.conformers.get_conformer_service`), which enforces time and attempt
+    budgets and, if a persistent conformer cache is configured (see
+    `chemcaption.featurize.cache.set_conformer_cache`), stores them on disk keyed by SMILES
+    and generation kwargs, so pool workers and later runs reuse them.
+
+    Raises:
+        RuntimeError: If no conformer could be generated within budget.
+    """
+    return get_conformer_service().get(smiles, kwargs)
+
+
+@lru_cache(maxsize=None)
+def compile_smarts(smarts: str) -> Chem.Mol:
+    """Return query molecule for a SMARTS string. Patterns are compiled once per process.
+
+    Args:
+        smarts (str): SMARTS string.
+
+    Returns:
+        Chem.Mol: Query molecule. Shared between callers and must not be modified.
+
+    Raises:
+        ValueError: If `smarts` is not a valid SMARTS string.
+    """
+    pattern = Chem.MolFromSmarts(smarts)
+    if pattern is None:
+        raise ValueError(f"Invalid SMARTS pattern '{smarts}'.")
+    return pattern
 
-    from givemeconformer.api import _get_conformer
 
-    mol, conformers = _get_conformer(smiles=smiles, **kwargs)
-    for conf in conformers.keys():
-        mol.AddConformer(mol.GetConformer(conf))
-    return mol
+def pattern_fingerprint(mol: Chem.Mol) -> np.array:
+    """Return packed RDKit pattern fingerprint for substructure screening.
+
+    Args:
+        mol (Chem.Mol): Molecule or query molecule.
+
+    Returns:
+        np.array: Fingerprint bits packed into an array of type `uint8`.
+    """
+    bits = np.zeros((0,), dtype=np.uint8)
+    DataStructs.ConvertToNumpyArray(Chem.PatternFingerprint(mol), bits)
+    return np.packbits(bits.astype(bool))
+
+
+@lru_cache(maxsize=None)
+def smarts_screen(smarts: str) -> Tuple[np.array, int]:
+    """Return screening data for a SMARTS pattern. Computed once per process.
+
+    A molecule can only match the pattern if its pattern fingerprint contains all bits of the
+    pattern's fingerprint and it has at least as many atoms as the pattern.
+
+    Args:
+        smarts (str): SMARTS string.
+
+    Returns:
+        Tuple[np.array, int]: Tuple containing (a). packed pattern fingerprint and (b). number of query atoms.
+    """
+    pattern = compile_smarts(smarts)
+    return pattern_fingerprint(pattern), pattern.GetNumAtoms()
 
 
 def apply_featurizer(featurize_molecule_pair) -> np.array:
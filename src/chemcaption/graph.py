@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""Graph representation for molecular instances."""
+
+from typing import Union
+
+import networkx as nx
+from rdkit import Chem
+
+from chemcaption.molecules import PERIODIC_TABLE
+
+# Implemented graph classes.
+
+__all__ = [
+    "MoleculeGraph",
+]
+
+"""Graph representation"""
+
+
+class MoleculeGraph(nx.Graph):
+    """Graph representation for molecular instances."""
+
+    def __init__(self, molecule: Chem.Mol):
+        """Initialize instance.
+
+        Args:
+            molecule (Chem.Mol): RDKit molecular instance.
+
+        """
+        super().__init__()
+
+        self.molecule = molecule
+        self.graph = self.molecule_to_graph()
+        self._hash = None
+
+    def molecule_to_graph(self) -> nx.Graph:
+        """Convert molecule object to graph representation.
+
+        Args:
+            None.
+
+        Returns:
+            nx.Graph: Molecular graph.
+        """
+        graph = nx.Graph()
+
+        # Generate nodes
+
+        nodes = [
+            (
+                atom.GetIdx(),
+                {
+                    "atomic_mass": PERIODIC_TABLE.GetAtomicWeight(atom.GetAtomicNum()),
+                    "atomic_num": atom.GetAtomicNum(),
+                    "atom_symbol": PERIODIC_TABLE.GetElementSymbol(atom.GetAtomicNum()),
+                },
+            )
+            for atom in self.molecule.GetAtoms()
+        ]
+
+        # Generate edges
+
+        edges = [
+            (bond.GetBeginAtomIdx(), bond.GetEndAtomIdx(), {"bond_type": bond.GetBondType()})
+            for bond in self.molecule.GetBonds()
+        ]
+
+        # Store nodes and edges in graph
+
+        graph.add_nodes_from(nodes_for_adding=nodes)
+        graph.add_edges_from(ebunch_to_add=edges)
+
+        return graph
+
+    def weisfeiler_lehman_graph_hash(self) -> Union[str, None]:
+        """Return graph hash according to Weisfeiler-Lehman isomorphism test.
+
+        Args:
+            None.
+
+        Returns:
+            str: Weisfeiler-Lehman graph hash.
+        """
+        if self._hash is None:
+            self._hash = nx.weisfeiler_lehman_graph_hash(self.graph)
+        return self._hash
@@ -3,101 +3,46 @@
 """Utility imports."""
 
 from abc import ABC, abstractmethod
-from typing import Union, List, Generator
-
-import networkx as nx
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    List,
+    Generator,
+)
+
+import numpy as np
 import rdkit
-from rdkit import Chem
-from selfies import decoder
+from rdkit import Chem, rdBase
 from typing_extensions import TypeAlias
 
+if TYPE_CHECKING:
+    from chemcaption.featurize.execution import ExecutionBackend
+    from chemcaption.graph import MoleculeGraph
+
 # Implemented molecular representation classes.
 
 __all__ = [
     "Molecule",
     "MoleculeGraph",
+    "MoleculeCollection",
     "AbstractMolecule",
     "SMILESMolecule",
     "SELFIESMolecule",
     "InChIMolecule",
+    "canonicalize_smiles",
     "DISPATCH_MAP",
     "PERIODIC_TABLE",
 ]
 
 PERIODIC_TABLE = rdkit.Chem.GetPeriodicTable()  # Periodic table
 
-"""Graph representation"""
-
-
-class MoleculeGraph(nx.Graph):
-    """Graph representation for molecular instances."""
-
-    def __init__(self, molecule: Chem.Mol):
-        """Initialize instance.
-
-        Args:
-            molecule (Chem.Mol): RDKit molecular instance.
-
-        """
-        super().__init__()
-
-        self.molecule = molecule
-        self.graph = self.molecule_to_graph()
-        self._hash = None
-
-    def molecule_to_graph(self) -> nx.Graph:
-        """Convert molecule object to graph representation.
-
-        Args:
-            None.
-
-        Returns:
-            nx.Graph: Molecular graph.
-        """
-        graph = nx.Graph()
-
-        # Generate nodes
-
-        nodes = [
-            (
-                atom.GetIdx(),
-                {
-                    "atomic_mass": PERIODIC_TABLE.GetAtomicWeight(atom.GetAtomicNum()),
-                    "atomic_num": atom.GetAtomicNum(),
-                    "atom_symbol": PERIODIC_TABLE.GetElementSymbol(atom.GetAtomicNum()),
-                },
-            )
-            for atom in self.molecule.GetAtoms()
-        ]
-
-        # Generate edges
-
-        edges = [
-            (bond.GetBeginAtomIdx(), bond.GetEndAtomIdx(), {"bond_type": bond.GetBondType()})
-            for bond in self.molecule.GetBonds()
-        ]
-
-        # Store nodes and edges in graph
-
-        graph.add_nodes_from(nodes_for_adding=nodes)
-        graph.add_edges_from(ebunch_to_add=edges)
-
-        return graph
-
-    def weisfeiler_lehman_graph_hash(self) -> Union[str, None]:
-        """Return graph hash according to Weisfeiler-Lehman isomorphism test.
-
-        Args:
-            None.
-
-        Returns:
-            str: Weisfeiler-Lehman graph hash.
-        """
-        if self._hash is None:
-            self._hash = nx.weisfeiler_lehman_graph_hash(self.graph)
-        return self._hash
-
-
 """Abstract class."""
 
 
@@ -110,6 +55,7 @@ class AbstractMolecule(ABC):
         """Instantiate base class for molecular representation."""
         self._rdkit_mol = None
         self.representation_string = None
+        self._cache: Dict[str, Any] = {}
 
     @abstractmethod
     def get_rdkit_mol(self):
@@ -118,13 +64,22 @@ class AbstractMolecule(ABC):
 
     @property
     def rdkit_mol(self) -> Chem.Mol:
-        """Get molecular representation via rdkit. Getter method."""
+        """Get molecular representation via rdkit. Getter method. Built on first access if needed."""
+        if self._rdkit_mol is None and self.representation_string is not None:
+            self._rdkit_mol = self.get_rdkit_mol()
         return self._rdkit_mol
 
     @rdkit_mol.setter
     def rdkit_mol(self, mol: Chem.Mol) -> None:
-        """Set molecular representation via rdkit."""
+        """Set molecular representation via rdkit. Invalidates derived structures."""
         self._rdkit_mol = mol
+        self.clear_cache()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return picklable state. Derived structures are dropped and recomputed on demand."""
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
 
     def __repr__(self) -> str:
         """Return string representation of molecule object.
@@ -148,6 +103,33 @@ class AbstractMolecule(ABC):
         """
         return self.__repr__().split("Molecule")[0]
 
+    def get_derived(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Return structure derived from `rdkit_mol`, computing it on first access.
+
+        Derived structures are cached on the instance until `rdkit_mol` is set.
+
+        Args:
+            key (str): Cache key for derived structure.
+            factory (Callable[[], Any]): Function computing the derived structure.
+
+        Returns:
+            Any: Derived structure.
+        """
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def clear_cache(self) -> None:
+        """Drop all cached derived structures.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        self._cache = {}
+
     def get_atoms(self, hydrogen=True, **kwargs):
         """
         Return atomic representation for all atoms present in molecule.
@@ -165,13 +147,75 @@ class AbstractMolecule(ABC):
         """
         Explicitly represent hydrogen atoms in molecular structure.
 
+        The result is cached and shared between callers; copy it (i.e., `Chem.Mol(mol)`) before modifying it.
+
         Args:
             **kwargs (dict): Keyword arguments.
 
         Returns:
             Chem.Mol: RDKit molecular object with explicit hydrogens.
         """
-        return Chem.rdmolops.AddHs(self.rdkit_mol, **kwargs)
+        key = "explicit_hydrogen_mol" + (str(sorted(kwargs.items())) if kwargs else "")
+        return self.get_derived(key, lambda: Chem.rdmolops.AddHs(self.rdkit_mol, **kwargs))
+
+    def get_atomic_numbers(self, hydrogen: bool = True) -> np.array:
+        """Return atomic numbers of atoms in molecule, ordered by atom index.
+
+        Args:
+            hydrogen (bool): Include explicit hydrogen atoms. Defaults to `True`.
+
+        Returns:
+            np.array: Integer array of atomic numbers.
+        """
+        return self.get_derived(
+            f"atomic_numbers_{hydrogen}",
+            lambda: np.array(
+                [atom.GetAtomicNum() for atom in self.get_atoms(hydrogen=hydrogen)], dtype=int
+            ),
+        )
+
+    def get_atom_symbols(self, hydrogen: bool = True) -> np.array:
+        """Return element symbols of atoms in molecule, ordered by atom index.
+
+        Args:
+            hydrogen (bool): Include explicit hydrogen atoms. Defaults to `True`.
+
+        Returns:
+            np.array: String array of element symbols.
+        """
+        return self.get_derived(
+            f"atom_symbols_{hydrogen}",
+            lambda: np.array(
+                [
+                    PERIODIC_TABLE.GetElementSymbol(int(atomic_number))
+                    for atomic_number in self.get_atomic_numbers(hydrogen=hydrogen)
+                ]
+            ),
+        )
+
+    def get_atom_rings(self, hydrogen: bool = False) -> tuple:
+        """Return atom indices of rings in molecule.
+
+        Args:
+            hydrogen (bool): Use molecule with explicit hydrogen atoms. Defaults to `False`.
+
+        Returns:
+            tuple: Tuple of atom index tuples, one per ring.
+        """
+        mol = self.reveal_hydrogens() if hydrogen else self.rdkit_mol
+        return self.get_derived(f"atom_rings_{hydrogen}", lambda: mol.GetRingInfo().AtomRings())
+
+    @property
+    def canonical_smiles(self) -> str:
+        """Return canonical SMILES string for molecule.
+
+        Args:
+            None.
+
+        Returns:
+            str: Canonical SMILES string.
+        """
+        return self.get_derived("canonical_smiles", lambda: Chem.MolToSmiles(self.rdkit_mol))
 
     def get_composition(self) -> str:
         """Get composition of molecule.
@@ -184,7 +228,7 @@ class AbstractMolecule(ABC):
         """
         return Chem.rdMolDescriptors.CalcMolFormula(self.rdkit_mol)
 
-    def to_graph(self) -> MoleculeGraph:
+    def to_graph(self) -> "MoleculeGraph":
         """Convert molecule to graph.
 
         Args:
@@ -193,21 +237,79 @@ class AbstractMolecule(ABC):
         Returns:
             MoleculeGraph: Molecular graph instance.
         """
-        graph = MoleculeGraph(molecule=self.reveal_hydrogens())
-        return graph
+        from chemcaption.graph import MoleculeGraph
+
+        return self.get_derived("graph", lambda: MoleculeGraph(molecule=self.reveal_hydrogens()))
 
 
 """Lower level Molecule classes"""
 
 
+def canonicalize_smiles(smiles: str) -> str:
+    """Return canonical SMILES string. The input is parsed once.
+
+    Args:
+        smiles (str): SMILES string.
+
+    Returns:
+        str: Canonical SMILES string.
+
+    Raises:
+        ValueError: If `smiles` is not a valid SMILES string.
+    """
+    mol = Chem.MolFromSmiles(smiles) if isinstance(smiles, str) else None
+    if mol is None:
+        raise ValueError(f"Invalid SMILES string '{smiles}'.")
+    return Chem.MolToSmiles(mol)
+
+
+def _try_canonicalize_smiles(smiles: str) -> Tuple[Optional[str], Optional[str]]:
+    """Canonicalize SMILES string, reporting failures instead of raising.
+
+    Args:
+        smiles (str): SMILES string.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: Tuple containing (a). canonical SMILES string or `None`
+            and (b). error message or `None`.
+    """
+    with rdBase.BlockLogs():
+        try:
+            return canonicalize_smiles(smiles), None
+        except ValueError as error:
+            return None, str(error)
+
+
 class SMILESMolecule(AbstractMolecule):
-    """Lower level molecular representation for SMILES string representation."""
+    """Lower level molecular representation for SMILES string representation.
+
+    The SMILES string is canonicalized on construction. The rdkit molecule is parsed from the canonical
+    string on first access, so its atoms follow the canonical order.
+    """
 
     def __init__(self, representation_string: str):
-        """Initialize class."""
+        """Initialize class.
+
+        Raises:
+            ValueError: If `representation_string` is not a valid SMILES string.
+        """
         super().__init__()
-        self.representation_string = Chem.CanonSmiles(representation_string)
-        self._rdkit_mol = self.get_rdkit_mol()
+        self.representation_string = canonicalize_smiles(representation_string)
+
+    @classmethod
+    def from_canonical(cls, canonical_smiles: str) -> "SMILESMolecule":
+        """Create molecule from a SMILES string which is already canonical, skipping canonicalization.
+
+        Args:
+            canonical_smiles (str): Canonical SMILES string, e.g., as returned by `canonicalize_smiles`.
+
+        Returns:
+            SMILESMolecule: Molecule instance.
+        """
+        molecule = cls.__new__(cls)
+        AbstractMolecule.__init__(molecule)
+        molecule.representation_string = canonical_smiles
+        return molecule
 
     def get_rdkit_mol(self) -> Chem.Mol:
         """Get rdkit molecular representation from SMILES string."""
@@ -220,6 +322,8 @@ class SELFIESMolecule(AbstractMolecule):
     def __init__(self, representation_string: str):
         """Initialize class."""
         super().__init__()
+        from selfies import decoder
+
         self.representation_string = representation_string
         self.smiles_rep = decoder(representation_string)
 
@@ -260,7 +364,8 @@ Molecule: TypeAlias = Union[SMILESMolecule, InChIMolecule, SELFIESMolecule]
 
 """Molecule collection."""
 
-class MoleculeCollection():
+
+class MoleculeCollection:
     """Holds a collection of molecules of the same type.
 
     Args:
@@ -268,13 +373,110 @@ class MoleculeCollection():
         representation (Molecule): molecule representation we want to use.
     """
 
-    def __init__(self,
-                molecules:List[str],
-                representation: Molecule) -> None:
+    def __init__(self, molecules: List[str], representation: Type[Molecule]) -> None:
         self.molecules = molecules
         self.representation = representation
 
+        # Set by batch constructors: strings are canonical, one entry per input row, rejected rows
+        self.canonical = False
+        self.index: Optional[np.array] = None
+        self.errors: List[Tuple[int, str, str]] = []
+
+    @classmethod
+    def from_smiles(
+        cls,
+        smiles: Iterable[str],
+        n_jobs: Optional[int] = 1,
+        deduplicate: bool = True,
+        backend: Optional["ExecutionBackend"] = None,
+    ) -> "MoleculeCollection":
+        """Parse and canonicalize a batch of SMILES strings.
+
+        Each input is parsed once. Invalid inputs do not raise; they are reported in `errors` as
+        `(row, input, message)` tuples. `index` maps every input row to the position of its molecule
+        in the collection, or to `-1` for invalid rows.
+
+        Args:
+            smiles (Iterable[str]): SMILES strings.
+            n_jobs (Optional[int]): Number of processes used for canonicalization. Defaults to `1`,
+                i.e., canonicalize in-process. `None` uses all CPUs.
+            deduplicate (bool): Keep a single molecule per canonical SMILES string. Defaults to `True`.
+            backend (Optional[ExecutionBackend]): Execution backend to use instead of `n_jobs`.
+                Defaults to `None`.
+
+        Returns:
+            MoleculeCollection: Collection of `SMILESMolecule` instances.
+        """
+        from chemcaption.featurize.execution import ExecutionBackend
+
+        smiles = list(smiles)
+
+        if backend is not None:
+            results = backend.map(_try_canonicalize_smiles, smiles)
+        else:
+            mode = "serial" if n_jobs == 1 else "process"
+            with ExecutionBackend(mode=mode, n_jobs=n_jobs) as backend:
+                results = backend.map(_try_canonicalize_smiles, smiles)
+
+        molecules: List[str] = []
+        positions: Dict[str, int] = {}
+        index = np.full(len(smiles), -1, dtype=np.int64)
+        errors = []
+
+        for row, (string, (canonical, error)) in enumerate(zip(smiles, results)):
+            if canonical is None:
+                errors.append((row, string, error))
+                continue
+
+            if not deduplicate:
+                position = len(molecules)
+                molecules.append(canonical)
+            elif canonical in positions:
+                position = positions[canonical]
+            else:
+                position = positions[canonical] = len(molecules)
+                molecules.append(canonical)
+
+            index[row] = position
+
+        collection = cls(molecules, SMILESMolecule)
+        collection.canonical = True
+        collection.index = index
+        collection.errors = errors
+
+        return collection
+
+    def __len__(self) -> int:
+        """Return number of molecules in collection."""
+        return len(self.molecules)
+
+    def __getitem__(self, position: int) -> Molecule:
+        """Return molecule at `position`."""
+        return self._build(self.molecules[position])
 
     def __iter__(self):
         for m in self.molecules:
-            yield self.representation(m)
\ No newline at end of file
+            yield self._build(m)
+
+    def _build(self, molecule: str) -> Molecule:
+        """Return molecule instance for molecular string.
+
+        Args:
+            molecule (str): Molecular string.
+
+        Returns:
+            Molecule: Molecule instance.
+        """
+        if self.canonical:
+            return self.representation.from_canonical(molecule)
+        return self.representation(molecule)
+
+
+def __getattr__(name: str) -> Any:
+    """Import `MoleculeGraph`, and with it networkx, on first access."""
+    if name == "MoleculeGraph":
+        from chemcaption.graph import MoleculeGraph
+
+        return MoleculeGraph
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
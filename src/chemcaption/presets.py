@@ -1431,5 +1431,5 @@ SMARTS_MAP: Dict[str, Dict] = dict(
     scaffolds=SCAFFOLDS,
     warheads=WARHEADS,
     organic=ORGANIC,
-    all=ALL_SMARTS,
+    all=dict(names=ALLSMART_NAMES, smarts=ALLSMART_SMARTS),
 )
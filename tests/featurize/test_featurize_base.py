@@ -2,13 +2,39 @@
 
 """Unit tests for chemcaption.featurize.base submodule."""
 
+import numpy as np
+
 from chemcaption.featurize.base import Comparator, MultipleComparator, MultipleFeaturizer
 from chemcaption.featurize.comparator import AtomCountComparator, IsomerismComparator
-from chemcaption.featurize.electronicity import HydrogenAcceptorCountFeaturizer
+from chemcaption.featurize.composition import (
+    ElementCountFeaturizer,
+    MolecularFormulaFeaturizer,
+    MolecularMassFeaturizer,
+)
+from chemcaption.featurize.electronicity import (
+    HydrogenAcceptorCountFeaturizer,
+    HydrogenDonorCountFeaturizer,
+)
+from chemcaption.featurize.execution import (
+    ExecutionBackend,
+    get_default_backend,
+    set_default_backend,
+)
 from chemcaption.featurize.stereochemistry import ChiralCenterCountFeaturizer
-from chemcaption.molecules import SMILESMolecule
-
-__all__ = ["test_multiple_featurizer", "test_multiple_comparator", "test_comparator"]
+from chemcaption.featurize.substructure import TopologyCountFeaturizer
+from chemcaption.molecules import InChIMolecule, SMILESMolecule
+
+__all__ = [
+    "test_multiple_featurizer",
+    "test_fused_multiple_featurizer",
+    "test_execution_backend",
+    "test_cost_based_execution",
+    "test_featurize_into",
+    "test_deduplicate",
+    "test_generate_data",
+    "test_multiple_comparator",
+    "test_comparator",
+]
 
 
 def test_multiple_featurizer():
@@ -36,6 +62,177 @@ def test_multiple_featurizer():
 
     assert len(results) == len(smiles_list)
 
+    featurizer.fused = False
+    assert (featurizer.featurize_many(molecules=smiles_list) == results).all()
+
+
+def test_fused_multiple_featurizer():
+    """Tests the single-pass execution mode of MultipleFeaturizer."""
+    smiles_list = [SMILESMolecule(s) for s in ["CCCC", "O", "c1ccccc1", "CC(=O)O", "N"]]
+    featurizers = [ElementCountFeaturizer(), MolecularFormulaFeaturizer()]
+
+    expected = MultipleFeaturizer(featurizers=featurizers, fused=False).featurize_many(smiles_list)
+
+    featurizer = MultipleFeaturizer(featurizers=featurizers)
+    for mode in ["serial", "process"]:
+        with ExecutionBackend(mode=mode, n_jobs=2, chunksize=2) as backend:
+            featurizer.execution_backend = backend
+            results = featurizer.featurize_many(smiles_list)
+
+            assert results.shape == (len(smiles_list), len(featurizer.feature_labels))
+            assert (results == expected).all()
+
+            blocks = backend.featurize_blocks(featurizer, smiles_list)
+            assert len(blocks) == len(featurizers)
+            assert blocks[0].dtype.kind == "i"
+
+
+def test_generate_data():
+    """Tests typed DataFrame generation in MultipleFeaturizer."""
+    smiles_list = [SMILESMolecule(s) for s in ["CCCC", "O", "c1ccccc1", "CCCC", "N"]]
+
+    featurizer = MultipleFeaturizer(
+        featurizers=[
+            MultipleFeaturizer(featurizers=[ElementCountFeaturizer(preset=["Carbon"])]),
+            MolecularFormulaFeaturizer(),
+        ]
+    )
+    data = featurizer.generate_data(smiles_list, metadata=True)
+
+    assert list(data.columns) == [
+        "representation_system",
+        "representation_string",
+    ] + featurizer.feature_labels
+    assert data["representation_system"].dtype == "category"
+    assert data["num_carbon_atoms"].dtype == np.int8
+    assert data["num_carbon_atoms"].tolist() == [4, 0, 6, 4, 0]
+    assert data["molecular_formula"].tolist() == ["C4H10", "H2O", "C6H6", "C4H10", "H3N"]
+
+    # Nested featurizers contribute one block per lower-level featurizer
+    assert len(featurizer.featurize_blocks(smiles_list)) == 2
+
+
+def test_execution_backend():
+    """Tests the ExecutionBackend."""
+    smiles_list = [SMILESMolecule(s) for s in ["CCCC", "O", "c1ccccc1", "CC(=O)O", "N"]]
+    featurizer = ElementCountFeaturizer()
+
+    expected = ExecutionBackend(mode="serial").featurize_many(featurizer, smiles_list)
+    assert expected.shape == (len(smiles_list), len(featurizer.feature_labels))
+
+    for mode in ["thread", "process"]:
+        with ExecutionBackend(mode=mode, n_jobs=2, chunksize=2) as backend:
+            featurizer.execution_backend = backend
+            assert (featurizer.featurize_many(smiles_list) == expected).all()
+
+            # Pool is reused across calls and featurizers
+            executor = backend._executor
+            backend.featurize_many(HydrogenAcceptorCountFeaturizer(), smiles_list)
+            assert backend._executor is executor
+
+        assert backend._executor is None
+
+    # Chunks landing on workers without the featurizer are retried and kept in input order
+    with ExecutionBackend(mode="process", n_jobs=2, chunksize=1) as backend:
+        molecules = smiles_list * 4
+        assert (backend.featurize_many(featurizer, molecules) == np.tile(expected, (4, 1))).all()
+
+    with ExecutionBackend(mode="process", n_jobs=2) as backend:
+        assert backend.map(len, ["a", "bb", "ccc"]) == [1, 2, 3]
+
+
+def test_cost_based_execution():
+    """Tests that cheap featurizers run in-process and keep their output types."""
+    smiles_list = [SMILESMolecule(s) for s in ["CCCC", "O", "c1ccccc1", "CC(=O)O", "N"]]
+
+    donors = HydrogenDonorCountFeaturizer()
+    assert donors.get_backend().mode == "serial"
+    assert ChiralCenterCountFeaturizer().get_backend() is get_default_backend()
+
+    # Featurizers run in the shared pool unless they declare themselves cheap
+    assert TopologyCountFeaturizer.cost == "moderate"
+    assert TopologyCountFeaturizer([6, 8]).get_backend() is get_default_backend()
+
+    results = donors.featurize_many(smiles_list)
+    assert results.dtype.kind == "i"
+    assert results.flatten().tolist() == [0, 0, 0, 1, 1]
+
+    # Cheap featurizers can be sent to a pool process-wide
+    with ExecutionBackend(mode="thread", n_jobs=2) as backend:
+        previous = set_default_backend(backend, cost="cheap")
+        try:
+            assert donors.get_backend() is backend
+            assert ChiralCenterCountFeaturizer().get_backend() is not backend
+            assert np.array_equal(donors.featurize_many(smiles_list), results)
+        finally:
+            set_default_backend(previous, cost="cheap")
+    assert donors.get_backend() is previous
+
+    mass = MolecularMassFeaturizer()
+    expected = np.concatenate([mass.featurize(molecule) for molecule in smiles_list])
+    assert np.array_equal(mass.featurize_many(smiles_list), expected)
+
+    featurizer = MultipleFeaturizer(featurizers=[donors, mass, MolecularFormulaFeaturizer()])
+    assert featurizer.cost == "cheap"
+    assert featurizer.featurize_many(smiles_list)[:, 2].tolist() == [
+        "C4H10",
+        "H2O",
+        "C6H6",
+        "C2H4O2",
+        "H3N",
+    ]
+
+    featurizer.featurizers.append(ChiralCenterCountFeaturizer())
+    assert featurizer.cost == "moderate"
+
+
+def test_featurize_into():
+    """Tests featurization into caller-provided output rows."""
+    smiles_list = [SMILESMolecule(s) for s in ["CCCC", "O", "c1ccccc1", "CC(=O)O", "N"]]
+    featurizer = MultipleFeaturizer(
+        featurizers=[
+            HydrogenDonorCountFeaturizer(),
+            MultipleFeaturizer([MolecularMassFeaturizer(), ElementCountFeaturizer()]),
+        ]
+    )
+
+    out = np.zeros((len(smiles_list), len(featurizer.feature_labels)))
+    for molecule, row in zip(smiles_list, out):
+        assert featurizer.featurize_into(molecule, row).kind == "f"
+        assert np.array_equal(row, featurizer.featurize(molecule)[0])
+
+    assert np.array_equal(out, featurizer.featurize_many(smiles_list))
+
+    # Integer features are restored from float buffers
+    featurizer = MultipleFeaturizer([HydrogenDonorCountFeaturizer(), ElementCountFeaturizer()])
+    assert featurizer.featurize(smiles_list[0]).dtype.kind == "i"
+    assert all(block.dtype.kind == "i" for block in featurizer.featurize_blocks(smiles_list))
+
+
+def test_deduplicate():
+    """Tests featurization of unique structures with results scattered back to input order."""
+    molecules = [
+        SMILESMolecule("OCC"),
+        InChIMolecule("InChI=1S/C6H6/c1-2-4-6-5-3-1/h1-6H"),
+        SMILESMolecule("CCO"),
+        SMILESMolecule("C1=CC=CC=C1"),
+        SMILESMolecule("N"),
+    ]
+    featurizer = MultipleFeaturizer(
+        featurizers=[ElementCountFeaturizer(preset=["Carbon"]), MolecularFormulaFeaturizer()]
+    )
+
+    expected = featurizer.featurize_many(molecules)
+    assert (featurizer.featurize_many(molecules, deduplicate=True) == expected).all()
+    assert (
+        ElementCountFeaturizer().featurize_many(molecules, deduplicate=True)
+        == ElementCountFeaturizer().featurize_many(molecules)
+    ).all()
+
+    data = featurizer.generate_data(molecules, metadata=True, deduplicate=True)
+    assert data["representation_string"].tolist() == [m.representation_string for m in molecules]
+    assert data["num_carbon_atoms"].tolist() == [2, 6, 2, 6, 0]
+
 
 def test_multiple_comparator():
     """Test the MultipleComparator."""
@@ -190,6 +190,7 @@ def test_dipole_moments_featurizer():
 
     molecule = SMILESMolecule("C1=CC=CC=C1")
 
+    featurizer.prepare([molecule])
     results = featurizer.featurize(molecule)
 
     assert len(results[0]) == len(featurizer.feature_labels)
@@ -203,6 +204,7 @@ def test_bond_order_featurizer():
 
     molecule = SMILESMolecule("C1=CC=CC=C1")
 
+    featurizer.prepare([molecule])
     results = featurizer.featurize(molecule)
 
     assert len(results[0]) == len(featurizer.feature_labels)
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+"""Unit tests for chemcaption.featurize.cache submodule."""
+
+import os
+import pickle
+
+import numpy as np
+from frozendict import frozendict
+
+from chemcaption.featurize.base import MultipleFeaturizer
+from chemcaption.featurize.cache import (
+    DiskCache,
+    ResultCache,
+    cache_key,
+    get_conformer_cache,
+    get_sasa,
+    get_xtb_session,
+    set_conformer_cache,
+    set_result_cache,
+    set_xtb_cache,
+)
+from chemcaption.featurize.composition import MolecularMassFeaturizer
+from chemcaption.featurize.electronicity import HydrogenDonorCountFeaturizer
+from chemcaption.featurize.substructure import FragmentSearchFeaturizer
+from chemcaption.featurize.utils import cached_conformer
+from chemcaption.molecules import SMILESMolecule
+
+__all__ = [
+    "test_disk_cache",
+    "test_disk_cache_eviction",
+    "test_persistent_conformer_cache",
+    "test_xtb_session",
+    "test_sasa",
+    "test_result_cache",
+    "test_featurizer_fingerprint",
+]
+
+
+def test_disk_cache(tmp_path):
+    """Tests storage and retrieval in DiskCache."""
+    path = os.path.join(tmp_path, "cache.sqlite")
+    cache = DiskCache(path)
+
+    key = cache_key("conformer", "CCO", {"b": 1, "a": 2})
+    assert key == cache_key("conformer", "CCO", {"a": 2, "b": 1})
+    assert cache.get(key) is None
+
+    cache.set(key, b"value")
+    assert key in cache
+    assert cache.get(key) == b"value"
+
+    # Stores are shared between instances and survive pickling
+    assert DiskCache(path).get(key) == b"value"
+    assert pickle.loads(pickle.dumps(cache)).get(key) == b"value"
+
+
+def test_disk_cache_eviction(tmp_path):
+    """Tests size-bounded eviction of least recently used entries in DiskCache."""
+    cache = DiskCache(os.path.join(tmp_path, "cache.sqlite"), max_size=2500)
+
+    for ix in range(3):
+        cache.set(str(ix), os.urandom(1000))
+    assert len(cache) == 2
+    assert "0" not in cache
+
+    cache.get("1")
+    cache.set("3", os.urandom(1000))
+    assert "1" in cache and "2" not in cache
+
+    # The running total of stored sizes follows replacements and deletions
+    def sizes(connection):
+        total = connection.execute("SELECT SUM(size) FROM entries").fetchone()[0]
+        return connection.execute("SELECT value FROM meta").fetchone()[0], total
+
+    cache.set("3", os.urandom(10))
+    stored, total = sizes(cache._connect())
+    assert stored == total
+
+    cache.clear()
+    assert sizes(cache._connect()) == (0, None)
+
+
+def test_persistent_conformer_cache(tmp_path):
+    """Tests persistent caching of generated conformers."""
+    cache = DiskCache(os.path.join(tmp_path, "conformers.sqlite"))
+    previous = set_conformer_cache(cache)
+
+    try:
+        assert get_conformer_cache() is cache
+
+        kwargs = frozendict({"num_samples": 50})
+        mol = cached_conformer("CCO", kwargs)
+        assert len(cache) == 1
+
+        cached_conformer.cache_clear()
+        restored = cached_conformer("CCO", kwargs)
+
+        assert restored.GetNumAtoms() == mol.GetNumAtoms()
+        assert restored.GetNumConformers() == mol.GetNumConformers()
+        assert (
+            restored.GetConformer().GetPositions() == mol.GetConformer().GetPositions()
+        ).all()
+    finally:
+        set_conformer_cache(previous)
+        cached_conformer.cache_clear()
+
+
+def test_xtb_session(tmp_path):
+    """Tests sharing of xTB sessions and persistent xTB results."""
+    elements, coordinates = ["O", "H", "H"], np.array([[0, 0, 0], [0.96, 0, 0], [-0.24, 0.93, 0]])
+
+    session = get_xtb_session(elements, coordinates, method="1")
+    assert get_xtb_session(elements, coordinates.copy(), method="1") is session
+    assert get_xtb_session(elements, coordinates + 0.1, method="1") is not session
+    assert get_xtb_session(elements, coordinates, method="2") is not session
+
+    cache = DiskCache(os.path.join(tmp_path, "xtb.sqlite"))
+    previous = set_xtb_cache(cache)
+
+    try:
+        # Results present in the persistent cache are served without running xTB
+        cache.set(cache_key(session.key, "get_homo", (), {}), pickle.dumps(-0.4))
+        assert session.get_homo() == -0.4
+    finally:
+        set_xtb_cache(previous)
+
+
+def test_sasa():
+    """Tests sharing of SASA computations."""
+    elements, coordinates = ["O", "H", "H"], np.array([[0, 0, 0], [0.96, 0, 0], [-0.24, 0.93, 0]])
+
+    sasa = get_sasa(elements, coordinates)
+    assert get_sasa(elements, coordinates.copy()) is sasa
+    assert get_sasa(elements, coordinates, probe_radius=1.0) is not sasa
+
+    assert np.isclose(sasa.area, sum(sasa.atom_areas.values()))
+
+
+def test_result_cache(tmp_path, monkeypatch):
+    """Tests that cached featurizer results are reused across runs and featurizer collections."""
+    molecules = [SMILESMolecule(s) for s in ["CCO", "c1ccccc1", "CC(=O)O"]]
+    disk = DiskCache(os.path.join(tmp_path, "results.sqlite"))
+    cache = ResultCache(disk=disk, min_cost="cheap")
+    previous = set_result_cache(cache)
+
+    try:
+        featurizer = MultipleFeaturizer(featurizers=[MolecularMassFeaturizer()])
+        expected = featurizer.featurize_many(molecules)
+        assert (cache.hits, cache.misses, len(disk)) == (0, 3, 3)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Cached features were recomputed.")
+
+        # Adding a featurizer only computes the new column, also with a fresh in-memory cache
+        set_result_cache(ResultCache(disk=disk, min_cost="cheap"))
+        monkeypatch.setattr(MolecularMassFeaturizer, "_featurize_values", fail)
+
+        featurizer = MultipleFeaturizer(
+            featurizers=[MolecularMassFeaturizer(), HydrogenDonorCountFeaturizer()]
+        )
+        data = featurizer.generate_data(molecules)
+        assert np.allclose(data.iloc[:, 0], expected[:, 0])
+        assert data.iloc[:, 1].tolist() == [1, 0, 1]
+        assert len(disk) == 6
+
+        reversed_features = MolecularMassFeaturizer().featurize_many(molecules[::-1])
+        assert np.allclose(reversed_features, expected[::-1])
+    finally:
+        set_result_cache(previous)
+
+    # Cheap featurizers are skipped by default
+    assert not ResultCache().accepts("cheap")
+    assert ResultCache().accepts("expensive")
+
+
+def test_featurizer_fingerprint():
+    """Tests that featurizer fingerprints follow featurizer configuration."""
+    fingerprint = FragmentSearchFeaturizer(smarts=["[OH]"], names=["alcohol"]).fingerprint()
+    assert fingerprint is not None
+    assert fingerprint == FragmentSearchFeaturizer(smarts=["[OH]"], names=["alcohol"]).fingerprint()
+    assert fingerprint != FragmentSearchFeaturizer(
+        smarts=["[OH]"], names=["alcohol"], count=False
+    ).fingerprint()
+
+    # Configurations without a stable representation are not cached
+    featurizer = MolecularMassFeaturizer()
+    featurizer.template = lambda mass: mass
+    assert featurizer.fingerprint() is None
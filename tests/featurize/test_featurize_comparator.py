@@ -28,6 +28,7 @@ __all__ = [
     "test_lead_likeness_filter_comparator",
     "test_atom_count_comparator",
     "test_drug_likeness_comparator",
+    "test_comparator_groups",
 ]
 
 
@@ -255,3 +256,30 @@ def test_drug_likeness_comparator():
     results = np.unique(featurizer.compare(non_similar))
 
     assert results == 0
+
+
+def test_comparator_groups():
+    """Test for grouping of molecule collections and all-vs-all pairs."""
+    molecules = [
+        SMILESMolecule("C1(Br)=CC=CC=C1Br"),  # 1,2-Dibromobenzene
+        SMILESMolecule("CCO"),  # Ethanol
+        SMILESMolecule("C1=CC(=CC=C1Br)Br"),  # 1,4-Dibromobenzene
+        SMILESMolecule("COC"),  # Dimethyl ether
+        SMILESMolecule("[C-]#[O+]"),  # Carbon II Oxide
+        SMILESMolecule("N#N"),  # Nitrogen molecule
+    ]
+
+    featurizer = IsomerismComparator()
+
+    assert featurizer.group(molecules).tolist() == [0, 1, 0, 1, 2, 3]
+    assert featurizer.pairs(molecules).tolist() == [[0, 2], [1, 3]]
+
+    # Groups agree with comparisons of each group
+    featurizer = IsoelectronicComparator()
+    labels = featurizer.group(molecules)
+    assert labels[4] == labels[5]
+    for label in np.unique(labels):
+        members = [molecules[ix] for ix in np.flatnonzero(labels == label)]
+        assert featurizer.compare(members).item() == 1
+
+    assert featurizer.pairs(molecules[:2]).shape == (0, 2)
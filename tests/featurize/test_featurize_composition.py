@@ -4,6 +4,7 @@
 
 import numpy as np
 
+from chemcaption.featurize.base import PERIODIC_TABLE
 from chemcaption.featurize.composition import (
     AtomCountFeaturizer,
     DegreeOfUnsaturationFeaturizer,
@@ -27,6 +28,7 @@ __all__ = [
     "test_element_count_featurizer",
     "test_atom_count_featurizer",
     "test_degree_of_unsaturation_featurizer",
+    "test_element_featurizers_batch",
 ]
 
 
@@ -217,3 +219,33 @@ def test_degree_of_unsaturation_featurizer():
     )
 
     assert text.to_dict()["filled_completion"] == "Answer: 0.0"
+
+
+def test_element_featurizers_batch():
+    """Tests batch featurization of element featurizers against single-molecule featurization."""
+
+    molecules = [SMILESMolecule(smiles) for smiles in ["O", "CCl", "c1ccccc1N", "[Na+].[Cl-]"]]
+    preset = [PERIODIC_TABLE.GetElementName(i) for i in range(1, 119)] + ["Cl", "Unobtainium"]
+
+    featurizers = [
+        ElementMassFeaturizer(preset=preset),
+        ElementMassProportionFeaturizer(preset=preset),
+        ElementCountFeaturizer(preset=preset),
+        ElementCountProportionFeaturizer(preset=preset),
+        AtomCountFeaturizer(),
+    ]
+
+    for featurizer in featurizers:
+        (results,) = featurizer.featurize_blocks(molecules)
+        assert results.shape == (len(molecules), len(featurizer.feature_labels))
+
+        expected = np.concatenate([featurizer.featurize(molecule) for molecule in molecules])
+        assert np.allclose(results, expected)
+
+    featurizer = ElementCountFeaturizer(preset=preset)
+    results = featurizer.featurize_many(molecules)
+    assert results[1, preset.index("Chlorine")] == results[1, preset.index("Cl")] == 1
+    assert (results[:, -1] == 0).all()
+
+    proportions = ElementMassProportionFeaturizer(preset=preset[:-2]).featurize_many(molecules)
+    assert np.allclose(proportions.sum(axis=1), 1.0)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""Unit tests for chemcaption.featurize.conformers submodule."""
+
+import time
+
+import pytest
+
+from chemcaption.featurize import conformers
+from chemcaption.featurize.conformers import ConformerService
+
+__all__ = [
+    "test_conformer_service",
+    "test_conformer_service_budget",
+]
+
+
+def test_conformer_service():
+    """Tests batched conformer generation and the failure manifest."""
+    service = ConformerService(n_jobs=2, timeout=120)
+    kwargs = {"num_samples": 10}
+
+    batch = service.generate(["CCO", "c1ccccc1", "CCO", "C1CC"], kwargs)
+    assert sorted(batch.conformers) == ["CCO", "c1ccccc1"]
+    assert batch.conformers["CCO"].GetNumConformers() > 0
+
+    assert [failure.smiles for failure in batch.failures] == ["C1CC"]
+    assert batch.failures[0].attempts == 0
+
+    # Results are memoized
+    assert service.get("CCO", kwargs) is batch.conformers["CCO"]
+
+    with pytest.raises(RuntimeError):
+        service.get("C1CC", kwargs)
+
+    with pytest.raises(ValueError):
+        ConformerService(max_attempts=0)
+
+
+def test_conformer_service_budget(monkeypatch):
+    """Tests that hanging attempts are killed and cheaper settings are tried next."""
+    embed = conformers._embed
+
+    def hanging_embed(smiles, kwargs):
+        if not kwargs.get("use_etkdg"):
+            time.sleep(600)
+        return embed(smiles, kwargs)
+
+    monkeypatch.setattr(conformers, "_embed", hanging_embed)
+
+    start = time.monotonic()
+    batch = ConformerService(n_jobs=2, timeout=3).generate(["CCCO", "CCCCO"], {"num_samples": 10})
+    assert time.monotonic() - start < 60
+
+    assert sorted(batch.conformers) == ["CCCCO", "CCCO"]
+    assert not batch.failures
+
+    batch = ConformerService(n_jobs=1, timeout=1, max_attempts=1).generate(["CCCO"])
+    assert not batch.conformers
+    assert batch.failures[0].attempts == 1
+    assert "timed out" in batch.failures[0].reason
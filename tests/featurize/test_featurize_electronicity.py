@@ -91,6 +91,7 @@ def test_atom_electrophilicity_featurizer():
 
     molecule = SMILESMolecule("O=C1C=CC(=O)C=C1C(=O)O")
 
+    featurizer.prepare([molecule])
     results = featurizer.featurize(molecule)
 
     assert len(featurizer.feature_labels) == len(results[0])
@@ -103,6 +104,7 @@ def test_atom_nucleophilicity_featurizer():
 
     molecule = SMILESMolecule("O=C1C=CC(=O)C=C1C(=O)O")
 
+    featurizer.prepare([molecule])
     results = featurizer.featurize(molecule)
 
     assert len(featurizer.feature_labels) == len(results[0])
@@ -115,6 +117,7 @@ def test_atom_charge_featurizer():
 
     molecule = SMILESMolecule("O=C1C=CC(=O)C=C1C(=O)O")
 
+    featurizer.prepare([molecule])
     results = featurizer.featurize(molecule)
 
     assert len(featurizer.feature_labels) == len(results[0])
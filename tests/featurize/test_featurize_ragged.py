@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""Unit tests for chemcaption.featurize.ragged submodule."""
+
+import numpy as np
+
+from chemcaption.featurize.execution import ExecutionBackend
+from chemcaption.featurize.ragged import RaggedFeatures
+from chemcaption.featurize.reaction import SolventAccessibleAtomAreaFeaturizer
+from chemcaption.molecules import SMILESMolecule
+
+__all__ = [
+    "test_ragged_from_rows",
+    "test_ragged_padded_round_trip",
+    "test_ragged_matches_padded_featurizer",
+]
+
+
+def test_ragged_from_rows():
+    """Tests building ragged features from per-molecule rows."""
+    features = RaggedFeatures.from_rows(
+        [
+            (np.array([0.1, 0.2, 0.3]), np.array([8, 1, 1])),
+            (np.array([0.5]), np.array([6])),
+        ]
+    )
+
+    assert len(features) == 2
+    assert features.offsets.tolist() == [0, 3, 4]
+    assert features.lengths.tolist() == [3, 1]
+
+    values, atomic_numbers = features[1]
+    assert values.tolist() == [0.5]
+    assert atomic_numbers.tolist() == [6]
+
+    assert len(RaggedFeatures.from_rows([])) == 0
+
+
+def test_ragged_padded_round_trip():
+    """Tests lossless conversion between ragged and padded layouts."""
+    features = RaggedFeatures.from_rows(
+        [
+            (np.array([0.1, 0.0, 0.3]), np.array([8, 1, 1])),
+            (np.array([0.5]), np.array([6])),
+        ]
+    )
+
+    padded = features.to_padded()
+    assert np.array_equal(
+        padded,
+        np.array([[0.1, 0.0, 0.3, 8, 1, 1], [0.5, 0, 0, 6, 0, 0]]),
+    )
+
+    restored = RaggedFeatures.from_padded(padded)
+    assert np.array_equal(restored.values, features.values)
+    assert np.array_equal(restored.offsets, features.offsets)
+    assert np.array_equal(restored.atomic_numbers, features.atomic_numbers)
+
+    # A fixed width pads further or truncates larger molecules
+    assert features.to_padded(max_index=4).shape == (2, 8)
+    assert np.array_equal(features.to_padded(max_index=1), np.array([[0.1, 8], [0.5, 6]]))
+
+
+def test_ragged_matches_padded_featurizer():
+    """Tests that ragged features of a per-atom featurizer match its padded output."""
+    molecules = [SMILESMolecule(smiles) for smiles in ["CCO", "O=C=O", "O"]]
+    serial = ExecutionBackend(mode="serial")
+
+    for max_index in [None, 4]:
+        featurizer = SolventAccessibleAtomAreaFeaturizer(max_index=max_index)
+        featurizer.execution_backend = serial
+
+        results = featurizer.featurize_many(molecules)
+        ragged = featurizer.featurize_ragged(molecules)
+        assert np.allclose(ragged.to_padded(featurizer.max_index), results)
+
+        # Padded output of the former per-molecule implementation
+        for molecule, row in zip(molecules, results):
+            atom_areas = featurizer._get_morfeus_instance(
+                molecule=molecule, morpheus_instance="sasa"
+            ).atom_areas
+            expected = [
+                (atom_areas[i] if i <= len(atom_areas) else 0)
+                for i in range(1, featurizer.max_index + 1)
+            ] + featurizer._track_atom_identity(molecule=molecule, max_index=featurizer.max_index)
+
+            assert np.allclose(
+                featurizer._pad_atom_features(molecule), np.array(expected).reshape(1, -1)
+            )
+            assert np.allclose(row, expected)
+
+    featurizer = SolventAccessibleAtomAreaFeaturizer(aggregation=["mean", "max"])
+    featurizer.execution_backend = serial
+    values = featurizer.featurize_ragged(molecules).to_padded(9)[:, :9]
+    expected = np.stack([values.mean(axis=1), values.max(axis=1)], axis=1)
+    assert np.allclose(featurizer.featurize_many(molecules), expected)
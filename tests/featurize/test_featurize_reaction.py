@@ -59,6 +59,7 @@ def test_solvent_accessible_atom_area_featurizer():
     featurizer = SolventAccessibleAtomAreaFeaturizer()
     assert isinstance(featurizer.implementors(), list)
 
+    featurizer.prepare([molecule])
     results = featurizer.featurize(molecule)
     assert len(results) > 0
     assert len(results[0]) == len(featurizer.feature_labels)
@@ -67,17 +68,20 @@ def test_solvent_accessible_atom_area_featurizer():
 
     
     featurizer = SolventAccessibleAtomAreaFeaturizer(qc_optimize=True)
+    featurizer.prepare([molecule])
     results = featurizer.featurize(molecule)
     assert len(results) > 0
     assert len(results[0]) == len(featurizer.feature_labels)
 
     featurizer.max_index = None
+    featurizer.prepare([molecule])
     results = featurizer.featurize(molecule)
     assert len(results) > 0
     assert len(results[0]) == len(featurizer.feature_labels)
     
     featurizer = SolventAccessibleAtomAreaFeaturizer(aggregation="mean")
 
+    featurizer.prepare([molecule])
     r = featurizer.featurize(molecule)
     assert len(r) > 0
     assert len(r[0]) == len(featurizer.feature_labels)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""Unit tests for chemcaption.featurize.schema submodule."""
+
+import dataclasses
+import pickle
+
+import pytest
+
+from chemcaption.featurize.base import MultipleFeaturizer
+from chemcaption.featurize.bonds import BondOrderFeaturizer
+from chemcaption.featurize.composition import ElementMassFeaturizer
+from chemcaption.featurize.electronicity import AtomChargeFeaturizer, HydrogenDonorCountFeaturizer
+from chemcaption.featurize.execution import ExecutionBackend
+from chemcaption.featurize.reaction import SolventAccessibleAtomAreaFeaturizer
+from chemcaption.featurize.schema import FeatureSchema
+from chemcaption.molecules import SMILESMolecule
+
+__all__ = [
+    "test_fit_schema",
+    "test_apply_schema",
+    "test_single_molecule_widths",
+]
+
+
+def test_fit_schema():
+    """Tests fitting of FeatureSchema."""
+    molecules = [SMILESMolecule(s) for s in ["O", "CCl", "c1ccccc1"]]
+
+    schema = FeatureSchema.fit(molecules)
+    assert schema == FeatureSchema(
+        max_atoms=12, max_bonds=12, elements=("Hydrogen", "Carbon", "Oxygen", "Chlorine")
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        schema.max_atoms = 1
+
+    with pytest.raises(ValueError):
+        FeatureSchema.fit([])
+
+    featurizer = ElementMassFeaturizer().fit(molecules)
+    assert featurizer.preset == list(schema.elements)
+
+
+def test_apply_schema():
+    """Tests that one schema fixes the output widths of all lower-level featurizers."""
+    molecules = [SMILESMolecule(s) for s in ["O", "CCl", "c1ccccc1"]]
+
+    featurizer = MultipleFeaturizer(
+        featurizers=[
+            AtomChargeFeaturizer(),
+            BondOrderFeaturizer(),
+            AtomChargeFeaturizer(max_index=2),
+            HydrogenDonorCountFeaturizer(),
+        ]
+    )
+    assert featurizer.requires_schema
+
+    featurizer.prepare(molecules)
+    assert not featurizer.requires_schema
+    assert [getattr(f, "max_index", None) for f in featurizer.featurizers] == [12, 12, 2, None]
+    assert len(featurizer.feature_labels) == 2 * 12 + 2 * 12 + 2 * 2 + 1
+
+    # Widths are fixed and shipped along with the featurizer
+    featurizer.prepare(molecules[:1])
+    assert pickle.loads(pickle.dumps(featurizer)).feature_labels == featurizer.feature_labels
+
+
+def test_single_molecule_widths():
+    """Tests that single-molecule calls never fix output widths."""
+    water, ethanol = SMILESMolecule("O"), SMILESMolecule("CCO")
+
+    featurizer = SolventAccessibleAtomAreaFeaturizer()
+    featurizer.execution_backend = ExecutionBackend(mode="serial")
+
+    assert featurizer.featurize(water).shape == (1, 2 * 3)
+    assert featurizer.max_index is None
+
+    # Larger molecules are not truncated to the width of earlier ones
+    assert featurizer.featurize(ethanol).shape == (1, 2 * 9)
+    assert len(featurizer.text_featurize(ethanol).completion_labels) == 2 * 9
+    assert len(featurizer.labeled_featurize(water)) == 2 * 3
+
+    multiple = MultipleFeaturizer(featurizers=[featurizer, HydrogenDonorCountFeaturizer()])
+    assert multiple.featurize(ethanol).shape == (1, 2 * 9 + 1)
+    assert multiple.requires_schema and featurizer.max_index is None
+
+    # Batch featurization fixes the width
+    assert featurizer.featurize_many([water, ethanol]).shape == (2, 2 * 9)
+    assert featurizer.max_index == 9
+    assert featurizer.featurize(water).shape == (1, 2 * 9)
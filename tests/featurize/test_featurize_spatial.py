@@ -3,7 +3,13 @@
 """Unit tests for chemcaption.featurize.spatial submodule."""
 
 import numpy as np
+import pytest
+from rdkit.Chem import Descriptors3D
 
+from chemcaption.featurize import spatial
+from chemcaption.featurize.conformers import ConformerFailure, ConformerService
+from chemcaption.featurize.execution import ExecutionBackend
+from chemcaption.featurize.shape import boltzmann_weights, segment_principal_moments
 from chemcaption.featurize.spatial import (
     AsphericityFeaturizer,
     AtomVolumeFeaturizer,
@@ -24,6 +30,10 @@ __all__ = [
     "test_npr_featurizer",
     "test_radius_of_gyration_featurizer",
     "test_spherocity_index_featurizer",
+    "test_conformer_ensemble",
+    "test_shape_kernel",
+    "test_shape_block_eviction",
+    "test_shape_block_conformers",
 ]
 
 
@@ -35,6 +45,7 @@ def test_atom_volume_featurizer():
 
     molecule = SMILESMolecule("O=C1C=CC(=O)C=C1C(=O)O")
 
+    featurizer.prepare([molecule])
     results = featurizer.featurize(molecule)
 
     assert len(results) > 0
@@ -207,3 +218,141 @@ def test_spherocity_index_featurizer():
         == "Question: What is the spherocity index of the molecule with SMILES O=C1C=CC(=O)C(C(=O)O)=C1?"
     )
     assert text.to_dict()["filled_completion"] == "Answer: 0.0353"
+
+
+def test_conformer_ensemble():
+    """Test aggregation of spatial features over conformer ensembles."""
+    molecule = SMILESMolecule("CC(C)c1ccccc1O")
+    kwargs = {"max_conformers": 1, "num_samples": 10}
+
+    featurizer = PMIFeaturizer(conformer_generation_kwargs=kwargs)
+    conformer_values = np.array(
+        [
+            [
+                Descriptors3D.PMI1(mol, confId=conformer.GetId()),
+                Descriptors3D.PMI2(mol, confId=conformer.GetId()),
+                Descriptors3D.PMI3(mol, confId=conformer.GetId()),
+            ]
+            for mol in [featurizer._get_conformer(molecule.rdkit_mol)]
+            for conformer in mol.GetConformers()
+        ]
+    )
+
+    for aggregation, expected in [
+        ("mean", conformer_values.mean(axis=0)),
+        ("min", conformer_values.min(axis=0)),
+        ("max", conformer_values.max(axis=0)),
+    ]:
+        results = PMIFeaturizer(
+            conformer_generation_kwargs=kwargs, conformer_aggregation=aggregation
+        ).featurize(molecule)
+        assert np.allclose(results, expected.reshape(1, -1))
+
+    for featurizer in [
+        AsphericityFeaturizer(conformer_generation_kwargs=kwargs, conformer_aggregation="max"),
+        SpherocityIndexFeaturizer(conformer_generation_kwargs=kwargs, conformer_aggregation="max"),
+        RadiusOfGyrationFeaturizer(conformer_generation_kwargs=kwargs, conformer_aggregation="max"),
+    ]:
+        default = type(featurizer)(conformer_generation_kwargs=kwargs).featurize(molecule)
+        # The default conformer is part of the ensemble
+        assert featurizer.featurize(molecule)[0][0] >= default[0][0] - 1e-8
+
+    results = NPRFeaturizer(
+        conformer_generation_kwargs=kwargs, conformer_aggregation="boltzmann"
+    ).featurize(molecule)
+    assert results.shape == (1, 2)
+
+    weights = boltzmann_weights(np.array([0.0, 1.0, 10.0]))
+    assert np.isclose(weights.sum(), 1)
+    assert weights[0] > weights[1] > weights[2]
+
+
+def test_shape_kernel():
+    """Test that the shared shape kernel matches RDKit, batched over molecules of different sizes."""
+    molecules = [SMILESMolecule(smiles) for smiles in ["CC(C)c1ccccc1O", "O=C=O", "O", "[Na+]"]]
+    kwargs = {"max_conformers": 1, "num_samples": 5}
+
+    for featurizer, functions in [
+        (EccentricityFeaturizer, [Descriptors3D.Eccentricity]),
+        (AsphericityFeaturizer, [Descriptors3D.Asphericity]),
+        (InertialShapeFactorFeaturizer, [Descriptors3D.InertialShapeFactor]),
+        (NPRFeaturizer, [Descriptors3D.NPR1, Descriptors3D.NPR2]),
+        (PMIFeaturizer, [Descriptors3D.PMI1, Descriptors3D.PMI2, Descriptors3D.PMI3]),
+        (RadiusOfGyrationFeaturizer, [Descriptors3D.RadiusOfGyration]),
+    ]:
+        for use_masses in [True, False]:
+            featurizer_instance = featurizer(
+                conformer_generation_kwargs=kwargs, use_masses=use_masses
+            )
+            results = featurizer_instance.featurize_many(molecules)
+
+            conformers = [featurizer_instance._get_conformer(m.rdkit_mol) for m in molecules]
+            expected = [
+                [function(mol, useAtomicMasses=use_masses) for function in functions]
+                for mol in conformers
+            ]
+            assert np.allclose(results, expected)
+
+    featurizer = SpherocityIndexFeaturizer(conformer_generation_kwargs=kwargs)
+    expected = [
+        [Descriptors3D.SpherocityIndex(featurizer._get_conformer(molecule.rdkit_mol))]
+        for molecule in molecules
+    ]
+    assert np.allclose(featurizer.featurize_many(molecules), expected)
+
+    # Conformers of different sizes are diagonalized together
+    coordinates = np.array([[0, 0, 0], [1, 0, 0], [0, 0, 0], [2, 0, 0], [0, 2, 0]], dtype=float)
+    moments, total_weights = segment_principal_moments(coordinates, np.ones(5), [2, 3])
+    assert np.allclose(moments[0], [0, 0.5, 0.5])
+    assert np.allclose(total_weights, [2, 3])
+
+
+def test_shape_block_eviction(monkeypatch):
+    """Test that batches larger than the shape descriptor memo are featurized in full."""
+    monkeypatch.setattr(spatial, "_SHAPE_BLOCKS", spatial.OrderedDict())
+    monkeypatch.setattr(spatial, "_SHAPE_BLOCK_SIZE", 2)
+
+    molecules = [SMILESMolecule(smiles) for smiles in ["CCO", "O=C=O", "O", "CC"]]
+    featurizer = RadiusOfGyrationFeaturizer(
+        conformer_generation_kwargs={"max_conformers": 1, "num_samples": 5}
+    )
+    featurizer.execution_backend = ExecutionBackend(mode="serial")
+    expected = [
+        [Descriptors3D.RadiusOfGyration(featurizer._get_conformer(molecule.rdkit_mol))]
+        for molecule in molecules
+    ]
+
+    assert np.allclose(featurizer.featurize_many(molecules), expected)
+    assert list(spatial._SHAPE_BLOCKS) == [
+        featurizer._shape_block_key(molecule) for molecule in molecules[2:]
+    ]
+
+
+def test_shape_block_conformers(monkeypatch):
+    """Test that conformers of a batch are requested from the conformer service at once."""
+    calls = []
+
+    class RecordingService(ConformerService):
+        def generate(self, smiles, kwargs=None):
+            calls.append(list(smiles))
+            batch = super().generate(smiles, kwargs)
+            if "CC" in smiles:
+                batch.failures.append(ConformerFailure("CC", 3, "timed out"))
+            return batch
+
+    monkeypatch.setattr(spatial, "_SHAPE_BLOCKS", spatial.OrderedDict())
+    monkeypatch.setattr(spatial, "get_conformer_service", lambda: RecordingService(n_jobs=2))
+
+    molecules = [SMILESMolecule(smiles) for smiles in ["CCO", "O=C=O", "CCO", "O"]]
+    featurizer = AsphericityFeaturizer(
+        conformer_generation_kwargs={"max_conformers": 1, "num_samples": 5}
+    )
+    featurizer.execution_backend = ExecutionBackend(mode="serial")
+
+    assert featurizer.featurize_many(molecules).shape == (4, 1)
+    assert calls == [["CCO", "O=C=O", "O"]]
+
+    # Memoized molecules are not requested again
+    with pytest.raises(RuntimeError, match="'CC' after 3 attempt"):
+        featurizer.featurize_many([SMILESMolecule("CCO"), SMILESMolecule("CC")])
+    assert calls[-1] == ["CC"]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""Unit tests for chemcaption.featurize.streaming submodule."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from chemcaption.featurize.base import MultipleFeaturizer
+from chemcaption.featurize.composition import ElementCountFeaturizer, MolecularFormulaFeaturizer
+from chemcaption.featurize.electronicity import HydrogenAcceptorCountFeaturizer
+from chemcaption.featurize.reaction import SolventAccessibleAtomAreaFeaturizer
+from chemcaption.featurize.schema import FeatureSchema
+from chemcaption.featurize.streaming import iter_data, read_data, update_data, write_data
+from chemcaption.molecules import SMILESMolecule
+
+__all__ = [
+    "test_iter_data",
+    "test_write_data",
+    "test_write_data_resume",
+    "test_write_data_widths",
+    "test_write_data_resume_widths",
+    "test_update_data",
+]
+
+SMILES = ["CCCC", "c1ccccc1", "CC(=O)O", "CCO", "CN1C=NC2=C1C(=O)N(C(=O)N2C)C", "O"]
+
+
+def _featurizer() -> MultipleFeaturizer:
+    """Return featurizer used in tests."""
+    return MultipleFeaturizer(
+        featurizers=[
+            ElementCountFeaturizer(preset=["Carbon", "Oxygen"]),
+            MolecularFormulaFeaturizer(),
+            HydrogenAcceptorCountFeaturizer(),
+        ]
+    )
+
+
+def test_iter_data():
+    """Tests chunked DataFrame generation."""
+    expected = _featurizer().generate_data([SMILESMolecule(s) for s in SMILES], metadata=True)
+
+    chunks = list(iter_data(_featurizer(), iter(SMILES), chunk_size=4, metadata=True))
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+
+    results = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(results, expected)
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "arrow"])
+def test_write_data(tmp_path, file_format):
+    """Tests writing chunks to disk."""
+    if file_format != "csv":
+        pytest.importorskip("pyarrow")
+
+    featurizer = _featurizer()
+    path = write_data(featurizer, SMILES, str(tmp_path), chunk_size=4, file_format=file_format)
+
+    results = read_data(path)
+    expected = featurizer.generate_data([SMILESMolecule(s) for s in SMILES])
+
+    assert list(results.columns) == list(expected.columns)
+    assert results.shape == expected.shape
+    assert results["molecular_formula"].tolist() == expected["molecular_formula"].tolist()
+    assert len([f for f in os.listdir(path) if f.startswith("part-")]) == 2
+
+
+def test_write_data_resume(tmp_path):
+    """Tests resuming from the last completed chunk."""
+    path = str(tmp_path)
+
+    write_data(_featurizer(), SMILES[:4], path, chunk_size=2, file_format="csv")
+    first_part = os.path.join(path, "part-000000.csv")
+    modified = os.path.getmtime(first_part)
+
+    # Completed chunks are skipped, remaining chunks are appended
+    write_data(_featurizer(), SMILES, path, chunk_size=2, file_format="csv")
+    assert os.path.getmtime(first_part) == modified
+    assert len(read_data(path)) == len(SMILES)
+
+    # Settings must match to resume
+    with pytest.raises(ValueError):
+        write_data(_featurizer(), SMILES, path, chunk_size=3, file_format="csv")
+
+    # Start over
+    write_data(_featurizer(), SMILES[:1], path, chunk_size=3, file_format="csv", resume=False)
+    assert len(read_data(path)) == 1
+
+
+def test_write_data_widths(tmp_path):
+    """Tests that later chunks are never truncated to output widths fitted on earlier chunks."""
+    smiles = ["O", "N", "CCO"]
+
+    with pytest.raises(ValueError):
+        write_data(
+            SolventAccessibleAtomAreaFeaturizer(), smiles, str(tmp_path), 2, file_format="csv"
+        )
+
+    # Widths fitted on the whole collection hold every chunk
+    schema = FeatureSchema.fit([SMILESMolecule(s) for s in smiles])
+    path = write_data(
+        SolventAccessibleAtomAreaFeaturizer(),
+        smiles,
+        str(tmp_path),
+        chunk_size=2,
+        file_format="csv",
+        resume=False,
+        schema=schema,
+    )
+    assert read_data(path).shape == (3, 2 * schema.max_atoms)
+
+
+def test_write_data_resume_widths(tmp_path):
+    """Tests that a resumed run keeps the output widths fitted by the original run."""
+    smiles = ["CCO", "O", "N", "C"]
+    interrupted, uninterrupted = str(tmp_path / "interrupted"), str(tmp_path / "uninterrupted")
+
+    write_data(SolventAccessibleAtomAreaFeaturizer(), smiles[:2], interrupted, 2, file_format="csv")
+    write_data(SolventAccessibleAtomAreaFeaturizer(), smiles, interrupted, 2, file_format="csv")
+    write_data(SolventAccessibleAtomAreaFeaturizer(), smiles, uninterrupted, 2, file_format="csv")
+
+    results = read_data(interrupted)
+    assert results.shape == (4, 2 * 9)
+    assert results.equals(read_data(uninterrupted))
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_update_data(tmp_path, monkeypatch, file_format):
+    """Tests adding rows and column blocks to a feature table, computing only missing cells."""
+    if file_format != "csv":
+        pytest.importorskip("pyarrow")
+
+    path = os.path.join(tmp_path, f"features.{file_format}")
+    initial = MultipleFeaturizer(featurizers=[HydrogenAcceptorCountFeaturizer()])
+    update_data(initial, SMILES[:4], path)
+
+    calls = []
+    original = HydrogenAcceptorCountFeaturizer._featurize_values
+    monkeypatch.setattr(
+        HydrogenAcceptorCountFeaturizer,
+        "_featurize_values",
+        lambda self, molecule: calls.append(molecule) or original(self, molecule),
+    )
+
+    # Existing featurizers only run on new molecules
+    featurizer = _featurizer()
+    update_data(featurizer, SMILES[2:], path)
+    assert [molecule.representation_string for molecule in calls] == [
+        SMILESMolecule(s).representation_string for s in SMILES[4:]
+    ]
+
+    results = pd.read_csv(path) if file_format == "csv" else pd.read_parquet(path)
+    expected = featurizer.generate_data([SMILESMolecule(s) for s in SMILES], metadata=True)
+
+    assert list(results.columns) == list(expected.columns)
+    assert results["representation_string"].tolist() == expected["representation_string"].tolist()
+    for column in expected.columns:
+        assert results[column].astype(str).tolist() == expected[column].astype(str).tolist()
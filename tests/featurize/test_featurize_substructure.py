@@ -15,6 +15,8 @@ from chemcaption.molecules import SMILESMolecule
 __all__ = [
     "test_topology_count_featurizer",
     "test_fragment_search_featurizer",
+    "test_fragment_search_featurizer_patterns",
+    "test_fragment_search_featurizer_screening",
     "test_isomorphism_featurizer",
 ]
 
@@ -121,6 +123,52 @@ def test_fragment_search_featurizer():
     except ValueError:
         assert True
 
+    try:
+        featurizer = FragmentSearchFeaturizer(["[#6"], ["broken"])
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_fragment_search_featurizer_patterns():
+    """Tests compilation and reuse of SMARTS patterns in FragmentSearchFeaturizer."""
+    import pickle
+
+    molecule = SMILESMolecule("CC(=O)Oc1ccccc1C(=O)O")
+
+    featurizer = FragmentSearchFeaturizer.from_preset("all")
+    assert len(featurizer.patterns) == len(featurizer.feature_labels)
+
+    # Patterns are compiled once per process and shared across instances
+    other = FragmentSearchFeaturizer.from_preset("all", count=False)
+    assert all(a is b for a, b in zip(featurizer.patterns, other.patterns))
+
+    # Patterns are rebuilt after unpickling
+    clone = pickle.loads(pickle.dumps(featurizer))
+    assert clone._patterns is None
+    assert (clone.featurize(molecule) == featurizer.featurize(molecule)).all()
+
+
+def test_fragment_search_featurizer_screening():
+    """Tests that screening in FragmentSearchFeaturizer does not change results."""
+    import pickle
+
+    smiles = ["CC(=O)Oc1ccccc1C(=O)O", "c1ccc2[nH]ccc2c1", "O=S(=O)(N)c1ccc(Cl)cc1", "[Na+].[Cl-]", "C"]
+
+    for count in (True, False):
+        screened = FragmentSearchFeaturizer.from_preset("all", count=count)
+        unscreened = FragmentSearchFeaturizer.from_preset("all", count=count, screen=False)
+
+        for string in smiles:
+            molecule = SMILESMolecule(string)
+            assert (screened.featurize(molecule) == unscreened.featurize(molecule)).all()
+
+    # Screening data is rebuilt after unpickling
+    clone = pickle.loads(pickle.dumps(screened))
+    assert clone._screens is None
+    assert clone.screen
+    assert (clone.featurize(molecule) == screened.featurize(molecule)).all()
+
 
 def test_isomorphism_featurizer():
     """Tests featurizer IsomorphismFeaturizer."""
@@ -6,10 +6,17 @@ import chemcaption
 
 from chemcaption.featurize.base import AbstractFeaturizer, AbstractComparator
 
-from chemcaption.featurize.registry import init_all_comparators, init_all_featurizers
+from chemcaption.featurize import registry
+from chemcaption.featurize.registry import (
+    featurizer_classes,
+    init_all_comparators,
+    init_all_featurizers,
+)
 
 __all__ = [
     "test_registry",
+    "test_registry_metadata",
+    "test_lazy_registry",
 ]
 
 def test_registry():
@@ -24,3 +31,27 @@ def test_registry():
 
     assert isinstance(comparators, list)
     assert [isinstance(c, AbstractComparator) for c in comparators]
+
+def test_registry_metadata():
+    """Tests filtering of registered featurizers by declared metadata."""
+
+    classes = featurizer_classes("chemcaption.featurize.spatial")
+    assert all(issubclass(c, AbstractFeaturizer) for c in classes)
+    assert "SpatialFeaturizer" not in [c.__name__ for c in classes]
+
+    cheap = featurizer_classes(chemcaption.featurize.electronicity, cost="cheap")
+    assert cheap and all(c.cost == "cheap" for c in cheap)
+
+    rdkit_only = featurizer_classes(chemcaption.featurize.bonds, backends=[])
+    assert rdkit_only and all(not c.backends for c in rdkit_only)
+    assert len(rdkit_only) < len(featurizer_classes(chemcaption.featurize.bonds))
+
+def test_lazy_registry():
+    """Tests that featurizer collections are built on first access."""
+
+    assert "ELECTRONICITY_FEATURIZERS" not in vars(registry)
+
+    featurizers = registry.ELECTRONICITY_FEATURIZERS
+
+    assert all(isinstance(f, AbstractFeaturizer) for f in featurizers)
+    assert registry.ELECTRONICITY_FEATURIZERS is featurizers
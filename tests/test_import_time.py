@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""Import-time budget for chemcaption."""
+
+import importlib
+import json
+import subprocess
+import sys
+
+import chemcaption.featurize
+from chemcaption.featurize import _exports
+
+__all__ = [
+    "test_featurize_exports",
+    "test_lazy_imports",
+    "test_import_time_budget",
+]
+
+# Seconds allowed for importing a cheap featurizer in a fresh interpreter.
+IMPORT_TIME_BUDGET = 2.0
+
+# Heavy dependencies which must not be imported by cheap featurizers.
+DEFERRED_MODULES = ["pandas", "scipy", "pymatgen", "networkx", "selfies", "morfeus"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from chemcaption.featurize import ElementCountFeaturizer
+from chemcaption.molecules import SMILESMolecule
+ElementCountFeaturizer().featurize(SMILESMolecule("CCO"))
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _probe() -> dict:
+    """Import a cheap featurizer in a fresh interpreter and report time and loaded modules."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_featurize_exports():
+    """Tests that lazily exported names match the `__all__` of each submodule."""
+    with open(_exports._TABLE_PATH) as file:
+        table = file.read()
+    assert table == _exports.render_exports(
+        _exports.generate_exports()
+    ), "Export table is out of date. Run `python -m chemcaption.featurize._exports`."
+
+    for module_name, names in chemcaption.featurize._SUBMODULE_EXPORTS.items():
+        module = importlib.import_module(f"chemcaption.featurize.{module_name}")
+        assert list(names) == list(module.__all__)
+
+        for name in names:
+            assert getattr(chemcaption.featurize, name) is getattr(module, name)
+
+
+def test_lazy_imports():
+    """Tests that heavy dependencies are deferred until first use."""
+    modules = set(_probe()["modules"])
+
+    assert not [m for m in DEFERRED_MODULES if m in modules]
+    assert "chemcaption.featurize.spatial" not in modules
+
+
+def test_import_time_budget():
+    """Tests that importing and running a cheap featurizer stays within the import-time budget."""
+    elapsed = min(_probe()["elapsed"] for _ in range(3))
+
+    assert elapsed < IMPORT_TIME_BUDGET, f"Import took {elapsed:.2f}s (budget {IMPORT_TIME_BUDGET}s)"
@@ -64,3 +64,65 @@ def test_molecule_collection():
     for c in collection:
         assert isinstance(c, SMILESMolecule)
 
+
+def test_molecule_collection_from_smiles():
+    """Tests batch parsing of SMILES strings into a MoleculeCollection."""
+
+    from chemcaption.molecules import MoleculeCollection, SMILESMolecule
+
+    smiles = ["OCC", "c1ccccc1", "C1CC", "CCO", "C1=CC=CC=C1", "not a smiles"]
+
+    for n_jobs in [1, 2]:
+        collection = MoleculeCollection.from_smiles(smiles, n_jobs=n_jobs)
+
+        assert collection.molecules == ["CCO", "c1ccccc1"]
+        assert collection.index.tolist() == [0, 1, -1, 0, 1, -1]
+        assert [(row, string) for row, string, _ in collection.errors] == [
+            (2, "C1CC"),
+            (5, "not a smiles"),
+        ]
+
+        molecules = list(collection)
+        assert len(collection) == len(molecules) == 2
+        assert molecules[1].representation_string == SMILESMolecule("C1=CC=CC=C1").representation_string
+        assert molecules[1].rdkit_mol.GetNumAtoms() == 6
+
+    collection = MoleculeCollection.from_smiles(["OCC", "CCO"], deduplicate=False)
+    assert collection.molecules == ["CCO", "CCO"]
+    assert collection.index.tolist() == [0, 1]
+
+
+def test_invalid_smiles():
+    """Tests that invalid SMILES strings are rejected on construction."""
+
+    from chemcaption.molecules import SMILESMolecule
+
+    with pytest.raises(ValueError):
+        SMILESMolecule("C1CC")
+
+
+def test_derived_structure_cache():
+    """Tests caching of structures derived from the rdkit molecule."""
+    import pickle
+
+    from rdkit import Chem
+
+    from chemcaption.molecules import SMILESMolecule
+
+    molecule = SMILESMolecule("CC(=O)O")
+
+    mol = molecule.reveal_hydrogens()
+    assert mol is molecule.reveal_hydrogens()
+    assert molecule.to_graph() is molecule.to_graph()
+    assert molecule.get_atomic_numbers().tolist() == [6, 6, 8, 8, 1, 1, 1, 1]
+    assert molecule.get_atom_symbols(hydrogen=False).tolist() == ["C", "C", "O", "O"]
+    assert molecule.canonical_smiles == "CC(=O)O"
+
+    # Pickled molecules do not carry derived structures
+    assert pickle.loads(pickle.dumps(molecule))._cache == {}
+
+    # Setting the rdkit molecule invalidates derived structures
+    molecule.rdkit_mol = Chem.MolFromSmiles("CO")
+    assert molecule.reveal_hydrogens() is not mol
+    assert molecule.get_atomic_numbers(hydrogen=False).tolist() == [6, 8]
+    assert molecule.canonical_smiles == "CO"